@@ -1,15 +1,61 @@
 """Audio extraction module for extracting audio from video files."""
 
+import collections
+import functools
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
 from typing import Optional
 
-import ffmpeg  # type: ignore[import-untyped]
+import numpy as np
 
 from scripts.exceptions import AudioExtractionError
 
 
+# Sample rate expected by Whisper
+SAMPLE_RATE = 16000
+
+# Common leading ffmpeg arguments: no stdin, only actionable log output,
+# overwrite existing output files.
+_FFMPEG_BASE_ARGS = ["ffmpeg", "-nostdin", "-loglevel", "error", "-y"]
+
+# Output options for Whisper-compatible audio: WAV, 16kHz sample rate, mono
+_WAV_OUTPUT_ARGS = [
+    "-vn",  # Skip video
+    "-acodec", "pcm_s16le",  # PCM 16-bit little-endian (standard WAV)
+    "-ar", str(SAMPLE_RATE),  # Sample rate: 16kHz (optimal for Whisper)
+    "-ac", "1",  # Audio channels: 1 (mono)
+    "-threads", "0",  # Let ffmpeg pick the thread count for decode/resample
+    "-f", "wav",
+]
+
+# Output options when the source audio is already Whisper-ready PCM: remux the
+# stream into a WAV container without decoding or resampling it.
+_WAV_COPY_ARGS = [
+    "-vn",
+    "-map", "0:a:0",
+    "-c:a", "copy",
+    "-f", "wav",
+]
+
+# Output options for raw PCM written to stdout (same format, no WAV header)
+_PCM_PIPE_ARGS = [
+    "-vn",
+    "-acodec", "pcm_s16le",
+    "-ar", str(SAMPLE_RATE),
+    "-ac", "1",
+    "-threads", "0",
+    "-f", "s16le",
+    "pipe:1",
+]
+
+# Maximum number of ffmpeg stderr lines kept for error reporting. Only the
+# tail is retained so memory stays bounded regardless of video length.
+_STDERR_TAIL_LINES = 1024
+
+
 def extract_audio(video_path: str, output_path: Optional[str] = None) -> str:
     """
     Extract audio from a video file.
@@ -32,67 +78,215 @@ def extract_audio(video_path: str, output_path: Optional[str] = None) -> str:
 
     # Determine output path
     if output_path is None:
-        # Create a temporary file with .wav extension
-        fd, output_path = tempfile.mkstemp(suffix=".wav")
-        os.close(fd)
+        output_path = _create_temp_wav()
+
+    # Build the ffmpeg command directly; the conversion is fixed so no
+    # filter graph is needed. If the audio is already in the target format,
+    # copy it instead of re-encoding.
+    output_args = _WAV_COPY_ARGS if _is_whisper_ready(video_path) else _WAV_OUTPUT_ARGS
+    cmd = [*_FFMPEG_BASE_ARGS, "-i", video_path, *output_args, output_path]
+    _run_ffmpeg(cmd, video_path)
+
+    return output_path
+
+
+def extract_audio_to_array(video_path: str) -> np.ndarray:
+    """
+    Extract audio from a video file straight into memory.
+
+    ffmpeg writes raw 16kHz mono PCM to stdout, which is decoded into a
+    float32 array in [-1.0, 1.0). No intermediate WAV file is written, so the
+    audio is never written to and re-read from disk.
+
+    Args:
+        video_path: Path to the input video file
+
+    Returns:
+        1-D float32 NumPy array of samples at SAMPLE_RATE, as accepted by
+        faster-whisper
+
+    Raises:
+        FileNotFoundError: If video file doesn't exist
+        AudioExtractionError: If ffmpeg fails to extract audio
+    """
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Video file not found: {video_path}")
+
+    cmd = [*_FFMPEG_BASE_ARGS, "-i", video_path, *_PCM_PIPE_ARGS]
+    pcm = _run_ffmpeg(cmd, video_path, capture_stdout=True)
+
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def extract_audio_batch(
+    video_paths: list[str],
+    output_paths: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Extract audio from several video files with a single ffmpeg process.
+
+    Each input is mapped to its own WAV output, so process-spawn and codec
+    initialization happen once for the whole batch instead of once per video.
+
+    Args:
+        video_paths: Paths to the input video files
+        output_paths: Optional paths for the output audio files, one per video.
+                      If None, creates a temp .wav file for each video.
+
+    Returns:
+        Paths to the extracted audio files, in the same order as video_paths
+
+    Raises:
+        ValueError: If video_paths is empty or output_paths has a different length
+        FileNotFoundError: If any video file doesn't exist
+        AudioExtractionError: If ffmpeg fails to extract audio
+    """
+    if not video_paths:
+        raise ValueError("Must provide at least one video file")
+    if output_paths is not None and len(output_paths) != len(video_paths):
+        raise ValueError(
+            f"Expected {len(video_paths)} output paths, got {len(output_paths)}"
+        )
+
+    # Validate all inputs before spawning anything
+    for video_path in video_paths:
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
 
+    if output_paths is None:
+        output_paths = [_create_temp_wav() for _ in video_paths]
+
+    cmd = list(_FFMPEG_BASE_ARGS)
+    for video_path in video_paths:
+        cmd.extend(["-i", video_path])
+    for i, output_path in enumerate(output_paths):
+        cmd.extend(["-map", f"{i}:a:0", *_WAV_OUTPUT_ARGS, output_path])
+
+    _run_ffmpeg(cmd, ", ".join(video_paths))
+
+    return output_paths
+
+
+def _is_whisper_ready(video_path: str) -> bool:
+    """
+    Check whether a file's first audio stream is already 16kHz mono pcm_s16le.
+
+    Probes the stream with ffprobe. Any probe failure is treated as "not
+    ready" so the caller falls back to the normal re-encode path, which
+    reports real errors.
+
+    Args:
+        video_path: Path to the input file
+
+    Returns:
+        True if the audio can be stream-copied into the output WAV
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "stream=codec_name,sample_rate,channels",
+                "-of", "default=noprint_wrappers=1",
+                video_path,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+    fields = dict(
+        line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+    )
+    return (
+        fields.get("codec_name") == "pcm_s16le"
+        and fields.get("sample_rate") == str(SAMPLE_RATE)
+        and fields.get("channels") == "1"
+    )
+
+
+def _create_temp_wav() -> str:
+    """Create an empty temporary file with a .wav extension and return its path."""
+    fd, path = tempfile.mkstemp(suffix=".wav")
+    os.close(fd)
+    return path
+
+
+def _run_ffmpeg(cmd: list[str], source: str, capture_stdout: bool = False) -> bytes:
+    """
+    Run an ffmpeg extraction command.
+
+    Args:
+        cmd: Full ffmpeg argv
+        source: Description of the input(s), used in error messages
+        capture_stdout: If True, collect and return ffmpeg's stdout
+
+    Returns:
+        The bytes written to stdout if capture_stdout is True, else b""
+
+    Raises:
+        AudioExtractionError: If ffmpeg is missing or the command fails
+    """
     try:
         # Check if ffmpeg is available
         _check_ffmpeg_available()
 
-        # Build ffmpeg command using ffmpeg-python
-        # Output: WAV format, 16kHz sample rate, mono channel
-        stream = (
-            ffmpeg
-            .input(video_path)
-            .output(
-                output_path,
-                acodec="pcm_s16le",  # PCM 16-bit little-endian (standard WAV)
-                ar=16000,  # Sample rate: 16kHz (optimal for Whisper)
-                ac=1,  # Audio channels: 1 (mono)
-                format="wav",
-            )
-            .overwrite_output()  # Allow overwriting existing files
+        # Drain stderr in a background thread into a bounded buffer instead of
+        # capturing all of it; only the tail is needed if ffmpeg fails. Using a
+        # thread also keeps a full stderr pipe from blocking a stdout reader.
+        stderr_tail: collections.deque[bytes] = collections.deque(
+            maxlen=_STDERR_TAIL_LINES
         )
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        ) as process:
+            drain = threading.Thread(
+                target=stderr_tail.extend, args=(process.stderr,), daemon=True
+            )
+            drain.start()
+            output = b""
+            if capture_stdout:
+                assert process.stdout is not None
+                output = process.stdout.read()
+            drain.join()
+            returncode = process.wait()
 
-        # Run the ffmpeg command
-        stream.run(capture_stdout=True, capture_stderr=True)
+        if returncode != 0:
+            stderr = b"".join(stderr_tail).decode("utf-8", errors="replace")
+            raise AudioExtractionError(
+                f"Failed to extract audio from {source}: {stderr or 'Unknown error'}"
+            )
+
+        return output
 
-    except ffmpeg.Error as e:
-        stderr = e.stderr.decode("utf-8") if e.stderr else "Unknown error"
-        raise AudioExtractionError(
-            f"Failed to extract audio from {video_path}: {stderr}"
-        ) from e
     except Exception as e:
         # Handle other unexpected errors
         if isinstance(e, AudioExtractionError):
             raise
         raise AudioExtractionError(
-            f"Failed to extract audio from {video_path}: {str(e)}"
+            f"Failed to extract audio from {source}: {str(e)}"
         ) from e
 
-    return output_path
-
 
+@functools.lru_cache(maxsize=1)
 def _check_ffmpeg_available() -> None:
     """
     Check if ffmpeg binary is available in the system.
 
+    Only scans PATH (no subprocess), and the result is memoized so repeated
+    extractions skip the check entirely. A failed check is not cached.
+
     Raises:
         AudioExtractionError: If ffmpeg is not found
     """
-    try:
-        subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            check=True,
-        )
-    except FileNotFoundError:
+    if shutil.which("ffmpeg") is None:
         raise AudioExtractionError(
             "ffmpeg is not installed or not found in PATH. "
             "Please install ffmpeg to extract audio from videos."
         )
-    except subprocess.CalledProcessError as e:
-        raise AudioExtractionError(
-            f"ffmpeg check failed: {e.stderr.decode('utf-8') if e.stderr else 'Unknown error'}"
-        )
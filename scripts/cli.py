@@ -1,23 +1,70 @@
 """Command-line interface for the video-to-subtitle pipeline."""
 
 import argparse
+import glob
+import os
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from scripts.edit_pipeline import apply_edl_to_video, edit_video
 from scripts.exceptions import (
     AudioExtractionError,
     EDLValidationError,
     TranscriptionError,
     VideoCuttingError,
 )
-from scripts.llm_client import LLMClientError
-from scripts.pipeline import process_video
+
+# The pipeline modules pull in faster-whisper and the Anthropic SDK, so they
+# are imported inside the subcommand runners. This keeps --help and argument
+# errors fast and lets each subcommand load only what it needs.
 
 
 MODEL_CHOICES = ["tiny", "base", "small", "medium", "large-v2"]
 FORMAT_CHOICES = ["srt", "vtt"]
-SUBCOMMANDS = ["subtitle", "edit", "apply-edl"]
+SUBCOMMANDS = frozenset({"subtitle", "edit", "apply-edl"})
+
+# Tables for the fast-path parser (_fast_parse). These mirror the argparse
+# definitions in the _create_*_parser functions and must be kept in sync.
+# Option kinds: "value" takes the next argument, "store_true" is a flag, and a
+# list of strings is a value restricted to those choices.
+OptionKind = Union[str, List[str]]
+
+_FAST_POSITIONALS: Dict[str, Tuple[str, ...]] = {
+    "subtitle": ("video",),
+    "edit": ("video",),
+    "apply-edl": ("video", "edl"),
+}
+
+_FAST_OPTIONS: Dict[str, Dict[str, Tuple[str, OptionKind]]] = {
+    "subtitle": {
+        "--output": ("output", "value"),
+        "-o": ("output", "value"),
+        "--model": ("model", MODEL_CHOICES),
+        "-m": ("model", MODEL_CHOICES),
+        "--language": ("language", "value"),
+        "-l": ("language", "value"),
+        "--format": ("format", FORMAT_CHOICES),
+        "-f": ("format", FORMAT_CHOICES),
+    },
+    "edit": {
+        "--output": ("output", "value"),
+        "-o": ("output", "value"),
+        "--transcript": ("transcript", "value"),
+        "-t": ("transcript", "value"),
+        "--auto": ("auto", "store_true"),
+        "--ai": ("ai", "store_true"),
+    },
+    "apply-edl": {
+        "--output": ("output", "value"),
+        "-o": ("output", "value"),
+        "--srt": ("srt", "value"),
+    },
+}
+
+_FAST_DEFAULTS: Dict[str, Dict[str, object]] = {
+    "subtitle": {"output": None, "model": "large-v2", "language": "is", "format": "srt"},
+    "edit": {"output": None, "transcript": None, "auto": False, "ai": False},
+    "apply-edl": {"output": None, "srt": None},
+}
 
 
 def _is_subcommand(arg: str) -> bool:
@@ -41,7 +88,7 @@ def _preprocess_args(args: List[str]) -> List[str]:
         return args
 
     # Check if first arg is a help flag
-    if first_arg in ["-h", "--help"]:
+    if first_arg in ("-h", "--help"):
         return args
 
     # Otherwise, it's a video path - prepend 'subtitle' for backward compatibility
@@ -166,22 +213,63 @@ def _create_apply_edl_parser(subparsers: argparse._SubParsersAction) -> None:
     )
 
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+def _fast_parse(args: List[str]) -> Optional[argparse.Namespace]:
     """
-    Parse command-line arguments.
+    Parse the common, well-formed subcommand invocations without argparse.
+
+    Walks the arguments once using the _FAST_* tables. Anything the tables do
+    not cover exactly - help flags, unknown or abbreviated options,
+    --opt=value syntax, invalid choices, missing or extra positionals, values
+    that look like options - returns None so argparse can handle it and
+    produce its usual help or error output.
 
     Args:
-        args: List of arguments to parse. If None, uses sys.argv[1:].
+        args: Preprocessed arguments, starting with the subcommand
 
     Returns:
-        Parsed arguments namespace with command-specific options.
+        Parsed arguments namespace, or None to fall back to argparse.
     """
-    if args is None:
-        args = sys.argv[1:]
-
-    # Preprocess args for backward compatibility
-    args = _preprocess_args(args)
-
+    if not args or args[0] not in _FAST_POSITIONALS:
+        return None
+
+    command = args[0]
+    options = _FAST_OPTIONS[command]
+    positional_names = _FAST_POSITIONALS[command]
+
+    values: Dict[str, object] = dict(_FAST_DEFAULTS[command])
+    positionals: List[str] = []
+
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("-"):
+            option = options.get(arg)
+            if option is None:
+                return None
+            dest, kind = option
+            if kind == "store_true":
+                values[dest] = True
+            else:
+                if i + 1 >= len(args) or args[i + 1].startswith("-"):
+                    return None
+                value = args[i + 1]
+                if isinstance(kind, list) and value not in kind:
+                    return None
+                values[dest] = value
+                i += 1
+        else:
+            positionals.append(arg)
+        i += 1
+
+    if len(positionals) != len(positional_names):
+        return None
+
+    values.update(zip(positional_names, positionals))
+    return argparse.Namespace(command=command, **values)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full argparse parser used for help output and errors."""
     parser = argparse.ArgumentParser(
         prog="python -m scripts",
         description="Video editing and subtitle generation CLI.",
@@ -197,6 +285,33 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     _create_edit_parser(subparsers)
     _create_apply_edl_parser(subparsers)
 
+    return parser
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Well-formed subcommand invocations are handled by a lightweight parser;
+    argparse is only built for help output and error reporting.
+
+    Args:
+        args: List of arguments to parse. If None, uses sys.argv[1:].
+
+    Returns:
+        Parsed arguments namespace with command-specific options.
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    # Preprocess args for backward compatibility
+    args = _preprocess_args(args)
+
+    parsed = _fast_parse(args)
+    if parsed is not None:
+        return parsed
+
+    parser = _build_parser()
     parsed = parser.parse_args(args)
 
     # If no command was specified (empty args), show help
@@ -207,13 +322,39 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parsed
 
 
+def _expand_video_arg(video: str) -> List[str]:
+    """
+    Expand a video argument that may be a glob pattern (e.g. "input/*.mp4").
+
+    Arguments without glob characters, or naming an existing file (such as
+    "clip[1].mp4"), are returned unchanged.
+    """
+    if os.path.exists(video):
+        return [video]
+    if glob.has_magic(video):
+        return sorted(glob.glob(video))
+    return [video]
+
+
 def _run_subtitle(args: argparse.Namespace) -> int:
     """Run the subtitle subcommand."""
-    print(f"Processing video: {args.video}")
+    from scripts.pipeline import process_video
+
+    video_paths = _expand_video_arg(args.video)
+
+    if not video_paths:
+        print(f"Error: No video files match: {args.video}", file=sys.stderr)
+        return 1
+
+    if len(video_paths) > 1:
+        return _run_subtitle_batch(args, video_paths)
+
+    video_path = video_paths[0]
+    print(f"Processing video: {video_path}")
 
     try:
         output_path = process_video(
-            args.video,
+            video_path,
             output_path=args.output,
             model_size=args.model,
             language=args.language,
@@ -239,8 +380,52 @@ def _run_subtitle(args: argparse.Namespace) -> int:
         return 1
 
 
+def _run_subtitle_batch(args: argparse.Namespace, video_paths: List[str]) -> int:
+    """Run the subtitle subcommand over several videos matched by a glob."""
+    from scripts.pipeline import process_videos
+
+    if args.output is not None:
+        print(
+            "Error: --output cannot be used when processing multiple videos",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(f"Processing {len(video_paths)} videos: {', '.join(video_paths)}")
+
+    try:
+        output_paths = process_videos(
+            video_paths,
+            model_size=args.model,
+            language=args.language,
+            subtitle_format=args.format,
+        )
+        for output_path in output_paths:
+            print(f"Subtitles saved to: {output_path}")
+        return 0
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    except AudioExtractionError as e:
+        print(f"Error: Failed to extract audio from video: {e}", file=sys.stderr)
+        return 1
+
+    except TranscriptionError as e:
+        print(f"Error: Failed to transcribe audio: {e}", file=sys.stderr)
+        return 1
+
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 def _run_edit(args: argparse.Namespace) -> int:
     """Run the edit subcommand."""
+    from scripts.edit_pipeline import edit_video
+    from scripts.llm_client import LLMClientError
+
     if args.ai:
         print(f"Analyzing video with AI: {args.video}")
     else:
@@ -297,6 +482,8 @@ def _run_edit(args: argparse.Namespace) -> int:
 
 def _run_apply_edl(args: argparse.Namespace) -> int:
     """Run the apply-edl subcommand."""
+    from scripts.edit_pipeline import apply_edl_to_video
+
     print(f"Applying EDL to video: {args.video}")
 
     try:
@@ -0,0 +1,90 @@
+"""Helpers shared by the on-disk caches under $XDG_CACHE_HOME/ai-video-editor.
+
+Each cache is a directory of JSON entries named <key>.json. Entries are
+written atomically and evicted least recently used first once the
+directory grows past a size budget.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+# Temporary files older than this were left behind by a writer that died
+# before renaming them into place, and are deleted by evict().
+STALE_TEMP_SECONDS = 60 * 60
+
+
+def write_entry(path: Path, data: Any) -> None:
+    """
+    Write data as JSON to path, creating its directory if needed.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent readers never see a partial entry. If writing fails, the
+    temporary file is removed before the error is raised.
+
+    Args:
+        path: Path of the cache entry
+        data: JSON-serializable value to store
+
+    Raises:
+        OSError: If the entry cannot be written
+        TypeError: If data is not JSON-serializable
+        ValueError: If data is not JSON-serializable
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.remove(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def evict(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Delete least recently used entries until the cache fits in max_bytes.
+
+    Entries are ordered by modification time, so readers should refresh it
+    on a hit. Stale temporary files left by failed writers are deleted too.
+
+    Args:
+        cache_dir: Directory holding the cache entries
+        max_bytes: Size budget for the entries, in bytes
+    """
+    stale_before = time.time() - STALE_TEMP_SECONDS
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        try:
+            stat = entry.stat()
+            if entry.name.endswith(".json"):
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+            elif entry.name.endswith(".tmp") and stat.st_mtime < stale_before:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            # Removed by a concurrent writer or eviction
+            pass
+
+    if total <= max_bytes:
+        return
+
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        if total <= max_bytes:
+            break
@@ -11,8 +11,18 @@ from scripts.edit_decision import EditAction, EditSegment
 from scripts.transcription import TranscriptSegment
 
 
+# Pattern to match: [KEEP] 0: reason  OR  [KEEP] 0-5: reason
+# Action is case-insensitive.
+# Also matches negative numbers so we can raise proper errors
+_EDIT_RE = re.compile(
+    r"\[(KEEP|REMOVE)\]\s*(-?\d+)(?:-(-?\d+))?\s*:\s*(.+)", re.IGNORECASE
+)
+
+
 def format_transcript_for_editing(
-    segments: list[TranscriptSegment], context: str | None = None
+    segments: list[TranscriptSegment],
+    context: str | None = None,
+    start_index: int = 0,
 ) -> str:
     """
     Format transcript segments for AI agent review.
@@ -24,6 +34,8 @@ def format_transcript_for_editing(
     Args:
         segments: List of TranscriptSegment objects to format
         context: Optional context string to include at the beginning
+        start_index: Index to number the first segment with, so a chunk of
+            a longer transcript keeps its global segment indices
 
     Returns:
         Formatted string with segment indices, timestamps, and text
@@ -31,17 +43,17 @@ def format_transcript_for_editing(
     if not segments:
         return ""
 
-    lines = []
-
-    if context:
-        lines.append(context)
-        lines.append("")  # Blank line after context
-
-    for i, segment in enumerate(segments):
-        line = f"[{i}] {segment.start}-{segment.end}: {segment.text}"
-        lines.append(line)
+    # A list comprehension beats a generator here: join() materializes its
+    # argument anyway. f-strings measured faster than StringIO or str.format.
+    body = "\n".join(
+        [
+            f"[{i}] {segment.start}-{segment.end}: {segment.text}"
+            for i, segment in enumerate(segments, start=start_index)
+        ]
+    )
 
-    return "\n".join(lines)
+    # Blank line after context
+    return f"{context}\n\n{body}" if context else body
 
 
 def parse_edit_decisions(
@@ -67,11 +79,6 @@ def parse_edit_decisions(
     if not ai_response or not ai_response.strip():
         return []
 
-    # Pattern to match: [KEEP] 0: reason  OR  [KEEP] 0-5: reason
-    # Action can be uppercase or lowercase
-    # Also matches negative numbers so we can raise proper errors
-    pattern = r"\[([Kk][Ee][Ee][Pp]|[Rr][Ee][Mm][Oo][Vv][Ee])\]\s*(-?\d+)(?:-(-?\d+))?\s*:\s*(.+)"
-
     result = []
     lines = ai_response.strip().split("\n")
 
@@ -80,7 +87,7 @@ def parse_edit_decisions(
         if not line:
             continue
 
-        match = re.match(pattern, line)
+        match = _EDIT_RE.match(line)
         if match:
             action_str = match.group(1).upper()
             start_index = int(match.group(2))
@@ -145,37 +152,55 @@ def merge_adjacent_segments(segments: list[EditSegment]) -> list[EditSegment]:
     if not segments:
         return []
 
-    result = []
-    current = EditSegment(
-        start=segments[0].start,
-        end=segments[0].end,
-        action=segments[0].action,
-        reason=segments[0].reason,
-        transcript_indices=list(segments[0].transcript_indices),
-    )
+    result: list[EditSegment] = []
+
+    # Accumulate the current run in locals and only build an EditSegment when
+    # the action changes. Index lists are shared with the input segments (see
+    # EditSegment) and only copied once a run actually merges, after which
+    # indices are collected with extend() so long runs stay linear.
+    first = segments[0]
+    cur_start = first.start
+    cur_end = first.end
+    cur_action = first.action
+    cur_reason = first.reason
+    cur_indices = first.transcript_indices
+    cur_owned = False  # Whether cur_indices is our own copy
 
     for segment in segments[1:]:
-        if segment.action == current.action:
-            # Merge: extend end time and add indices
-            current = EditSegment(
-                start=current.start,
-                end=segment.end,
-                action=current.action,
-                reason=current.reason,  # Keep first reason
-                transcript_indices=current.transcript_indices + list(segment.transcript_indices),
-            )
+        if segment.action == cur_action:
+            # Merge: extend end time and add indices (keep first reason)
+            cur_end = segment.end
+            if not cur_owned:
+                cur_indices = list(cur_indices)
+                cur_owned = True
+            cur_indices.extend(segment.transcript_indices)
         else:
             # Different action: save current and start new
-            result.append(current)
-            current = EditSegment(
-                start=segment.start,
-                end=segment.end,
-                action=segment.action,
-                reason=segment.reason,
-                transcript_indices=list(segment.transcript_indices),
+            result.append(
+                EditSegment(
+                    start=cur_start,
+                    end=cur_end,
+                    action=cur_action,
+                    reason=cur_reason,
+                    transcript_indices=cur_indices,
+                )
             )
+            cur_start = segment.start
+            cur_end = segment.end
+            cur_action = segment.action
+            cur_reason = segment.reason
+            cur_indices = segment.transcript_indices
+            cur_owned = False
 
     # Don't forget the last segment
-    result.append(current)
+    result.append(
+        EditSegment(
+            start=cur_start,
+            end=cur_end,
+            action=cur_action,
+            reason=cur_reason,
+            transcript_indices=cur_indices,
+        )
+    )
 
     return result
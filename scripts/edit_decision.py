@@ -5,9 +5,18 @@ in a video editing workflow. An Edit Decision List (EDL) defines which segments
 of a video should be kept or removed.
 """
 
+import functools
 import json
+import os
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Dict
+
+try:
+    # Optional: several times faster than the stdlib json module on large EDLs
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 
 class EditAction(Enum):
@@ -17,11 +26,21 @@ class EditAction(Enum):
     REMOVE = "remove"
 
 
-@dataclass
+# Lookup from serialized action value to EditAction, used when loading EDLs.
+# A plain dict lookup is cheaper than calling EditAction(value) per segment.
+_ACTION_MAP = {action.value: action for action in EditAction}
+
+
+@dataclass(slots=True)
 class EditSegment:
     """A single segment with an edit decision.
 
     Represents a portion of video that should either be kept or removed.
+    Uses __slots__ since an EDL holds one of these per transcript segment.
+
+    transcript_indices lists may be shared between segments and EDLs (e.g.
+    by apply_edl_corrections and merge_adjacent_segments) instead of being
+    copied, so they must not be modified in place.
     """
 
     start: float  # Start time in seconds
@@ -36,43 +55,41 @@ class EditDecisionList:
     """A complete edit decision list for a video.
 
     Contains all edit segments and metadata about the source video.
+
+    An EDL is treated as immutable once constructed: the derived segment
+    lists and durations are computed on first access and cached, so the
+    segments must not be modified afterwards. Use apply_edl_corrections()
+    to produce a changed copy.
     """
 
     source_video: str  # Path or identifier for the source video
     segments: list[EditSegment]  # List of edit segments
     total_duration: float  # Total duration of the source video in seconds
 
-    @property
+    @functools.cached_property
     def keep_segments(self) -> list[EditSegment]:
         """Return only segments marked as KEEP."""
         return [s for s in self.segments if s.action == EditAction.KEEP]
 
-    @property
+    @functools.cached_property
     def remove_segments(self) -> list[EditSegment]:
         """Return only segments marked as REMOVE."""
         return [s for s in self.segments if s.action == EditAction.REMOVE]
 
-    @property
+    @functools.cached_property
     def kept_duration(self) -> float:
         """Calculate total duration of kept segments."""
         return sum(s.end - s.start for s in self.keep_segments)
 
-    @property
+    @functools.cached_property
     def removed_duration(self) -> float:
         """Calculate total duration of removed segments."""
         return sum(s.end - s.start for s in self.remove_segments)
 
 
-def edl_to_json(edl: EditDecisionList) -> str:
-    """Serialize an EditDecisionList to JSON string.
-
-    Args:
-        edl: The EditDecisionList to serialize
-
-    Returns:
-        JSON string representation of the EDL
-    """
-    data = {
+def _edl_to_dict(edl: EditDecisionList) -> Dict[str, Any]:
+    """Build the JSON-serializable dictionary form of an EditDecisionList."""
+    return {
         "source_video": edl.source_video,
         "total_duration": edl.total_duration,
         "segments": [
@@ -86,10 +103,52 @@ def edl_to_json(edl: EditDecisionList) -> str:
             for segment in edl.segments
         ],
     }
-    return json.dumps(data, indent=2)
 
 
-def edl_from_dict(data: dict) -> EditDecisionList:
+def edl_to_json(edl: EditDecisionList) -> str:
+    """Serialize an EditDecisionList to JSON string.
+
+    Note: For writing to a file, prefer edl_to_file() which streams the JSON
+    to the file handle without building the whole string first.
+
+    Uses orjson when it is installed, otherwise the stdlib json module. Both
+    write non-ASCII text as UTF-8 and parse back to the same EDL, but the
+    exact text can differ between them (e.g. floats: 1e+20 vs 1e20).
+
+    Args:
+        edl: The EditDecisionList to serialize
+
+    Returns:
+        JSON string representation of the EDL
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(_edl_to_dict(edl), option=orjson.OPT_INDENT_2)
+        return encoded.decode("utf-8")
+    return json.dumps(_edl_to_dict(edl), indent=2, ensure_ascii=False)
+
+
+def edl_to_file(edl: EditDecisionList, path: str) -> None:
+    """Serialize an EditDecisionList to a JSON file.
+
+    Writes the same JSON as edl_to_json() with the same backend. With
+    orjson installed the encoded bytes are written directly; otherwise
+    json.dump writes encoded chunks straight to the file handle, so the
+    full JSON string is never held in memory.
+
+    Args:
+        edl: The EditDecisionList to serialize
+        path: Path of the JSON file to write
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(_edl_to_dict(edl), option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_edl_to_dict(edl), f, indent=2, ensure_ascii=False)
+
+
+def edl_from_dict(data: Dict[str, Any]) -> EditDecisionList:
     """Deserialize an EditDecisionList from a dictionary.
 
     This is the memory-efficient entry point when loading from a file,
@@ -102,13 +161,13 @@ def edl_from_dict(data: dict) -> EditDecisionList:
         EditDecisionList object
 
     Raises:
-        KeyError: If required fields are missing
+        KeyError: If required fields are missing or an action is unknown
     """
     segments = [
         EditSegment(
             start=seg["start"],
             end=seg["end"],
-            action=EditAction(seg["action"]),
+            action=_ACTION_MAP[seg["action"]],
             reason=seg["reason"],
             transcript_indices=seg["transcript_indices"],
         )
@@ -138,10 +197,46 @@ def edl_from_json(json_str: str) -> EditDecisionList:
         json.JSONDecodeError: If JSON is invalid
         KeyError: If required fields are missing
     """
-    data = json.loads(json_str)
+    data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
     return edl_from_dict(data)
 
 
+def load_edl(path: str) -> EditDecisionList:
+    """Load an EditDecisionList from a JSON file, reusing earlier parses.
+
+    Parsed EDLs are memoized on (path, modification time, size), so loading
+    the same unchanged file again in one process skips reading and parsing
+    it. Editing the file invalidates the entry. The returned EDL may be
+    shared between callers and must not be modified.
+
+    Args:
+        path: Path to the EDL JSON file
+
+    Returns:
+        EditDecisionList object
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+        KeyError: If required fields are missing
+    """
+    stat = os.stat(path)
+    return _load_edl_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_edl_file(path: str, mtime_ns: int, size: int) -> EditDecisionList:
+    """Parse an EDL file. mtime_ns and size only serve as cache-key parts."""
+    if orjson is not None:
+        # orjson parses the raw UTF-8 bytes, skipping the text decode
+        with open(path, "rb") as f:
+            return edl_from_dict(orjson.loads(f.read()))
+
+    # Use json.load directly on file handle for memory efficiency
+    with open(path, "r", encoding="utf-8") as f:
+        return edl_from_dict(json.load(f))
+
+
 def format_edl_for_review(edl: EditDecisionList) -> str:
     """Format an EditDecisionList for human review.
 
@@ -184,6 +279,8 @@ def apply_edl_corrections(
 
     Creates a new EditDecisionList with the specified action corrections applied.
     This follows an immutable pattern - the original EDL is not modified.
+    Segments without a correction are shared with the original EDL rather
+    than copied.
 
     Args:
         edl: Original EditDecisionList
@@ -195,28 +292,28 @@ def apply_edl_corrections(
     Raises:
         KeyError: If any correction index is invalid (out of range or negative)
     """
-    # Validate all indices first
-    for index in corrections:
-        if index < 0 or index >= len(edl.segments):
-            raise KeyError(f"Invalid segment index: {index}")
-
-    # Create new segments with corrections applied
+    # Validate all indices first - only the extremes can be out of range
+    if corrections:
+        lowest = min(corrections)
+        if lowest < 0:
+            raise KeyError(f"Invalid segment index: {lowest}")
+        highest = max(corrections)
+        if highest >= len(edl.segments):
+            raise KeyError(f"Invalid segment index: {highest}")
+
+    # Only corrected segments get a new EditSegment; the rest are shared with
+    # the original EDL, as are the (unchanged) transcript_indices lists.
     new_segments = []
     for i, segment in enumerate(edl.segments):
         if i in corrections:
-            action = corrections[i]
-        else:
-            action = segment.action
-
-        new_segments.append(
-            EditSegment(
+            segment = EditSegment(
                 start=segment.start,
                 end=segment.end,
-                action=action,
+                action=corrections[i],
                 reason=segment.reason,
-                transcript_indices=list(segment.transcript_indices),
+                transcript_indices=segment.transcript_indices,
             )
-        )
+        new_segments.append(segment)
 
     return EditDecisionList(
         source_video=edl.source_video,
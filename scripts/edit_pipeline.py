@@ -8,27 +8,104 @@ This module provides functions for the complete video editing pipeline:
 5. Applying EDLs to cut videos
 """
 
+import functools
+import itertools
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Iterable, Optional
 
-import json
+import numpy as np
 
 from scripts.edit_decision import (
     EditAction,
     EditDecisionList,
     EditSegment,
-    edl_from_dict,
-    edl_to_json,
+    edl_to_file,
+    load_edl,
+)
+from scripts.edit_analyzer import format_transcript_for_editing
+from scripts.llm_client import (
+    LLMClientError,
+    analyze_transcript,
+    analyze_transcript_chunks,
+    load_agent_prompt,
 )
-from scripts.llm_client import LLMClientError, analyze_transcript, load_agent_prompt
 from scripts.pipeline import derive_output_path, process_video
 from scripts.transcription import TranscriptSegment
 from scripts.video_cutter import adjust_srt_for_edl, cut_video, get_video_duration
 
 
+# Length of an SRT timestamp: HH:MM:SS,mmm
+_TIMESTAMP_LEN = 12
+
+# AI edit decision line: [KEEP] 0: reason  OR  [KEEP] 0-5: reason
+# Also supports [REVIEW] which we treat as KEEP. Anchored per line and
+# scanned with finditer over the whole response; [^\S\n] is whitespace that
+# never crosses a line break, and the reason must end in a non-space.
+_AI_LINE_RE = re.compile(
+    r"^[^\S\n]*\[(KEEP|REMOVE|REVIEW)\][^\S\n]*(-?\d+)(?:-(-?\d+))?"
+    r"[^\S\n]*:[^\S\n]*(.*\S)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Transcripts longer than this many segments are split into chunks of this
+# size and analyzed concurrently, which also keeps each response well under
+# the API's output token limit
+_AI_CHUNK_SEGMENTS = 500
+
+# Segments of context sent on each side of a chunk, so retakes and false
+# starts that cross a chunk boundary are still visible to the model
+_AI_CHUNK_OVERLAP = 30
+
+# Canonical SRT timestamp line, as written by subtitle_writer and most tools,
+# after mapping every ASCII digit to "d". Lines of exactly this shape take a
+# fast path in _iter_srt_segments.
+_DIGIT_TO_D = str.maketrans("0123456789", "d" * 10)
+_CANONICAL_TIMESTAMP_LINE = "dd:dd:dd,ddd --> dd:dd:dd,ddd"
+
+
+# Transcripts generated by process_video during this process, keyed on the
+# video's (absolute path, modification time, size)
+_generated_transcripts: dict[tuple[str, int, int], str] = {}
+
+
+def _video_cache_key(video_path: str) -> tuple[str, int, int]:
+    """Return (absolute path, mtime_ns, size) identifying a video's contents."""
+    stat = os.stat(video_path)
+    return os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_video_duration(path: str, mtime_ns: int, size: int) -> float:
+    """Probe a video's duration. mtime_ns and size only serve as cache-key parts."""
+    return get_video_duration(path)
+
+
+def _generate_transcript(video_path: str, key: tuple[str, int, int]) -> str:
+    """
+    Run the subtitle pipeline for a video, reusing an earlier result.
+
+    A transcript generated earlier in this process is reused as long as the
+    video is unchanged (same cache key) and the SRT file still exists.
+
+    Args:
+        video_path: Path to the video file
+        key: Cache key from _video_cache_key
+
+    Returns:
+        Path to the generated SRT file
+    """
+    srt_path = _generated_transcripts.get(key)
+    if srt_path is None or not os.path.exists(srt_path):
+        srt_path = process_video(video_path)
+        _generated_transcripts[key] = srt_path
+    return srt_path
+
+
 def _find_or_generate_srt(video_path: str) -> str:
     """
     Find an existing SRT file for a video or generate one.
@@ -62,73 +139,82 @@ def _find_or_generate_srt(video_path: str) -> str:
     return process_video(video_path)
 
 
-def format_transcript_for_editing(
-    segments: list[TranscriptSegment], context: str | None = None
-) -> str:
+def _parse_srt_timestamp(timestamp: str) -> float:
     """
-    Format transcript segments for AI agent review.
-
-    Produces output in the format:
-        [0] 0.0-2.0: Hello everyone
-        [1] 2.0-5.0: Let me try again
+    Parse an SRT timestamp string to seconds.
 
     Args:
-        segments: List of TranscriptSegment objects to format
-        context: Optional context string to include at the beginning
+        timestamp: Timestamp in format HH:MM:SS,mmm (e.g., "00:01:05,500")
 
     Returns:
-        Formatted string with segment indices, timestamps, and text
+        Time in seconds as a float
+
+    Raises:
+        ValueError: If timestamp format is invalid
     """
-    if not segments:
-        return ""
+    t = timestamp.strip()
+    if not _is_srt_timestamp(t):
+        raise ValueError(f"Invalid SRT timestamp format: {timestamp}")
 
-    lines = []
+    # Fixed-width fields, so slice them out directly instead of using a regex
+    hours = int(t[0:2])
+    minutes = int(t[3:5])
+    seconds = int(t[6:8])
+    milliseconds = int(t[9:12])
 
-    if context:
-        lines.append(context)
-        lines.append("")  # Blank line after context
+    total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
+    return total_seconds
 
-    for i, segment in enumerate(segments):
-        line = f"[{i}] {segment.start}-{segment.end}: {segment.text}"
-        lines.append(line)
 
-    return "\n".join(lines)
+def _is_srt_timestamp(t: str) -> bool:
+    """Check whether t starts with an HH:MM:SS,mmm timestamp."""
+    return (
+        len(t) >= _TIMESTAMP_LEN
+        and t[2] == ":"
+        and t[5] == ":"
+        and t[8] == ","
+        and t[0:2].isdecimal()
+        and t[3:5].isdecimal()
+        and t[6:8].isdecimal()
+        and t[9:12].isdecimal()
+    )
 
 
-def _parse_srt_timestamp(timestamp: str) -> float:
+def _split_timestamp_line(line: str) -> Optional[tuple[str, str]]:
     """
-    Parse an SRT timestamp string to seconds.
+    Split an SRT timestamp line into its start and end timestamps.
 
     Args:
-        timestamp: Timestamp in format HH:MM:SS,mmm (e.g., "00:01:05,500")
+        line: Stripped line, expected as "HH:MM:SS,mmm --> HH:MM:SS,mmm"
 
     Returns:
-        Time in seconds as a float
-
-    Raises:
-        ValueError: If timestamp format is invalid
+        (start, end) timestamp strings, or None if the line is not a
+        timestamp line
     """
-    # SRT format: HH:MM:SS,mmm
-    pattern = r"(\d{2}):(\d{2}):(\d{2}),(\d{3})"
-    match = re.match(pattern, timestamp.strip())
-    if not match:
-        raise ValueError(f"Invalid SRT timestamp format: {timestamp}")
+    arrow = line.find("-->")
+    if arrow == -1:
+        return None
 
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-    seconds = int(match.group(3))
-    milliseconds = int(match.group(4))
-
-    total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-    return total_seconds
+    start = line[:arrow].rstrip()
+    end = line[arrow + 3:].lstrip()[:_TIMESTAMP_LEN]
+    if len(start) != _TIMESTAMP_LEN or not _is_srt_timestamp(start):
+        return None
+    if not _is_srt_timestamp(end):
+        return None
+    return start, end
 
 
 def _iter_srt_segments(transcript_path: str) -> "Generator[TranscriptSegment, None, None]":
     """
-    Stream-parse an SRT file, yielding TranscriptSegment objects one at a time.
+    Parse an SRT file, yielding TranscriptSegment objects one at a time.
 
-    This is memory-efficient as it reads the file line-by-line instead of
-    loading the entire file into memory.
+    Well-formed files are split into blank-line separated blocks with
+    str.split, so each block costs a couple of C-level splits instead of a
+    Python branch per line. Timestamp lines in the canonical
+    "HH:MM:SS,mmm --> HH:MM:SS,mmm" shape are collected and decoded together
+    with NumPy. At the first block that does not fit the number/timestamp/text
+    layout, the rest of the file is handed to the line-by-line parser, which
+    tolerates malformed input.
 
     Args:
         transcript_path: Path to the SRT file
@@ -142,6 +228,141 @@ def _iter_srt_segments(transcript_path: str) -> "Generator[TranscriptSegment, No
     if not os.path.exists(transcript_path):
         raise FileNotFoundError(f"Transcript file not found: {transcript_path}")
 
+    content = _read_srt_text(transcript_path)
+
+    texts: list[str] = []
+    # Per segment: (start, end), or None if its timestamp line is canonical
+    # and decoded in bulk from canonical_lines
+    spans: list[Optional[tuple[float, float]]] = []
+    canonical_lines: list[str] = []
+    rest: Optional[list[str]] = None
+
+    blocks = content.split("\n\n")
+    for block_index, block in enumerate(blocks):
+        lines = block.split("\n")
+
+        # Surrounding blank lines carry no data (the line parser skips them too)
+        first = 0
+        last = len(lines)
+        while first < last and not lines[first].strip():
+            first += 1
+        while last > first and not lines[last - 1].strip():
+            last -= 1
+        if first == last:
+            continue
+
+        text = None
+        if last - first == 3:
+            # Single text line (the common case): no slice or join needed
+            text = lines[first + 2]
+        elif last - first > 3:
+            text_lines = lines[first + 2:last]
+            if all(line.strip() for line in text_lines):
+                text = "\n".join(text_lines)
+
+        if text is None or not lines[first].strip().isdigit():
+            rest = blocks[block_index:]
+            break
+
+        line = lines[first + 1]
+        if (
+            len(line) == len(_CANONICAL_TIMESTAMP_LINE)
+            and line.translate(_DIGIT_TO_D) == _CANONICAL_TIMESTAMP_LINE
+        ):
+            canonical_lines.append(line)
+            spans.append(None)
+        else:
+            timestamps = _split_timestamp_line(line.strip())
+            if timestamps is None:
+                rest = blocks[block_index:]
+                break
+            spans.append(
+                (_parse_srt_timestamp(timestamps[0]), _parse_srt_timestamp(timestamps[1]))
+            )
+        texts.append(text)
+
+    canonical_spans = iter(_parse_canonical_timestamp_lines(canonical_lines))
+    for text, span in zip(texts, spans):
+        start, end = span if span is not None else next(canonical_spans)
+        yield TranscriptSegment(start=start, end=end, text=text)
+
+    if rest is not None:
+        yield from _iter_srt_lines("\n\n".join(rest).split("\n"))
+
+
+def _parse_canonical_timestamp_lines(lines: list[str]) -> list[tuple[float, float]]:
+    """
+    Decode canonical SRT timestamp lines to (start, end) seconds in bulk.
+
+    Args:
+        lines: Lines already checked to match _CANONICAL_TIMESTAMP_LINE
+
+    Returns:
+        (start, end) pairs, equal to what _parse_srt_timestamp returns
+    """
+    if not lines:
+        return []
+
+    width = len(_CANONICAL_TIMESTAMP_LINE)
+    digits = (
+        np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        .reshape(len(lines), width)
+        .astype(np.int64)
+        - ord("0")
+    )
+    starts = _timestamp_digits_to_seconds(digits[:, :_TIMESTAMP_LEN])
+    ends = _timestamp_digits_to_seconds(digits[:, width - _TIMESTAMP_LEN:])
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _timestamp_digits_to_seconds(d: np.ndarray) -> np.ndarray:
+    """Convert rows of HH:MM:SS,mmm digit values to seconds."""
+    # Same operation order as _parse_srt_timestamp, so results are identical
+    whole = (d[:, 0] * 10 + d[:, 1]) * 3600 + (d[:, 3] * 10 + d[:, 4]) * 60 + (
+        d[:, 6] * 10 + d[:, 7]
+    )
+    milliseconds = d[:, 9] * 100 + d[:, 10] * 10 + d[:, 11]
+    seconds: np.ndarray = whole + milliseconds / 1000.0
+    return seconds
+
+
+def _read_srt_text(transcript_path: str) -> str:
+    """
+    Read an SRT file into a string with "\n" line endings.
+
+    The file is memory-mapped and decoded in one call, which skips the
+    buffered text I/O layer. A leading UTF-8 BOM is dropped so it does not
+    hide the first subtitle number.
+
+    Args:
+        transcript_path: Path to the SRT file
+
+    Returns:
+        Decoded file content
+    """
+    with open(transcript_path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8-sig")
+
+    # Match the universal-newline translation of text-mode reads
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _iter_srt_lines(lines: Iterable[str]) -> "Generator[TranscriptSegment, None, None]":
+    """
+    Parse SRT lines with a state machine, skipping malformed blocks.
+
+    Args:
+        lines: SRT lines, with or without trailing newlines
+
+    Yields:
+        TranscriptSegment objects as they are parsed
+    """
     # State for parsing SRT blocks
     # States: 'number', 'timestamp', 'text', 'blank'
     state = "number"
@@ -149,64 +370,60 @@ def _iter_srt_segments(transcript_path: str) -> "Generator[TranscriptSegment, No
     current_end: float = 0.0
     text_lines: list[str] = []
 
-    with open(transcript_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.rstrip("\n\r")
-
-            if state == "number":
-                # Expecting subtitle number (skip it)
-                if line.strip().isdigit():
-                    state = "timestamp"
-                elif line.strip() == "":
-                    # Extra blank line, stay in number state
-                    pass
-                # else: malformed, try next line
-
-            elif state == "timestamp":
-                # Expecting timestamp line
-                timestamp_match = re.match(
-                    r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})",
-                    line.strip(),
-                )
-                if timestamp_match:
-                    current_start = _parse_srt_timestamp(timestamp_match.group(1))
-                    current_end = _parse_srt_timestamp(timestamp_match.group(2))
-                    text_lines = []
-                    state = "text"
-                else:
-                    # Malformed, reset to looking for number
-                    state = "number"
-
-            elif state == "text":
-                if line.strip() == "":
-                    # Blank line signals end of this subtitle block
-                    if text_lines:
-                        yield TranscriptSegment(
-                            start=current_start,
-                            end=current_end,
-                            text="\n".join(text_lines),
-                        )
-                    state = "number"
-                else:
-                    # Accumulate text lines
-                    text_lines.append(line)
-
-        # Handle last segment if file doesn't end with blank line
-        if state == "text" and text_lines:
-            yield TranscriptSegment(
-                start=current_start,
-                end=current_end,
-                text="\n".join(text_lines),
-            )
+    for line in lines:
+        line = line.rstrip("\n\r")
+
+        if state == "number":
+            # Expecting subtitle number (skip it)
+            if line.strip().isdigit():
+                state = "timestamp"
+            elif line.strip() == "":
+                # Extra blank line, stay in number state
+                pass
+            # else: malformed, try next line
+
+        elif state == "timestamp":
+            # Expecting timestamp line
+            timestamps = _split_timestamp_line(line.strip())
+            if timestamps:
+                current_start = _parse_srt_timestamp(timestamps[0])
+                current_end = _parse_srt_timestamp(timestamps[1])
+                text_lines = []
+                state = "text"
+            else:
+                # Malformed, reset to looking for number
+                state = "number"
+
+        elif state == "text":
+            if line.strip() == "":
+                # Blank line signals end of this subtitle block
+                if text_lines:
+                    yield TranscriptSegment(
+                        start=current_start,
+                        end=current_end,
+                        text="\n".join(text_lines),
+                    )
+                state = "number"
+            else:
+                # Accumulate text lines
+                text_lines.append(line)
+
+    # Handle last segment if file doesn't end with blank line
+    if state == "text" and text_lines:
+        yield TranscriptSegment(
+            start=current_start,
+            end=current_end,
+            text="\n".join(text_lines),
+        )
 
 
 def _load_transcript(transcript_path: str) -> list[TranscriptSegment]:
     """
     Parse an SRT file into TranscriptSegment objects.
 
-    Note: This returns a list because downstream callers (format_transcript_for_editing,
-    _create_initial_edl) require indexed access to segments. The streaming parser
-    _iter_srt_segments is used internally for memory efficiency during parsing.
+    Note: Callers that only need a single pass should iterate
+    _iter_srt_segments directly; it is the only SRT parser. edit_video uses
+    _build_edl_and_review, which collects this list while building the EDL.
 
     Args:
         transcript_path: Path to the SRT file
@@ -221,7 +438,7 @@ def _load_transcript(transcript_path: str) -> list[TranscriptSegment]:
 
 
 def _create_initial_edl(
-    segments: list[TranscriptSegment],
+    segments: Iterable[TranscriptSegment],
     video_path: str,
     duration: float,
 ) -> EditDecisionList:
@@ -229,25 +446,24 @@ def _create_initial_edl(
     Create an initial EDL with all segments marked as KEEP.
 
     Args:
-        segments: List of transcript segments
+        segments: Transcript segments; any iterable works, including the
+                  _iter_srt_segments generator, so no list is needed
         video_path: Path to the source video
         duration: Total video duration in seconds
 
     Returns:
         EditDecisionList with all segments as KEEP
     """
-    edit_segments: list[EditSegment] = []
-
-    for i, segment in enumerate(segments):
-        edit_segments.append(
-            EditSegment(
-                start=segment.start,
-                end=segment.end,
-                action=EditAction.KEEP,
-                reason=None,
-                transcript_indices=[i],
-            )
+    edit_segments = [
+        EditSegment(
+            start=segment.start,
+            end=segment.end,
+            action=EditAction.KEEP,
+            reason=None,
+            transcript_indices=[i],
         )
+        for i, segment in enumerate(segments)
+    ]
 
     return EditDecisionList(
         source_video=video_path,
@@ -256,6 +472,62 @@ def _create_initial_edl(
     )
 
 
+def _build_edl_and_review(
+    transcript_path: str,
+    video_path: str,
+    duration: "float | Future[float]",
+    with_edl: bool = True,
+) -> tuple[list[TranscriptSegment], Optional[EditDecisionList], str]:
+    """
+    Parse an SRT file and build the all-KEEP EDL and review text in one pass.
+
+    Equivalent to calling _load_transcript, _create_initial_edl and
+    format_transcript_for_editing in turn, but walks the segments only once.
+
+    Args:
+        transcript_path: Path to the SRT file
+        video_path: Path to the source video
+        duration: Total video duration in seconds, or a Future for it. A
+                  Future is only waited on after parsing, so a duration
+                  probe running in the background overlaps the parse.
+        with_edl: If False, skip building the all-KEEP EDL and return None
+
+    Returns:
+        Tuple of (segments, all-KEEP EDL, formatted transcript for review)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    segments: list[TranscriptSegment] = []
+    edit_segments: list[EditSegment] = []
+    review_parts: list[str] = []
+
+    for i, segment in enumerate(_iter_srt_segments(transcript_path)):
+        segments.append(segment)
+        if with_edl:
+            edit_segments.append(
+                EditSegment(
+                    start=segment.start,
+                    end=segment.end,
+                    action=EditAction.KEEP,
+                    reason=None,
+                    transcript_indices=[i],
+                )
+            )
+        review_parts.append(f"[{i}] {segment.start}-{segment.end}: {segment.text}")
+
+    edl = None
+    if with_edl:
+        if isinstance(duration, Future):
+            duration = duration.result()
+        edl = EditDecisionList(
+            source_video=video_path,
+            segments=edit_segments,
+            total_duration=duration,
+        )
+    return segments, edl, "\n".join(review_parts)
+
+
 def _parse_ai_response(
     response: str,
     segments: list[TranscriptSegment],
@@ -281,70 +553,57 @@ def _parse_ai_response(
     if not response or not response.strip():
         return []
 
-    # Pattern to match: [KEEP] 0: reason  OR  [KEEP] 0-5: reason
-    # Also supports [REVIEW] which we treat as KEEP
-    pattern = r"\[([Kk][Ee][Ee][Pp]|[Rr][Ee][Mm][Oo][Vv][Ee]|[Rr][Ee][Vv][Ii][Ee][Ww])\]\s*(-?\d+)(?:-(-?\d+))?\s*:\s*(.+)"
-
     result: list[EditSegment] = []
-    lines = response.strip().split("\n")
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+    segment_count = len(segments)
 
-        match = re.match(pattern, line)
-        if match:
-            action_str = match.group(1).upper()
-            start_index = int(match.group(2))
-            end_index_str = match.group(3)
-            reason_text = match.group(4).strip()
+    for match in _AI_LINE_RE.finditer(response):
+        action_str = match.group(1).upper()
+        start_index = int(match.group(2))
+        end_index_str = match.group(3)
+        reason_text = match.group(4)
 
-            # Determine the range of indices
-            if end_index_str:
-                end_index = int(end_index_str)
+        # Determine the range of indices
+        if end_index_str:
+            end_index = int(end_index_str)
+        else:
+            end_index = start_index
+
+        # Validate indices - skip invalid ones with warning
+        if not 0 <= start_index <= end_index < segment_count:
+            if not 0 <= start_index < segment_count:
+                problem = f"invalid start index {start_index}"
+            elif not 0 <= end_index < segment_count:
+                problem = f"invalid end index {end_index}"
             else:
-                end_index = start_index
-
-            # Validate indices - skip invalid ones with warning
-            if start_index < 0 or start_index >= len(segments):
-                print(
-                    f"Warning: Skipping invalid start index {start_index} in AI response",
-                    file=sys.stderr,
-                )
-                continue
-            if end_index < 0 or end_index >= len(segments):
-                print(
-                    f"Warning: Skipping invalid end index {end_index} in AI response",
-                    file=sys.stderr,
-                )
-                continue
+                problem = f"reversed range {start_index}-{end_index}"
+            print(f"Warning: Skipping {problem} in AI response", file=sys.stderr)
+            continue
 
-            # Get timestamps from original segments
-            start_time = segments[start_index].start
-            end_time = segments[end_index].end
+        # Get timestamps from original segments
+        start_time = segments[start_index].start
+        end_time = segments[end_index].end
 
-            # Build list of transcript indices
-            transcript_indices = list(range(start_index, end_index + 1))
+        # Build list of transcript indices
+        transcript_indices = list(range(start_index, end_index + 1))
 
-            # Determine action - REVIEW is treated as KEEP
-            if action_str == "REMOVE":
-                action = EditAction.REMOVE
-                reason = reason_text
-            else:
-                # KEEP or REVIEW
-                action = EditAction.KEEP
-                reason = None
+        # Determine action - REVIEW is treated as KEEP
+        if action_str == "REMOVE":
+            action = EditAction.REMOVE
+            reason = reason_text
+        else:
+            # KEEP or REVIEW
+            action = EditAction.KEEP
+            reason = None
 
-            result.append(
-                EditSegment(
-                    start=start_time,
-                    end=end_time,
-                    action=action,
-                    reason=reason,
-                    transcript_indices=transcript_indices,
-                )
+        result.append(
+            EditSegment(
+                start=start_time,
+                end=end_time,
+                action=action,
+                reason=reason,
+                transcript_indices=transcript_indices,
             )
+        )
 
     return result
 
@@ -360,6 +619,12 @@ def _analyze_with_ai(
     When use_ai is True, calls the Claude API with the video-editor agent prompt
     to analyze the transcript and suggest KEEP/REMOVE decisions.
 
+    Transcripts longer than _AI_CHUNK_SEGMENTS segments are split into
+    chunks that keep their global segment indices and are sent concurrently.
+    Each chunk also carries _AI_CHUNK_OVERLAP segments of context from its
+    neighbours; a chunk's decisions are only kept for the segments it owns,
+    so every segment is decided once.
+
     When use_ai is False, returns an empty list (caller should use all-KEEP EDL).
 
     Args:
@@ -381,13 +646,61 @@ def _analyze_with_ai(
     # Load the video-editor agent prompt
     agent_prompt = load_agent_prompt("video-editor")
 
-    # Call Claude API
-    response = analyze_transcript(transcript, agent_prompt)
+    if len(segments) <= _AI_CHUNK_SEGMENTS:
+        response = analyze_transcript(transcript, agent_prompt)
+        return _parse_ai_response(response, segments), response
+
+    # Long transcripts: one concurrent request per overlapping window
+    owned = [
+        (start, min(start + _AI_CHUNK_SEGMENTS, len(segments)))
+        for start in range(0, len(segments), _AI_CHUNK_SEGMENTS)
+    ]
+    chunks = []
+    for start, end in owned:
+        window_start = max(0, start - _AI_CHUNK_OVERLAP)
+        window_end = min(end + _AI_CHUNK_OVERLAP, len(segments))
+        chunks.append(
+            format_transcript_for_editing(
+                segments[window_start:window_end], start_index=window_start
+            )
+        )
+    responses = analyze_transcript_chunks(chunks, agent_prompt)
+
+    edit_segments = []
+    for (start, end), chunk_response in zip(owned, responses):
+        for edit in _parse_ai_response(chunk_response, segments):
+            clipped = _clip_edit_segment(edit, segments, start, end)
+            if clipped is not None:
+                edit_segments.append(clipped)
+
+    return edit_segments, "\n".join(responses)
+
 
-    # Parse the response
-    edit_segments = _parse_ai_response(response, segments)
+def _clip_edit_segment(
+    edit: EditSegment,
+    segments: list[TranscriptSegment],
+    start: int,
+    end: int,
+) -> Optional[EditSegment]:
+    """
+    Restrict an AI decision to the transcript indices in [start, end).
 
-    return edit_segments, response
+    Returns the decision unchanged if it lies inside the range, a copy with
+    its indices and timestamps narrowed if it crosses the range, or None if
+    it lies wholly outside (i.e. in another chunk's overlap context).
+    """
+    indices = [i for i in edit.transcript_indices if start <= i < end]
+    if not indices:
+        return None
+    if len(indices) == len(edit.transcript_indices):
+        return edit
+    return EditSegment(
+        start=segments[indices[0]].start,
+        end=segments[indices[-1]].end,
+        action=edit.action,
+        reason=edit.reason,
+        transcript_indices=indices,
+    )
 
 
 def _create_edl_from_ai_segments(
@@ -411,54 +724,41 @@ def _create_edl_from_ai_segments(
     Returns:
         Complete EditDecisionList covering all transcript segments.
     """
-    # Track which indices are covered by AI decisions
-    covered_indices: set[int] = set()
-    for seg in ai_segments:
-        covered_indices.update(seg.transcript_indices)
-
-    # Find gaps and create KEEP segments for them
-    all_indices = set(range(len(all_segments)))
-    missing_indices = sorted(all_indices - covered_indices)
+    # Mark which indices are covered by AI decisions in a bitmap
+    segment_count = len(all_segments)
+    uncovered = np.ones(segment_count, dtype=bool)
+    covered = np.fromiter(
+        itertools.chain.from_iterable(seg.transcript_indices for seg in ai_segments),
+        dtype=np.intp,
+    )
+    uncovered[covered[(covered >= 0) & (covered < segment_count)]] = False
 
-    # Create KEEP segments for missing indices
+    # Group consecutive missing indices into runs and create a KEEP segment
+    # for each run
+    missing_indices = np.flatnonzero(uncovered)
     gap_segments: list[EditSegment] = []
-    if missing_indices:
-        # Group consecutive indices into segments
-        start_idx = missing_indices[0]
-        end_idx = missing_indices[0]
-
-        for idx in missing_indices[1:]:
-            if idx == end_idx + 1:
-                # Consecutive, extend the range
-                end_idx = idx
-            else:
-                # Gap - save current segment and start new one
-                gap_segments.append(
-                    EditSegment(
-                        start=all_segments[start_idx].start,
-                        end=all_segments[end_idx].end,
-                        action=EditAction.KEEP,
-                        reason=None,
-                        transcript_indices=list(range(start_idx, end_idx + 1)),
-                    )
+    if missing_indices.size:
+        breaks = np.flatnonzero(np.diff(missing_indices) != 1) + 1
+        last = missing_indices.size - 1
+        run_starts = missing_indices[np.concatenate(([0], breaks))]
+        run_ends = missing_indices[np.concatenate((breaks - 1, [last]))]
+
+        for start_idx, end_idx in zip(run_starts.tolist(), run_ends.tolist()):
+            gap_segments.append(
+                EditSegment(
+                    start=all_segments[start_idx].start,
+                    end=all_segments[end_idx].end,
+                    action=EditAction.KEEP,
+                    reason=None,
+                    transcript_indices=list(range(start_idx, end_idx + 1)),
                 )
-                start_idx = idx
-                end_idx = idx
-
-        # Add the last segment
-        gap_segments.append(
-            EditSegment(
-                start=all_segments[start_idx].start,
-                end=all_segments[end_idx].end,
-                action=EditAction.KEEP,
-                reason=None,
-                transcript_indices=list(range(start_idx, end_idx + 1)),
             )
-        )
 
-    # Combine AI segments with gap segments and sort by start time
+    # Combine AI segments with gap segments and sort by start time. Both
+    # lists are normally already ordered, and Timsort merges two sorted runs
+    # in linear time, faster than heapq.merge's Python-level iteration.
     all_edit_segments = ai_segments + gap_segments
-    all_edit_segments.sort(key=lambda s: s.start)
+    all_edit_segments.sort(key=attrgetter("start"))
 
     return EditDecisionList(
         source_video=video_path,
@@ -474,7 +774,7 @@ def edit_video(
     edl_path: Optional[str] = None,
     auto_apply: bool = False,
     use_ai: bool = False,
-) -> dict:
+) -> Dict[str, Any]:
     """
     Orchestrate the video editing workflow.
 
@@ -508,26 +808,35 @@ def edit_video(
         FileNotFoundError: If video file does not exist
         LLMClientError: If use_ai=True and API call fails
     """
-    # Validate video file exists
-    if not os.path.exists(video_path):
-        raise FileNotFoundError(f"Video file not found: {video_path}")
-
-    # Step 1: Load or generate transcript
-    if transcript_path is None:
-        # Generate transcript using the subtitle pipeline
-        transcript_path = process_video(video_path)
-
-    segments = _load_transcript(transcript_path)
-
-    # Step 2: Get video duration
-    duration = get_video_duration(video_path)
-
-    # Step 3: Format transcript for AI review
-    transcript_for_review = format_transcript_for_editing(segments)
+    # Re-editing an unchanged video reuses its transcript and duration. The
+    # stat for the cache key doubles as the existence check.
+    try:
+        cache_key = _video_cache_key(video_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Video file not found: {video_path}") from None
+
+    # Steps 1-3: Probe the video duration in the background while the
+    # transcript is generated (if needed) and parsed; neither depends on it.
+    # Parsing builds the all-KEEP EDL and the review text in the same pass.
+    # With AI, the all-KEEP EDL is only a fallback, so it is built on demand
+    # below.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        duration_future = executor.submit(_cached_video_duration, *cache_key)
+        if transcript_path is None:
+            transcript_path = _generate_transcript(video_path, cache_key)
+        segments, edl, transcript_for_review = _build_edl_and_review(
+            transcript_path,
+            video_path,
+            duration_future,
+            with_edl=not use_ai,
+        )
+        duration = duration_future.result()
 
-    # Step 4: Create EDL - either AI-analyzed or all-KEEP
+    # Step 4: Build the EDL from the AI analysis if requested
     if use_ai:
-        ai_segments, raw_response = _analyze_with_ai(transcript_for_review, segments, use_ai=True)
+        ai_segments, raw_response = _analyze_with_ai(
+            transcript_for_review, segments, use_ai=True
+        )
         if ai_segments:
             edl = _create_edl_from_ai_segments(ai_segments, segments, video_path, duration)
             # Check if all segments are REMOVE
@@ -553,15 +862,15 @@ def edit_video(
                     file=sys.stderr,
                 )
             edl = _create_initial_edl(segments, video_path, duration)
-    else:
-        edl = _create_initial_edl(segments, video_path, duration)
+
+    # The EDL comes from parsing without AI, and from step 4 with it
+    assert edl is not None
 
     # Step 5: Determine EDL path and save
     if edl_path is None:
         edl_path = derive_output_path(video_path, ".edl.json")
 
-    with open(edl_path, "w", encoding="utf-8") as f:
-        f.write(edl_to_json(edl))
+    edl_to_file(edl, edl_path)
 
     # Step 6: Return information for AI review (or apply cuts)
     result = {
@@ -575,8 +884,9 @@ def edit_video(
     }
 
     if auto_apply:
-        # Apply cuts immediately
-        edited_video_path = apply_edl_to_video(video_path, edl_path, output_path)
+        # Apply cuts immediately, using the in-memory EDL instead of
+        # re-reading the file just written
+        edited_video_path = apply_edl(video_path, edl, output_path)
         result["edited_video_path"] = edited_video_path
 
     return result
@@ -587,7 +897,7 @@ def apply_edl_to_video(
     edl_path: str,
     output_path: Optional[str] = None,
     srt_path: Optional[str] = None,
-) -> dict:
+) -> Dict[str, Any]:
     """
     Apply a previously generated/reviewed EDL to a video.
 
@@ -609,22 +919,50 @@ def apply_edl_to_video(
         FileNotFoundError: If video, EDL, or SRT file does not exist
         json.JSONDecodeError: If EDL file is not valid JSON
     """
-    # Validate files exist
+    # The video is checked first so a missing video is reported even when the
+    # EDL is unusable
     if not os.path.exists(video_path):
         raise FileNotFoundError(f"Video file not found: {video_path}")
-    if not os.path.exists(edl_path):
-        raise FileNotFoundError(f"EDL file not found: {edl_path}")
 
+    # Load EDL from JSON (memoized while the file is unchanged). load_edl
+    # stats the file anyway, so a separate existence check is redundant.
+    try:
+        edl = load_edl(edl_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"EDL file not found: {edl_path}") from None
+
+    return apply_edl(video_path, edl, output_path, srt_path)
+
+
+def apply_edl(
+    video_path: str,
+    edl: EditDecisionList,
+    output_path: Optional[str] = None,
+    srt_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Apply an in-memory EDL to a video.
+
+    Same as apply_edl_to_video, for callers that already hold the EDL.
+
+    Args:
+        video_path: Path to the input video file
+        edl: The EditDecisionList to apply
+        output_path: Optional path for output video. If None, generates default path.
+        srt_path: Optional path to input SRT file. If None, auto-detects or generates.
+
+    Returns:
+        Dict with:
+            - 'video_path': Path to the edited video file
+            - 'srt_path': Path to adjusted SRT file
+
+    Raises:
+        FileNotFoundError: If video or SRT file does not exist
+    """
     # Determine output path if not provided
     if output_path is None:
         output_path = derive_output_path(video_path, "_edited.mp4")
 
-    # Load EDL from JSON - use json.load directly on file handle for memory efficiency
-    with open(edl_path, "r", encoding="utf-8") as f:
-        edl_data = json.load(f)
-
-    edl = edl_from_dict(edl_data)
-
     # Apply cuts using video_cutter
     edited_video_path = cut_video(video_path, edl, output_path)
 
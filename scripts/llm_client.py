@@ -4,16 +4,35 @@ This module provides functions for interacting with the Claude API
 to analyze video transcripts and suggest edits.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import re
 from pathlib import Path
+from typing import Any
 
 import anthropic
 
+from scripts.disk_cache import evict, write_entry
+
 
 # Default model for AI analysis. Can be overridden via CLAUDE_MODEL env var.
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
+# Set to "0" to disable the on-disk cache of Claude responses.
+CACHE_ENV_VAR = "AIVE_LLM_CACHE"
+
+# Least recently used responses are evicted once the cache grows past this size.
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Most chunk requests in flight at once, to stay clear of API rate limits.
+MAX_CONCURRENT_REQUESTS = 8
+
+# YAML frontmatter: start of string, ---, any content, ---, newline
+_FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+
 
 class LLMClientError(Exception):
     """Raised when LLM client operations fail."""
@@ -37,12 +56,14 @@ def get_api_key() -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=8)
 def load_agent_prompt(agent_name: str) -> str:
     """
     Load an agent prompt from the .claude/agents directory.
 
     Loads the markdown file and strips YAML frontmatter (the part between
-    --- lines at the start of the file).
+    --- lines at the start of the file). Results are memoized per agent
+    name, so each prompt file is read once per process.
 
     Args:
         agent_name: Name of the agent (e.g., "video-editor")
@@ -68,9 +89,7 @@ def load_agent_prompt(agent_name: str) -> str:
         raise LLMClientError(f"Failed to read agent prompt file: {e}")
 
     # Strip YAML frontmatter (content between --- at the start)
-    # Pattern matches: start of string, ---, any content, ---, newline
-    frontmatter_pattern = r"^---\n.*?\n---\n"
-    content = re.sub(frontmatter_pattern, "", content, count=1, flags=re.DOTALL)
+    content = _FRONTMATTER_RE.sub("", content, count=1)
 
     return content.strip()
 
@@ -87,6 +106,17 @@ def get_model() -> str:
     return os.environ.get("CLAUDE_MODEL", DEFAULT_MODEL)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str) -> anthropic.Anthropic:
+    """
+    Return a Claude client shared across calls made with the same API key.
+
+    Reusing one client keeps its HTTP connection pool, so repeated analyses
+    in one process skip the TCP and TLS handshakes.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def analyze_transcript(
     transcript: str,
     agent_prompt: str,
@@ -96,7 +126,11 @@ def analyze_transcript(
     Analyze a transcript using Claude API.
 
     Sends the transcript to Claude with the given agent prompt to get
-    edit suggestions.
+    edit suggestions. Responses are cached on disk (under
+    $XDG_CACHE_HOME/ai-video-editor/llm) keyed by model, prompt and
+    transcript, so re-running on unchanged input skips the API call. The
+    least recently used responses are evicted once the cache exceeds
+    CACHE_MAX_BYTES. Set AIVE_LLM_CACHE=0 to disable the cache.
 
     Args:
         transcript: The formatted transcript text to analyze.
@@ -113,29 +147,218 @@ def analyze_transcript(
     if model is None:
         model = get_model()
 
-    try:
-        api_key = get_api_key()
-        client = anthropic.Anthropic(api_key=api_key)
+    # Identical (model, prompt, transcript) requests reuse the earlier answer
+    use_cache = os.environ.get(CACHE_ENV_VAR) != "0"
+    if use_cache:
+        cache_key = _response_cache_key(transcript, agent_prompt, model)
+        cached = _read_cached_response(cache_key)
+        if cached is not None:
+            return cached
 
+    try:
+        client = _get_client(get_api_key())
         message = client.messages.create(
-            model=model,
-            max_tokens=4096,
-            system=agent_prompt,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"Please analyze this transcript and provide edit decisions:\n\n{transcript}",
-                }
-            ],
+            **_message_request(transcript, agent_prompt, model)
         )
-
-        # Extract text from the response
-        if message.content and len(message.content) > 0:
-            return message.content[0].text
-        else:
-            raise LLMClientError("Empty response from Claude API")
-
     except anthropic.AuthenticationError as e:
         raise LLMClientError(f"Authentication failed: {e}")
     except anthropic.APIError as e:
         raise LLMClientError(f"Claude API error: {e}")
+
+    response = _response_text(message)
+
+    if use_cache:
+        _write_cached_response(cache_key, response)
+    return response
+
+
+def analyze_transcript_chunks(
+    chunks: list[str],
+    agent_prompt: str,
+    model: str | None = None,
+) -> list[str]:
+    """
+    Analyze several transcript chunks concurrently using Claude API.
+
+    Each chunk is sent as its own request, like analyze_transcript, but all
+    requests are in flight at once on an async client, so wall-clock time is
+    roughly that of the slowest chunk. Cached chunks are not re-sent. When
+    called from a thread that already runs an event loop (e.g. a notebook),
+    the chunks are sent one after another on the sync client instead.
+
+    Responses that succeed are cached even if another chunk fails, so a
+    retry only re-sends the failed chunks.
+
+    Args:
+        chunks: Formatted transcript chunks to analyze.
+        agent_prompt: The system prompt for the agent.
+        model: The Claude model to use. If None, uses CLAUDE_MODEL env var
+               or falls back to DEFAULT_MODEL.
+
+    Returns:
+        The AI's response text for each chunk, in the same order as chunks.
+
+    Raises:
+        LLMClientError: If any API call fails or returns an error.
+    """
+    if model is None:
+        model = get_model()
+
+    use_cache = os.environ.get(CACHE_ENV_VAR) != "0"
+    cache_keys = [_response_cache_key(chunk, agent_prompt, model) for chunk in chunks]
+    responses: list[str | None] = [
+        _read_cached_response(key) if use_cache else None for key in cache_keys
+    ]
+
+    pending = [i for i, response in enumerate(responses) if response is None]
+    if not pending:
+        return [response for response in responses if response is not None]
+
+    pending_chunks = [chunks[i] for i in pending]
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        fetched = asyncio.run(_fetch_responses(pending_chunks, agent_prompt, model))
+    else:
+        # asyncio.run() cannot be nested inside a running event loop
+        fetched = _fetch_responses_sync(pending_chunks, agent_prompt, model)
+
+    failure: BaseException | None = None
+    for i, result in zip(pending, fetched):
+        if isinstance(result, BaseException):
+            if failure is None:
+                failure = result
+            continue
+        responses[i] = result
+        if use_cache:
+            _write_cached_response(cache_keys[i], result)
+
+    if isinstance(failure, anthropic.AuthenticationError):
+        raise LLMClientError(f"Authentication failed: {failure}")
+    if isinstance(failure, anthropic.APIError):
+        raise LLMClientError(f"Claude API error: {failure}")
+    if failure is not None:
+        raise failure
+
+    return [response for response in responses if response is not None]
+
+
+async def _fetch_responses(
+    chunks: list[str], agent_prompt: str, model: str
+) -> list[str | BaseException]:
+    """
+    Send one request per chunk concurrently and return the response texts.
+
+    At most MAX_CONCURRENT_REQUESTS requests are in flight at a time. A
+    failed request yields its exception in place of the text, so the other
+    chunks' responses are kept.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(client: anthropic.AsyncAnthropic, chunk: str) -> str:
+        async with semaphore:
+            message: anthropic.types.Message = await client.messages.create(
+                **_message_request(chunk, agent_prompt, model)
+            )
+        return _response_text(message)
+
+    client = anthropic.AsyncAnthropic(api_key=get_api_key())
+    try:
+        return await asyncio.gather(
+            *(fetch(client, chunk) for chunk in chunks), return_exceptions=True
+        )
+    finally:
+        await client.close()
+
+
+def _fetch_responses_sync(
+    chunks: list[str], agent_prompt: str, model: str
+) -> list[str | BaseException]:
+    """Send one request per chunk in turn; results are as for _fetch_responses."""
+    client = _get_client(get_api_key())
+    results: list[str | BaseException] = []
+    for chunk in chunks:
+        try:
+            message = client.messages.create(
+                **_message_request(chunk, agent_prompt, model)
+            )
+            results.append(_response_text(message))
+        except (anthropic.APIError, LLMClientError) as e:
+            results.append(e)
+    return results
+
+
+def _message_request(
+    transcript: str, agent_prompt: str, model: str
+) -> dict[str, Any]:
+    """Build the messages.create keyword arguments for a transcript analysis."""
+    return {
+        "model": model,
+        "max_tokens": 4096,
+        # Mark the static agent prompt as a cacheable prefix so repeated
+        # analyses reuse it server-side instead of re-processing it
+        "system": [
+            {
+                "type": "text",
+                "text": agent_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [
+            {
+                "role": "user",
+                "content": f"Please analyze this transcript and provide edit decisions:\n\n{transcript}",
+            }
+        ],
+    }
+
+
+def _response_text(message: "anthropic.types.Message") -> str:
+    """Extract the text of a Claude response, rejecting empty responses."""
+    if message.content and len(message.content) > 0:
+        return message.content[0].text
+    raise LLMClientError("Empty response from Claude API")
+
+
+def _response_cache_dir() -> Path:
+    """Return the directory holding cached Claude responses."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ai-video-editor" / "llm"
+
+
+def _response_cache_key(transcript: str, agent_prompt: str, model: str) -> str:
+    """Hash the inputs that determine a Claude response."""
+    data = f"{model}\0{agent_prompt}\0{transcript}".encode("utf-8")
+    return hashlib.blake2b(data).hexdigest()
+
+
+def _read_cached_response(cache_key: str) -> str | None:
+    """
+    Return a cached response, or None if missing or unreadable.
+
+    A hit refreshes the entry's modification time, which is what eviction
+    orders by.
+    """
+    cache_path = _response_cache_dir() / f"{cache_key}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            response = json.load(f)["response"]
+        os.utime(cache_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return response if isinstance(response, str) else None
+
+
+def _write_cached_response(cache_key: str, response: str) -> None:
+    """
+    Store a response in the cache, evicting old entries if it is too big.
+
+    The entry is written atomically (see scripts.disk_cache.write_entry).
+    Failures are ignored since the cache is only an optimization.
+    """
+    cache_dir = _response_cache_dir()
+    try:
+        write_entry(cache_dir / f"{cache_key}.json", {"response": response})
+        evict(cache_dir, CACHE_MAX_BYTES)
+    except (OSError, TypeError, ValueError):
+        pass
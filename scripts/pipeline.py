@@ -1,12 +1,33 @@
 """Pipeline module for orchestrating the video-to-subtitle workflow."""
 
+import functools
+import multiprocessing
+import multiprocessing.queues
 import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from scripts.audio_extractor import extract_audio
+from scripts.audio_extractor import (
+    extract_audio,
+    extract_audio_batch,
+    extract_audio_to_array,
+)
 from scripts.subtitle_writer import write_srt, write_vtt
-from scripts.transcription import transcribe
+from scripts.transcript_cache import (
+    cache_enabled,
+    cache_key,
+    load_transcript,
+    store_transcript,
+)
+from scripts.transcription import (
+    AudioInput,
+    TranscriptSegment,
+    _select_device,
+    cuda_device_count,
+    transcribe,
+    transcribe_many_iter,
+)
 
 
 SUPPORTED_SUBTITLE_FORMATS = ("srt", "vtt")
@@ -47,6 +68,9 @@ def process_video(
     model_size: str = "base",
     language: Optional[str] = None,
     subtitle_format: str = "srt",
+    in_memory_audio: bool = False,
+    beam_size: int = 5,
+    vad_filter: bool = False,
 ) -> str:
     """
     Process a video file to generate subtitles.
@@ -57,6 +81,9 @@ def process_video(
     3. Writes the transcript to a subtitle file (SRT or VTT format)
     4. Cleans up the temporary audio file
 
+    With in_memory_audio=True, ffmpeg pipes PCM samples straight into Whisper
+    instead, skipping the temporary WAV file (steps 1 and 4).
+
     Args:
         video_path: Path to the input video file
         output_path: Optional path for output subtitle file.
@@ -65,6 +92,12 @@ def process_video(
                     Defaults to "base".
         language: Optional language code (e.g., "en"). If None, auto-detect.
         subtitle_format: Output subtitle format ("srt" or "vtt"). Defaults to "srt".
+        in_memory_audio: If True, transcribe audio decoded into memory rather
+                         than via a temporary WAV file. Defaults to False.
+        beam_size: Beam width for decoding. 1 (greedy) is several times
+                   faster than the default 5. Defaults to 5.
+        vad_filter: If True, skip non-speech audio before decoding.
+                    Defaults to False.
 
     Returns:
         Path to the generated subtitle file
@@ -75,12 +108,7 @@ def process_video(
         TranscriptionError: If transcription fails
         ValueError: If transcription returns empty segments or invalid subtitle format
     """
-    # Validate subtitle format
-    if subtitle_format not in SUPPORTED_SUBTITLE_FORMATS:
-        raise ValueError(
-            f"Invalid subtitle format: '{subtitle_format}'. "
-            f"Supported formats: {', '.join(SUPPORTED_SUBTITLE_FORMATS)}"
-        )
+    _validate_subtitle_format(subtitle_format)
 
     # Validate input file exists
     if not os.path.exists(video_path):
@@ -90,34 +118,362 @@ def process_video(
     if output_path is None:
         output_path = derive_output_path(video_path, f".{subtitle_format}")
 
+    if in_memory_audio:
+        # Decode audio straight into memory and transcribe the samples
+        _transcribe_to_subtitles(
+            extract_audio_to_array(video_path),
+            video_path,
+            output_path,
+            model_size=model_size,
+            language=language,
+            subtitle_format=subtitle_format,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+        )
+        return output_path
+
     # Extract audio to temp file, then transcribe and write subtitle file
     temp_audio_path: Optional[str] = None
     try:
         # Step 1: Extract audio to temporary WAV file
         temp_audio_path = extract_audio(video_path)
 
-        # Step 2: Transcribe the audio
-        segments = transcribe(
+        # Steps 2-4: Transcribe and write subtitle file
+        _transcribe_to_subtitles(
             temp_audio_path,
+            video_path,
+            output_path,
             model_size=model_size,
             language=language,
+            subtitle_format=subtitle_format,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
         )
 
-        # Step 3: Validate we have segments
-        if not segments:
-            raise ValueError(
-                f"Transcription returned empty segments for {video_path}"
-            )
-
-        # Step 4: Write subtitle file in requested format
-        if subtitle_format == "vtt":
-            write_vtt(segments, output_path)
-        else:
-            write_srt(segments, output_path)
-
         return output_path
 
     finally:
         # Step 5: Clean up temporary audio file
         if temp_audio_path is not None and os.path.exists(temp_audio_path):
             os.remove(temp_audio_path)
+
+
+def process_videos(
+    video_paths: list[str],
+    model_size: str = "base",
+    language: Optional[str] = None,
+    subtitle_format: str = "srt",
+    beam_size: int = 5,
+) -> list[str]:
+    """
+    Process several video files to generate subtitles.
+
+    Audio for all videos is extracted with a single ffmpeg invocation and
+    transcribed with batched inference (see transcribe_many_iter()). Videos
+    whose transcript is already in the transcript cache are not transcribed
+    again. Each subtitle file is written like process_video(), on a writer
+    thread while the next video is transcribed. Output paths are derived
+    from each video path.
+
+    Args:
+        video_paths: Paths to the input video files
+        model_size: Whisper model size ("tiny", "base", "small", "medium", "large-v2")
+                    Defaults to "base".
+        language: Optional language code (e.g., "en"). If None, auto-detect.
+        subtitle_format: Output subtitle format ("srt" or "vtt"). Defaults to "srt".
+        beam_size: Beam width for decoding (see process_video). Batched
+                   inference always skips non-speech audio, so there is no
+                   vad_filter option.
+
+    Returns:
+        Paths to the generated subtitle files, in the same order as video_paths
+
+    Raises:
+        FileNotFoundError: If any video file doesn't exist
+        AudioExtractionError: If audio extraction fails
+        TranscriptionError: If transcription fails
+        ValueError: If video_paths is empty, transcription returns empty segments
+                    or the subtitle format is invalid
+    """
+    _validate_subtitle_format(subtitle_format)
+
+    # Step 1: Extract audio for every video in one ffmpeg process
+    temp_audio_paths = extract_audio_batch(video_paths)
+    try:
+        # Step 2: Reuse cached transcripts; only the rest is transcribed
+        keys = [
+            _transcript_cache_key(
+                audio_path,
+                model_size,
+                language,
+                beam_size,
+                vad_filter=True,
+                batched=True,
+            )
+            for audio_path in temp_audio_paths
+        ]
+        cached = [load_transcript(key) if key is not None else None for key in keys]
+        new_segment_lists = transcribe_many_iter(
+            [
+                audio_path
+                for audio_path, segments in zip(temp_audio_paths, cached)
+                if segments is None
+            ],
+            model_size=model_size,
+            language=language,
+            beam_size=beam_size,
+        )
+
+        # Steps 3-4: Transcribe on this thread (keeping the cached model
+        # single-user) while the writer thread validates and writes the
+        # previous video's subtitles
+        output_paths = []
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            previous_write: Optional[Future[None]] = None
+            for video_path, key, segments in zip(video_paths, keys, cached):
+                if segments is None:
+                    segments = next(new_segment_lists)
+                    if key is not None and segments:
+                        store_transcript(key, segments)
+
+                output_path = derive_output_path(video_path, f".{subtitle_format}")
+                write = writer.submit(
+                    _write_subtitles, segments, video_path, output_path, subtitle_format
+                )
+                # Surface a failed write before transcribing further; it has
+                # had a whole transcription to finish, so this rarely waits
+                if previous_write is not None:
+                    previous_write.result()
+                previous_write = write
+                output_paths.append(output_path)
+
+            if previous_write is not None:
+                previous_write.result()
+
+        return output_paths
+
+    finally:
+        # Step 5: Clean up temporary audio files
+        for audio_path in temp_audio_paths:
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
+
+
+def process_videos_parallel(
+    video_paths: list[str],
+    model_size: str = "base",
+    language: Optional[str] = None,
+    subtitle_format: str = "srt",
+    max_workers: Optional[int] = None,
+    beam_size: int = 5,
+    vad_filter: bool = False,
+) -> list[str]:
+    """
+    Process several video files to generate subtitles, in parallel processes.
+
+    Each video goes through process_video() in a worker process. With CUDA
+    GPUs available there is one worker per GPU, each pinned to its own
+    device through CUDA_VISIBLE_DEVICES; otherwise the CPUs are split
+    between workers. Each worker keeps its Whisper model warm across the
+    videos it processes.
+
+    Args:
+        video_paths: Paths to the input video files
+        model_size: Whisper model size ("tiny", "base", "small", "medium", "large-v2")
+                    Defaults to "base".
+        language: Optional language code (e.g., "en"). If None, auto-detect.
+        subtitle_format: Output subtitle format ("srt" or "vtt"). Defaults to "srt".
+        max_workers: Number of worker processes. Defaults to the number of
+                     GPUs, or half the CPUs when there is no GPU.
+        beam_size: Beam width for decoding (see process_video)
+        vad_filter: If True, skip non-speech audio before decoding
+
+    Returns:
+        Paths to the generated subtitle files, in the same order as video_paths
+
+    Raises:
+        FileNotFoundError: If any video file doesn't exist
+        AudioExtractionError: If audio extraction fails
+        TranscriptionError: If transcription fails
+        ValueError: If transcription returns empty segments or the subtitle
+                    format is invalid
+    """
+    _validate_subtitle_format(subtitle_format)
+
+    gpu_count = cuda_device_count()
+    cpu_count = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = gpu_count or max(1, cpu_count // 2)
+    max_workers = max(1, min(max_workers, len(video_paths)))
+
+    # Hand each worker a GPU id once, as it starts, so every worker process
+    # sees a single device
+    gpu_ids: Optional["multiprocessing.queues.Queue[int]"] = None
+    context = multiprocessing.get_context("spawn")
+    if gpu_count:
+        gpu_ids = context.Queue()
+        for worker in range(max_workers):
+            gpu_ids.put(worker % gpu_count)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_init_video_worker,
+        initargs=(gpu_ids, max(1, cpu_count // max_workers)),
+    ) as executor:
+        return list(
+            executor.map(
+                functools.partial(
+                    process_video,
+                    model_size=model_size,
+                    language=language,
+                    subtitle_format=subtitle_format,
+                    beam_size=beam_size,
+                    vad_filter=vad_filter,
+                ),
+                video_paths,
+            )
+        )
+
+
+def _init_video_worker(
+    gpu_ids: Optional["multiprocessing.queues.Queue[int]"], cpu_threads: int
+) -> None:
+    """
+    Configure a process_videos_parallel worker before it loads Whisper.
+
+    Args:
+        gpu_ids: Queue to take this worker's GPU id from, or None on CPU
+        cpu_threads: CTranslate2 threads for this worker, so that the workers
+                     together don't oversubscribe the CPUs
+    """
+    if gpu_ids is not None:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_ids.get())
+    os.environ.setdefault("WHISPER_CPU_THREADS", str(cpu_threads))
+
+
+def _validate_subtitle_format(subtitle_format: str) -> None:
+    """
+    Validate a subtitle format name.
+
+    Raises:
+        ValueError: If the format is not one of SUPPORTED_SUBTITLE_FORMATS
+    """
+    if subtitle_format not in SUPPORTED_SUBTITLE_FORMATS:
+        raise ValueError(
+            f"Invalid subtitle format: '{subtitle_format}'. "
+            f"Supported formats: {', '.join(SUPPORTED_SUBTITLE_FORMATS)}"
+        )
+
+
+def _transcribe_to_subtitles(
+    audio_path: AudioInput,
+    video_path: str,
+    output_path: str,
+    model_size: str,
+    language: Optional[str],
+    subtitle_format: str,
+    beam_size: int = 5,
+    vad_filter: bool = False,
+) -> None:
+    """
+    Transcribe an extracted audio file and write it as a subtitle file.
+
+    Transcripts are cached on disk by audio content and decoding options
+    (see scripts.transcript_cache), so unchanged audio is not transcribed
+    again.
+
+    Args:
+        audio_path: Path to the extracted audio file, or its samples in memory
+        video_path: Path to the source video (used in error messages)
+        output_path: Path for the output subtitle file
+        model_size: Whisper model size
+        language: Optional language code. If None, auto-detect.
+        subtitle_format: Output subtitle format ("srt" or "vtt")
+        beam_size: Beam width for decoding
+        vad_filter: If True, skip non-speech audio before decoding
+
+    Raises:
+        TranscriptionError: If transcription fails
+        ValueError: If transcription returns empty segments
+    """
+    # Reuse the transcript of identical audio decoded with the same options
+    key = _transcript_cache_key(audio_path, model_size, language, beam_size, vad_filter)
+    segments = load_transcript(key) if key is not None else None
+    if segments is None:
+        # Transcribe the audio
+        segments = transcribe(
+            audio_path,
+            model_size=model_size,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+        )
+        if key is not None and segments:
+            store_transcript(key, segments)
+
+    _write_subtitles(segments, video_path, output_path, subtitle_format)
+
+
+def _transcript_cache_key(
+    audio_path: AudioInput,
+    model_size: str,
+    language: Optional[str],
+    beam_size: int,
+    vad_filter: bool,
+    batched: bool = False,
+) -> Optional[str]:
+    """
+    Return the transcript cache key for audio, or None if it can't be cached.
+
+    The key includes the device and compute type transcription will use.
+    None is returned when the cache is disabled or the audio can't be read;
+    the latter then fails with a clearer error during transcription.
+    """
+    if not cache_enabled():
+        return None
+    device, compute_type = _select_device()
+    try:
+        return cache_key(
+            audio_path,
+            model_size,
+            language,
+            beam_size,
+            vad_filter,
+            device,
+            compute_type,
+            batched=batched,
+        )
+    except OSError:
+        return None
+
+
+def _write_subtitles(
+    segments: list[TranscriptSegment],
+    video_path: str,
+    output_path: str,
+    subtitle_format: str,
+) -> None:
+    """
+    Write transcribed segments as a subtitle file.
+
+    Args:
+        segments: Transcribed segments for the video
+        video_path: Path to the source video (used in error messages)
+        output_path: Path for the output subtitle file
+        subtitle_format: Output subtitle format ("srt" or "vtt")
+
+    Raises:
+        ValueError: If there are no segments
+    """
+    # Validate we have segments
+    if not segments:
+        raise ValueError(
+            f"Transcription returned empty segments for {video_path}"
+        )
+
+    # Write subtitle file in requested format
+    if subtitle_format == "vtt":
+        write_vtt(segments, output_path)
+    else:
+        write_srt(segments, output_path)
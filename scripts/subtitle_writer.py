@@ -1,5 +1,8 @@
 """Module for writing subtitle files in SRT and VTT formats."""
 
+import os
+import secrets
+
 from scripts.transcription import TranscriptSegment
 
 
@@ -13,14 +16,11 @@ def format_srt_timestamp(seconds: float) -> str:
     Returns:
         SRT-formatted timestamp (e.g., "00:01:05,500")
     """
-    # Calculate hours, minutes, seconds, and milliseconds
-    total_seconds = int(seconds)
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-
-    # Extract milliseconds and round to 3 decimal places
-    milliseconds = round((seconds - total_seconds) * 1000)
+    # Round once to whole milliseconds, then split with integer math so a
+    # fraction that rounds up to 1000 ms carries into the seconds
+    total_seconds, milliseconds = divmod(round(seconds * 1000), 1000)
+    total_minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
@@ -37,14 +37,11 @@ def format_vtt_timestamp(seconds: float) -> str:
     Returns:
         VTT-formatted timestamp (e.g., "00:01:05.500")
     """
-    # Calculate hours, minutes, seconds, and milliseconds
-    total_seconds = int(seconds)
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-
-    # Extract milliseconds and round to 3 decimal places
-    milliseconds = round((seconds - total_seconds) * 1000)
+    # Round once to whole milliseconds, then split with integer math so a
+    # fraction that rounds up to 1000 ms carries into the seconds
+    total_seconds, milliseconds = divmod(round(seconds * 1000), 1000)
+    total_minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
 
@@ -63,22 +60,16 @@ def write_srt(segments: list[TranscriptSegment], output_path: str) -> None:
     if not segments:
         raise ValueError("Cannot write SRT file with empty segments list")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for index, segment in enumerate(segments, start=1):
-            # Write subtitle number
-            f.write(f"{index}\n")
-
-            # Write timestamp line
-            start_ts = format_srt_timestamp(segment.start)
-            end_ts = format_srt_timestamp(segment.end)
-            f.write(f"{start_ts} --> {end_ts}\n")
-
-            # Write subtitle text
-            f.write(f"{segment.text}\n")
+    # Build the whole file and write it once: one block per cue (number,
+    # timestamp line, text), separated by blank lines
+    blocks = [
+        f"{index}\n"
+        f"{format_srt_timestamp(segment.start)} --> {format_srt_timestamp(segment.end)}\n"
+        f"{segment.text}\n"
+        for index, segment in enumerate(segments, start=1)
+    ]
 
-            # Write blank line separator (except after last segment)
-            if index < len(segments):
-                f.write("\n")
+    _write_atomically(output_path, "\n".join(blocks))
 
 
 def write_vtt(segments: list[TranscriptSegment], output_path: str) -> None:
@@ -95,20 +86,39 @@ def write_vtt(segments: list[TranscriptSegment], output_path: str) -> None:
     if not segments:
         raise ValueError("Cannot write VTT file with empty segments list")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        # Write WEBVTT header
-        f.write("WEBVTT\n")
-        f.write("\n")
+    # Build the whole file and write it once: the WEBVTT header, then one
+    # block per cue (timestamp line, text; no cue numbers in VTT), separated
+    # by blank lines
+    blocks = [
+        f"{format_vtt_timestamp(segment.start)} --> {format_vtt_timestamp(segment.end)}\n"
+        f"{segment.text}\n"
+        for segment in segments
+    ]
 
-        for index, segment in enumerate(segments, start=1):
-            # Write timestamp line (no cue numbers in VTT)
-            start_ts = format_vtt_timestamp(segment.start)
-            end_ts = format_vtt_timestamp(segment.end)
-            f.write(f"{start_ts} --> {end_ts}\n")
+    _write_atomically(output_path, "WEBVTT\n\n" + "\n".join(blocks))
 
-            # Write subtitle text
-            f.write(f"{segment.text}\n")
 
-            # Write blank line separator (except after last segment)
-            if index < len(segments):
-                f.write("\n")
+def _write_atomically(output_path: str, content: str) -> None:
+    """
+    Write a text file so that readers never see it half-written.
+
+    The content goes to a hidden sibling file first, which is then renamed
+    over output_path; a failed write leaves any previous file untouched.
+
+    Args:
+        output_path: Path of the file to write
+        content: Full text content of the file
+    """
+    directory, name = os.path.split(output_path)
+    temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+
+    try:
+        # Mode "x" creates the file with the usual umask-derived permissions,
+        # unlike tempfile's private 0600 files
+        with open(temp_path, "x", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,127 @@
+"""On-disk cache of Whisper transcripts.
+
+Transcripts are stored as JSON under $XDG_CACHE_HOME/ai-video-editor/transcripts,
+keyed by a hash of the audio content and the decoding options, so re-running
+the pipeline on an unchanged video skips transcription entirely. Set
+AIVE_TRANSCRIPT_CACHE=0 to disable the cache.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from scripts.disk_cache import evict, write_entry
+from scripts.transcription import AudioInput, TranscriptSegment
+
+
+# Set to "0" to disable the on-disk cache of transcripts.
+CACHE_ENV_VAR = "AIVE_TRANSCRIPT_CACHE"
+
+# Least recently used entries are evicted once the cache grows past this size.
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the stored format or the meaning of a key changes.
+_CACHE_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def cache_enabled() -> bool:
+    """Return whether the transcript cache is enabled."""
+    return os.environ.get(CACHE_ENV_VAR) != "0"
+
+
+def cache_key(
+    audio: AudioInput,
+    model_size: str,
+    language: Optional[str],
+    beam_size: int,
+    vad_filter: bool,
+    device: str,
+    compute_type: str,
+    batched: bool = False,
+) -> str:
+    """
+    Hash the audio content and the options that determine a transcript.
+
+    Args:
+        audio: Path to an audio file, or its samples in memory
+        model_size: Whisper model size
+        language: Language code, or None for auto-detect
+        beam_size: Beam width for decoding
+        vad_filter: Whether non-speech audio is skipped
+        device: Device the model runs on ("cpu" or "cuda")
+        compute_type: CTranslate2 compute type (e.g. "int8", "float16"),
+                      which slightly changes the decoded text
+        batched: Whether the transcript comes from batched inference, whose
+                 segment boundaries differ from sequential decoding
+
+    Returns:
+        Hex digest identifying the transcript.
+
+    Raises:
+        OSError: If the audio file cannot be read
+    """
+    digest = hashlib.blake2b()
+    options = (
+        f"{_CACHE_VERSION}\0{model_size}\0{language}\0{beam_size}\0{vad_filter}"
+        f"\0{device}\0{compute_type}\0{batched}"
+    )
+    digest.update(options.encode("utf-8"))
+
+    if isinstance(audio, np.ndarray):
+        digest.update(f"\0{audio.dtype.str}\0".encode("ascii"))
+        digest.update(np.ascontiguousarray(audio).data)
+    else:
+        digest.update(b"\0file\0")
+        with open(audio, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def load_transcript(key: str) -> Optional[list[TranscriptSegment]]:
+    """
+    Return a cached transcript, or None if missing or unreadable.
+
+    A hit refreshes the entry's modification time, which is what eviction
+    orders by.
+    """
+    cache_path = _cache_dir() / f"{key}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            segments = [
+                TranscriptSegment(start=start, end=end, text=text)
+                for start, end, text in json.load(f)["segments"]
+            ]
+        os.utime(cache_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return segments
+
+
+def store_transcript(key: str, segments: list[TranscriptSegment]) -> None:
+    """
+    Store a transcript in the cache, evicting old entries if it is too big.
+
+    The entry is written atomically (see scripts.disk_cache.write_entry).
+    Failures are ignored since the cache is only an optimization.
+    """
+    cache_dir = _cache_dir()
+    try:
+        data = {"segments": [[s.start, s.end, s.text] for s in segments]}
+        write_entry(cache_dir / f"{key}.json", data)
+        evict(cache_dir, CACHE_MAX_BYTES)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cached transcripts."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ai-video-editor" / "transcripts"
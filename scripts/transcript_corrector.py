@@ -1,10 +1,16 @@
 """Module for correcting transcripts with LLM assistance."""
 
 import re
+from dataclasses import replace
 
 from scripts.transcription import TranscriptSegment
 
 
+# Pattern to match lines like: [0] 0.0-2.5: Hello, world!
+# or [0]  0.0 - 2.5:  Hello, world! (with extra whitespace)
+_SEGMENT_RE = re.compile(r"\[(\d+)\]\s*[\d.]+\s*-\s*[\d.]+\s*:\s*(.+)")
+
+
 def format_for_review(
     segments: list[TranscriptSegment], context: str | None = None
 ) -> str:
@@ -54,19 +60,16 @@ def parse_corrected_transcript(
     if not corrected_text or not corrected_text.strip():
         raise ValueError("Corrected text cannot be empty")
 
-    # Pattern to match lines like: [0] 0.0-2.5: Hello, world!
-    # or [0]  0.0 - 2.5:  Hello, world! (with extra whitespace)
-    pattern = r"\[(\d+)\]\s*[\d.]+\s*-\s*[\d.]+\s*:\s*(.+)"
-
     result = []
-    lines = corrected_text.strip().split("\n")
 
-    for line in lines:
+    # Each line is stripped and blank lines skipped, so the text as a whole
+    # needs no strip() copy first
+    for line in corrected_text.split("\n"):
         line = line.strip()
         if not line:
             continue
 
-        match = re.match(pattern, line)
+        match = _SEGMENT_RE.match(line)
         if match:
             index = int(match.group(1))
             text = match.group(2).strip()
@@ -98,7 +101,8 @@ def correct_transcript(
         corrections: Dictionary mapping segment indices to corrected text
 
     Returns:
-        New list of TranscriptSegment objects with corrections applied
+        New list of TranscriptSegment objects with corrections applied.
+        Segments without a correction are the input objects themselves.
 
     Raises:
         KeyError: If correction index is invalid (out of range or negative)
@@ -108,20 +112,10 @@ def correct_transcript(
         if index < 0 or index >= len(segments):
             raise KeyError(f"Invalid segment index: {index}")
 
-    # Create new segments with corrections applied
-    result = []
-    for i, segment in enumerate(segments):
-        if i in corrections:
-            text = corrections[i]
-        else:
-            text = segment.text
-
-        result.append(
-            TranscriptSegment(
-                start=segment.start,
-                end=segment.end,
-                text=text,
-            )
-        )
+    # Copy the list, replacing only the corrected segments. Uncorrected
+    # segments are shared with the input rather than copied.
+    result = list(segments)
+    for index, text in corrections.items():
+        result[index] = replace(segments[index], text=text)
 
     return result
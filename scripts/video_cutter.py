@@ -5,9 +5,13 @@ It uses FFmpeg's filter_complex for few segments, or concat demuxer for many seg
 to avoid memory exhaustion.
 """
 
+import functools
+import operator
 import os
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import ffmpeg  # type: ignore[import-untyped]
@@ -20,6 +24,15 @@ from scripts.exceptions import EDLValidationError, VideoCuttingError
 # For > this many segments, use concat demuxer (memory-efficient for many segments).
 CONCAT_DEMUXER_THRESHOLD = 5
 
+# Upper bound on concurrent per-segment ffmpeg cuts, to avoid disk thrashing
+MAX_CUT_WORKERS = 8
+
+# Upper bound on segments cut by one ffmpeg process, each an open input
+MAX_SEGMENTS_PER_CUT = 32
+
+# Bytes of the ffmpeg log kept for error reporting when a command fails
+_STDERR_TAIL_BYTES = 64 * 1024
+
 
 def cut_video(
     video_path: str,
@@ -30,7 +43,8 @@ def cut_video(
     Cut a video based on an Edit Decision List.
 
     Takes a video file and an EDL, then produces a new video containing
-    only the segments marked as KEEP, concatenated in order.
+    only the segments marked as KEEP, concatenated in order of start time
+    (the order adjust_srt_for_edl assumes).
 
     Args:
         video_path: Path to the input video file
@@ -46,12 +60,12 @@ def cut_video(
         EDLValidationError: If EDL is invalid for cutting
         VideoCuttingError: If FFmpeg fails to cut the video
     """
-    # Validate input file exists
-    if not os.path.exists(video_path):
+    # Validate input file exists (a directory would only fail later in ffmpeg)
+    if not os.path.isfile(video_path):
         raise FileNotFoundError(f"Video file not found: {video_path}")
 
-    # Validate EDL before cutting
-    _validate_edl_for_cutting(edl)
+    # Validate EDL before cutting, getting the KEEP segments in time order
+    keep_segments = _validate_edl_for_cutting(edl)
 
     # Determine output path
     if output_path is None:
@@ -62,9 +76,6 @@ def cut_video(
         # Check if ffmpeg is available
         _check_ffmpeg_available()
 
-        # Get only the KEEP segments
-        keep_segments = edl.keep_segments
-
         # Choose approach based on segment count
         if _should_use_concat_demuxer(len(keep_segments)):
             # Use concat demuxer for many segments (memory-efficient)
@@ -74,9 +85,8 @@ def cut_video(
             _cut_video_with_filter_complex(video_path, keep_segments, output_path)
 
     except subprocess.CalledProcessError as e:
-        stderr = e.stderr.decode("utf-8") if e.stderr else "Unknown error"
         raise VideoCuttingError(
-            f"Failed to cut video {video_path}: {stderr}"
+            f"Failed to cut video {video_path}: {_ffmpeg_error(e)}"
         ) from e
     except Exception as e:
         if isinstance(e, (EDLValidationError, VideoCuttingError, FileNotFoundError)):
@@ -88,6 +98,42 @@ def cut_video(
     return output_path
 
 
+def cut_videos(
+    jobs: list[tuple[str, EditDecisionList, Optional[str]]],
+    max_workers: Optional[int] = None,
+) -> list[str]:
+    """
+    Cut several videos concurrently.
+
+    Each job goes through cut_video() on a worker thread. The threads only
+    wait on ffmpeg processes, and ffmpeg is itself multithreaded, so by
+    default half the CPUs' worth of videos are cut at once.
+
+    Args:
+        jobs: (video_path, edl, output_path) for each video, as for cut_video()
+        max_workers: Number of videos cut at once. Defaults to half the CPUs.
+
+    Returns:
+        Paths to the edited video files, in the same order as jobs
+
+    Raises:
+        FileNotFoundError: If a video file doesn't exist
+        EDLValidationError: If an EDL is invalid for cutting
+        VideoCuttingError: If FFmpeg fails to cut a video
+    """
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) // 2
+    max_workers = max(1, min(max_workers, len(jobs)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            return list(executor.map(lambda job: cut_video(*job), jobs))
+        except BaseException:
+            # Don't start the remaining videos once one has failed
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
 def adjust_srt_for_edl(
     srt_path: str,
     edl: EditDecisionList,
@@ -124,7 +170,7 @@ def adjust_srt_for_edl(
         raise FileNotFoundError(f"SRT file not found: {srt_path}")
 
     # Get KEEP segments sorted by start time
-    keep_segments = sorted(edl.keep_segments, key=lambda s: s.start)
+    keep_segments = sorted(edl.keep_segments, key=operator.attrgetter("start"))
 
     # Calculate cumulative removed time before each KEEP segment
     # This is the total time of gaps/REMOVE segments before each KEEP segment
@@ -251,7 +297,7 @@ def _build_ffmpeg_filter(keep_segments: list[EditSegment]) -> str:
     return ";".join(filter_parts)
 
 
-def _validate_edl_for_cutting(edl: EditDecisionList) -> None:
+def _validate_edl_for_cutting(edl: EditDecisionList) -> list[EditSegment]:
     """
     Validate an EDL before cutting.
 
@@ -264,6 +310,9 @@ def _validate_edl_for_cutting(edl: EditDecisionList) -> None:
     Args:
         edl: EditDecisionList to validate
 
+    Returns:
+        The KEEP segments sorted by start time
+
     Raises:
         EDLValidationError: If validation fails
     """
@@ -299,7 +348,7 @@ def _validate_edl_for_cutting(edl: EditDecisionList) -> None:
 
     # Check for overlapping KEEP segments
     # Sort by start time for overlap detection
-    sorted_segments = sorted(keep_segments, key=lambda s: s.start)
+    sorted_segments = sorted(keep_segments, key=operator.attrgetter("start"))
     for i in range(len(sorted_segments) - 1):
         current = sorted_segments[i]
         next_seg = sorted_segments[i + 1]
@@ -309,6 +358,8 @@ def _validate_edl_for_cutting(edl: EditDecisionList) -> None:
                 f"[{current.start}-{current.end}] and [{next_seg.start}-{next_seg.end}]"
             )
 
+    return sorted_segments
+
 
 def get_video_duration(video_path: str) -> float:
     """
@@ -355,28 +406,22 @@ def get_video_duration(video_path: str) -> float:
         ) from e
 
 
+@functools.lru_cache(maxsize=1)
 def _check_ffmpeg_available() -> None:
     """
     Check if ffmpeg binary is available in the system.
 
+    Only scans PATH (no subprocess), and the result is memoized so repeated
+    cuts skip the check entirely. A failed check is not cached.
+
     Raises:
         VideoCuttingError: If ffmpeg is not found
     """
-    try:
-        # Discard all output - we only care if the command succeeds
-        subprocess.run(
-            ["ffmpeg", "-version"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=True,
-        )
-    except FileNotFoundError:
+    if shutil.which("ffmpeg") is None:
         raise VideoCuttingError(
             "ffmpeg is not installed or not found in PATH. "
             "Please install ffmpeg to cut videos."
         )
-    except subprocess.CalledProcessError:
-        raise VideoCuttingError("ffmpeg check failed")
 
 
 def _should_use_concat_demuxer(segment_count: int) -> bool:
@@ -444,30 +489,54 @@ def _cut_segment_to_file(
     Raises:
         VideoCuttingError: If FFmpeg fails to cut the segment
     """
-    duration = segment.end - segment.start
+    _cut_segments_to_files(video_path, [segment], [output_path])
 
-    cmd = [
-        "ffmpeg",
-        "-y",  # Overwrite output
-        "-ss", str(segment.start),  # Seek position (before -i for input seeking)
-        "-i", video_path,
-        "-t", str(duration),  # Duration to copy
-        "-c", "copy",  # Stream copy, no re-encoding
-        output_path,
-    ]
+
+def _cut_segments_to_files(
+    video_path: str,
+    segments: list[EditSegment],
+    output_paths: list[str],
+) -> None:
+    """
+    Cut several segments from video to files with a single FFmpeg process.
+
+    The video is opened once per segment as a separately seeked input, and
+    each input is stream copied to its own output, so every segment is cut
+    exactly as _cut_segment_to_file would cut it but without a process spawn
+    per segment.
+
+    Args:
+        video_path: Path to source video
+        segments: Segments to cut
+        output_paths: Path for each segment's output file
+
+    Raises:
+        VideoCuttingError: If FFmpeg fails to cut the segments
+    """
+    cmd = ["ffmpeg", "-y"]  # Overwrite output
+    for segment in segments:
+        # Seek position (before -i for input seeking)
+        cmd += ["-ss", str(segment.start), "-i", video_path]
+
+    for i, (segment, output_path) in enumerate(zip(segments, output_paths)):
+        cmd += [
+            # Each output takes the first video and audio stream of its input
+            "-map", f"{i}:v:0?",
+            "-map", f"{i}:a:0?",
+            # Duration to copy, rounded to microseconds so float subtraction
+            # noise (5.200000000000001) doesn't leak into the command
+            "-t", str(round(segment.end - segment.start, 6)),
+            "-c", "copy",  # Stream copy, no re-encoding
+            output_path,
+        ]
 
     try:
-        # Discard FFmpeg output - we only care if the command succeeds.
-        # This avoids unbounded memory buffering for large video processing.
-        subprocess.run(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=True,
-        )
+        _run_ffmpeg(cmd)
     except subprocess.CalledProcessError as e:
+        ranges = ", ".join(f"[{s.start}-{s.end}]" for s in segments)
+        plural = "s" if len(segments) > 1 else ""
         raise VideoCuttingError(
-            f"Failed to cut segment [{segment.start}-{segment.end}]"
+            f"Failed to cut segment{plural} {ranges}: {_ffmpeg_error(e)}"
         ) from e
 
 
@@ -480,7 +549,9 @@ def _cut_video_with_concat_demuxer(
     Cut video using concat demuxer approach for memory efficiency.
 
     This approach:
-    1. Cuts each segment individually to a temp file using stream copy
+    1. Cuts each segment individually to a temp file using stream copy,
+       in batches of up to MAX_SEGMENTS_PER_CUT segments per ffmpeg process,
+       running up to MAX_CUT_WORKERS processes in parallel
     2. Writes a concat list file
     3. Concatenates all segments using concat demuxer with stream copy
     4. Cleans up temp files
@@ -497,18 +568,38 @@ def _cut_video_with_concat_demuxer(
         VideoCuttingError: If any FFmpeg operation fails
     """
     with tempfile.TemporaryDirectory() as temp_dir:
-        segment_files = []
+        segment_files = [
+            os.path.join(temp_dir, f"segment_{i}.mp4")
+            for i in range(len(keep_segments))
+        ]
 
-        # Step 1: Cut each segment to a temp file
-        for i, segment in enumerate(keep_segments):
-            segment_path = os.path.join(temp_dir, f"segment_{i}.mp4")
-            _cut_segment_to_file(video_path, segment, segment_path)
-            segment_files.append(segment_path)
+        # Step 1: Cut each segment to a temp file. The segments are split
+        # into contiguous batches, each cut by one ffmpeg process, and the
+        # batches run at once
+        max_workers = min(len(keep_segments), os.cpu_count() or 1, MAX_CUT_WORKERS)
+        batch_size = min(
+            -(-len(keep_segments) // max(1, max_workers)), MAX_SEGMENTS_PER_CUT
+        )
+        batches = range(0, len(keep_segments), batch_size)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            try:
+                list(
+                    executor.map(
+                        functools.partial(_cut_segments_to_files, video_path),
+                        [keep_segments[i : i + batch_size] for i in batches],
+                        [segment_files[i : i + batch_size] for i in batches],
+                    )
+                )
+            except BaseException:
+                # Don't start the remaining cuts once one has failed
+                executor.shutdown(cancel_futures=True)
+                raise
 
         # Step 2: Write concat list file
         concat_list_content = _build_concat_list(segment_files)
         concat_list_path = os.path.join(temp_dir, "concat_list.txt")
-        with open(concat_list_path, "w") as f:
+        # ffmpeg reads the list as UTF-8, whatever the locale's encoding
+        with open(concat_list_path, "w", encoding="utf-8") as f:
             f.write(concat_list_content)
 
         # Step 3: Concatenate all segments
@@ -523,17 +614,10 @@ def _cut_video_with_concat_demuxer(
         ]
 
         try:
-            # Discard FFmpeg output - we only care if the command succeeds.
-            # This avoids unbounded memory buffering for large video processing.
-            subprocess.run(
-                concat_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-            )
+            _run_ffmpeg(concat_cmd)
         except subprocess.CalledProcessError as e:
             raise VideoCuttingError(
-                f"Failed to concatenate segments"
+                f"Failed to concatenate segments: {_ffmpeg_error(e)}"
             ) from e
 
         # Step 4: Cleanup happens automatically via TemporaryDirectory context
@@ -572,12 +656,43 @@ def _cut_video_with_filter_complex(
         output_path,
     ]
 
-    # Run the ffmpeg command.
-    # Discard FFmpeg output - we only care if the command succeeds.
-    # This avoids unbounded memory buffering for large video processing.
-    subprocess.run(
-        cmd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        check=True,
-    )
+    # Run the ffmpeg command
+    _run_ffmpeg(cmd)
+
+
+def _run_ffmpeg(cmd: list[str]) -> None:
+    """
+    Run an ffmpeg command, keeping its log out of memory.
+
+    stderr goes to an anonymous temporary file rather than a pipe, so a long
+    encode's log neither accumulates in memory nor needs a reader thread.
+    The log is only read back, and only its tail, if ffmpeg fails.
+
+    Args:
+        cmd: Full ffmpeg argv
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails, with stderr set to
+            the last _STDERR_TAIL_BYTES of its log
+    """
+    with tempfile.TemporaryFile() as log:
+        try:
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=log,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            size = log.seek(0, os.SEEK_END)
+            log.seek(max(0, size - _STDERR_TAIL_BYTES))
+            e.stderr = log.read()
+            raise
+
+
+def _ffmpeg_error(error: subprocess.CalledProcessError) -> str:
+    """Return the ffmpeg log tail carried by a failed command, for messages."""
+    if not error.stderr:
+        return "Unknown error"
+    stderr: bytes = error.stderr
+    return stderr.decode("utf-8", errors="replace").strip()
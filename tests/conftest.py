@@ -1,5 +1,7 @@
 """Shared pytest fixtures for the test suite."""
 
+from pathlib import Path
+
 import pytest
 
 from scripts.transcription import TranscriptSegment
@@ -19,3 +21,11 @@ def sample_segments() -> list[TranscriptSegment]:
 def single_segment() -> TranscriptSegment:
     """Return a single sample transcript segment."""
     return TranscriptSegment(start=0.0, end=2.5, text="Hello, world!")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point XDG_CACHE_HOME at a per-test directory so on-disk caches never leak."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
@@ -4,10 +4,19 @@ import os
 import tempfile
 import wave
 from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from scripts.audio_extractor import extract_audio
+from scripts.audio_extractor import (
+    _check_ffmpeg_available,
+    _is_whisper_ready,
+    extract_audio,
+    extract_audio_batch,
+    extract_audio_to_array,
+)
 from scripts.exceptions import AudioExtractionError
 
 
@@ -15,6 +24,20 @@ from scripts.exceptions import AudioExtractionError
 TEST_VIDEO_PATH = "/home/gudmundur/ai-youtube/input/test_video.mov"
 
 
+def _fake_popen(
+    returncode: int = 0,
+    stderr_lines: list[bytes] | None = None,
+    stdout: bytes = b"",
+) -> MagicMock:
+    """Build a MagicMock standing in for a subprocess.Popen context manager."""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stderr = iter(stderr_lines or [])
+    process.stdout.read.return_value = stdout
+    process.wait.return_value = returncode
+    return process
+
+
 class TestExtractAudioBasic:
     """Basic unit tests for extract_audio function."""
 
@@ -37,6 +60,229 @@ class TestExtractAudioBasic:
             extract_audio(str(invalid_video))
 
 
+class TestExtractAudioCommand:
+    """Tests for the ffmpeg command issued by extract_audio."""
+
+    @pytest.fixture(autouse=True)
+    def source_needs_reencode(self) -> Generator[MagicMock, None, None]:
+        """Make the audio probe report a source that needs re-encoding."""
+        with patch(
+            "scripts.audio_extractor._is_whisper_ready", return_value=False
+        ) as mock_ready:
+            yield mock_ready
+
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_runs_single_ffmpeg_command(
+        self, mock_popen: MagicMock, mock_check: MagicMock, tmp_path: Path
+    ) -> None:
+        """extract_audio issues one ffmpeg call with the Whisper-friendly format."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"fake")
+        output = tmp_path / "out.wav"
+        mock_popen.return_value = _fake_popen()
+
+        result = extract_audio(str(video), str(output))
+
+        assert result == str(output)
+        mock_popen.assert_called_once()
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[0] == "ffmpeg"
+        assert cmd[cmd.index("-i") + 1] == str(video)
+        assert cmd[cmd.index("-acodec") + 1] == "pcm_s16le"
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert "-vn" in cmd
+        assert cmd[-1] == str(output)
+
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_stream_copies_whisper_ready_audio(
+        self,
+        mock_popen: MagicMock,
+        mock_check: MagicMock,
+        source_needs_reencode: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """extract_audio remuxes audio that is already 16kHz mono PCM."""
+        video = tmp_path / "video.mov"
+        video.write_bytes(b"fake")
+        source_needs_reencode.return_value = True
+        mock_popen.return_value = _fake_popen()
+
+        extract_audio(str(video), str(tmp_path / "out.wav"))
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-c:a") + 1] == "copy"
+        assert "-ar" not in cmd
+
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_ffmpeg_failure_raises_error_with_stderr(
+        self, mock_popen: MagicMock, mock_check: MagicMock, tmp_path: Path
+    ) -> None:
+        """extract_audio wraps ffmpeg failures in AudioExtractionError."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"fake")
+        mock_popen.return_value = _fake_popen(1, [b"Invalid data found\n"])
+
+        with pytest.raises(AudioExtractionError) as exc_info:
+            extract_audio(str(video), str(tmp_path / "out.wav"))
+
+        assert "Invalid data found" in str(exc_info.value)
+
+    @patch("scripts.audio_extractor._STDERR_TAIL_LINES", 2)
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_ffmpeg_failure_keeps_only_stderr_tail(
+        self, mock_popen: MagicMock, mock_check: MagicMock, tmp_path: Path
+    ) -> None:
+        """extract_audio only keeps the last stderr lines for the error message."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"fake")
+        mock_popen.return_value = _fake_popen(
+            1, [b"first warning\n", b"second warning\n", b"fatal error\n"]
+        )
+
+        with pytest.raises(AudioExtractionError) as exc_info:
+            extract_audio(str(video), str(tmp_path / "out.wav"))
+
+        assert "first warning" not in str(exc_info.value)
+        assert "second warning" in str(exc_info.value)
+        assert "fatal error" in str(exc_info.value)
+
+
+class TestIsWhisperReady:
+    """Tests for the ffprobe-based audio format check."""
+
+    @pytest.mark.parametrize(
+        "probe_output,expected",
+        [
+            ("codec_name=pcm_s16le\nsample_rate=16000\nchannels=1\n", True),
+            ("codec_name=aac\nsample_rate=48000\nchannels=2\n", False),
+            ("codec_name=pcm_s16le\nsample_rate=44100\nchannels=1\n", False),
+            ("", False),
+        ],
+    )
+    def test_detects_target_format(self, probe_output: str, expected: bool) -> None:
+        """_is_whisper_ready is True only for 16kHz mono pcm_s16le audio."""
+        with patch("scripts.audio_extractor.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=probe_output)
+
+            assert _is_whisper_ready("video.mov") is expected
+
+    def test_probe_failure_means_not_ready(self) -> None:
+        """_is_whisper_ready returns False when ffprobe cannot run."""
+        with patch(
+            "scripts.audio_extractor.subprocess.run", side_effect=FileNotFoundError
+        ):
+            assert _is_whisper_ready("video.mov") is False
+
+
+class TestExtractAudioToArray:
+    """Tests for extract_audio_to_array function."""
+
+    def test_video_not_found(self) -> None:
+        """extract_audio_to_array raises FileNotFoundError for a missing video."""
+        with pytest.raises(FileNotFoundError):
+            extract_audio_to_array("/path/to/nonexistent/video.mp4")
+
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_decodes_piped_pcm_to_float_array(
+        self, mock_popen: MagicMock, mock_check: MagicMock, tmp_path: Path
+    ) -> None:
+        """extract_audio_to_array converts s16le stdout into float32 samples."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"fake")
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+        mock_popen.return_value = _fake_popen(stdout=pcm)
+
+        samples = extract_audio_to_array(str(video))
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-f") + 1] == "s16le"
+        assert cmd[-1] == "pipe:1"
+        assert samples.dtype == np.float32
+        np.testing.assert_allclose(samples, [0.0, 0.5, -1.0])
+
+
+class TestExtractAudioBatch:
+    """Tests for extract_audio_batch function."""
+
+    def test_empty_list_raises_error(self) -> None:
+        """extract_audio_batch raises ValueError for an empty list."""
+        with pytest.raises(ValueError):
+            extract_audio_batch([])
+
+    def test_mismatched_output_paths_raises_error(self, tmp_path: Path) -> None:
+        """extract_audio_batch raises ValueError when output count differs."""
+        video = tmp_path / "a.mp4"
+        video.write_bytes(b"fake")
+
+        with pytest.raises(ValueError):
+            extract_audio_batch([str(video)], [])
+
+    def test_missing_video_raises_error(self, tmp_path: Path) -> None:
+        """extract_audio_batch raises FileNotFoundError if any video is missing."""
+        video = tmp_path / "a.mp4"
+        video.write_bytes(b"fake")
+
+        with pytest.raises(FileNotFoundError):
+            extract_audio_batch([str(video), str(tmp_path / "missing.mp4")])
+
+    @patch("scripts.audio_extractor._check_ffmpeg_available")
+    @patch("scripts.audio_extractor.subprocess.Popen")
+    def test_single_ffmpeg_call_maps_each_input(
+        self, mock_popen: MagicMock, mock_check: MagicMock, tmp_path: Path
+    ) -> None:
+        """extract_audio_batch issues one ffmpeg call with one output per input."""
+        mock_popen.return_value = _fake_popen()
+        videos = []
+        for name in ("a.mp4", "b.mp4"):
+            video = tmp_path / name
+            video.write_bytes(b"fake")
+            videos.append(str(video))
+        outputs = [str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]
+
+        result = extract_audio_batch(videos, outputs)
+
+        assert result == outputs
+        mock_popen.assert_called_once()
+        cmd = mock_popen.call_args[0][0]
+        assert cmd.count("-i") == 2
+        assert cmd[cmd.index("0:a:0") + 1:].count(outputs[0]) == 1
+        assert "1:a:0" in cmd
+        assert cmd[-1] == outputs[1]
+
+
+class TestCheckFfmpegAvailable:
+    """Tests for the memoized ffmpeg availability check."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Generator[None, None, None]:
+        """Reset the memoized check around each test."""
+        _check_ffmpeg_available.cache_clear()
+        yield
+        _check_ffmpeg_available.cache_clear()
+
+    def test_missing_ffmpeg_raises_error(self) -> None:
+        """_check_ffmpeg_available raises AudioExtractionError when not on PATH."""
+        with patch("scripts.audio_extractor.shutil.which", return_value=None):
+            with pytest.raises(AudioExtractionError):
+                _check_ffmpeg_available()
+
+    def test_check_is_memoized(self) -> None:
+        """_check_ffmpeg_available only scans PATH once when ffmpeg is found."""
+        with patch(
+            "scripts.audio_extractor.shutil.which", return_value="/usr/bin/ffmpeg"
+        ) as mock_which:
+            _check_ffmpeg_available()
+            _check_ffmpeg_available()
+
+        assert mock_which.call_count == 1
+
+
 @pytest.mark.slow
 class TestExtractAudioIntegration:
     """Integration tests using real video file."""
@@ -7,22 +7,25 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from scripts.cli import _build_parser, _fast_parse, main, parse_args
+from scripts.exceptions import (
+    AudioExtractionError,
+    TranscriptionError,
+    VideoCuttingError,
+)
+
 
 class TestCliArgumentParsing:
     """Tests for CLI argument parsing."""
 
     def test_parse_args_with_video_path_only(self) -> None:
         """CLI accepts video path as positional argument."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4"])
 
         assert args.video == "video.mp4"
 
     def test_parse_args_with_output_flag(self) -> None:
         """CLI accepts --output flag for custom output path."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "--output", "subs.srt"])
 
         assert args.video == "video.mp4"
@@ -30,24 +33,18 @@ class TestCliArgumentParsing:
 
     def test_parse_args_with_model_flag(self) -> None:
         """CLI accepts --model flag for whisper model size."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "--model", "small"])
 
         assert args.model == "small"
 
     def test_parse_args_with_language_flag(self) -> None:
         """CLI accepts --language flag for language code."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "--language", "en"])
 
         assert args.language == "en"
 
     def test_parse_args_with_all_flags(self) -> None:
         """CLI accepts all flags together."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "video.mp4",
             "--output", "subs.srt",
@@ -62,8 +59,6 @@ class TestCliArgumentParsing:
 
     def test_parse_args_default_values(self) -> None:
         """CLI has correct default values for optional arguments."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4"])
 
         assert args.output is None
@@ -72,28 +67,60 @@ class TestCliArgumentParsing:
 
     def test_parse_args_missing_video_path_raises_error(self) -> None:
         """CLI raises error when video path is not provided."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit):
             parse_args([])
 
 
+class TestCliFastParse:
+    """Tests that the fast-path parser agrees with the full argparse parser."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["subtitle", "video.mp4"],
+            ["subtitle", "video.mp4", "-o", "out.vtt", "-f", "vtt"],
+            ["subtitle", "-m", "tiny", "video.mp4", "--language", "en"],
+            ["edit", "video.mp4", "--ai", "--auto", "-t", "video.srt"],
+            ["edit", "video.mp4", "--output", "video.edl.json"],
+            ["apply-edl", "video.mp4", "video.edl.json"],
+            ["apply-edl", "video.mp4", "video.edl.json", "-o", "out.mp4", "--srt", "v.srt"],
+        ],
+    )
+    def test_fast_parse_matches_argparse(self, args: list[str]) -> None:
+        """_fast_parse produces the same namespace as argparse."""
+        assert _fast_parse(args) == _build_parser().parse_args(args)
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["subtitle", "video.mp4", "--help"],
+            ["subtitle", "video.mp4", "--model", "huge"],
+            ["subtitle", "video.mp4", "--output=out.srt"],
+            ["subtitle", "video.mp4", "-o"],
+            ["subtitle"],
+            ["apply-edl", "video.mp4"],
+            ["edit", "a.mp4", "b.mp4"],
+            ["--help"],
+            [],
+        ],
+    )
+    def test_fast_parse_falls_back_for_help_and_errors(self, args: list[str]) -> None:
+        """_fast_parse returns None for anything argparse must handle."""
+        assert _fast_parse(args) is None
+
+
 class TestCliModelChoices:
     """Tests for CLI model choices validation."""
 
     @pytest.mark.parametrize("model", ["tiny", "base", "small", "medium", "large-v2"])
     def test_parse_args_accepts_valid_model_choices(self, model: str) -> None:
         """CLI accepts all valid model choices."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "--model", model])
 
         assert args.model == model
 
     def test_parse_args_rejects_invalid_model_choice(self) -> None:
         """CLI rejects invalid model choice."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit):
             parse_args(["video.mp4", "--model", "invalid-model"])
 
@@ -105,12 +132,10 @@ class TestCliMainFunction:
         self, tmp_path: Path
     ) -> None:
         """main() calls process_video with parsed arguments."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             exit_code = main([str(video_path)])
@@ -128,13 +153,11 @@ class TestCliMainFunction:
         self, tmp_path: Path
     ) -> None:
         """main() passes output path to process_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         output_path = str(tmp_path / "custom.srt")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = output_path
 
             main([str(video_path), "--output", output_path])
@@ -146,12 +169,10 @@ class TestCliMainFunction:
         self, tmp_path: Path
     ) -> None:
         """main() passes model size to process_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             main([str(video_path), "--model", "large-v2"])
@@ -163,12 +184,10 @@ class TestCliMainFunction:
         self, tmp_path: Path
     ) -> None:
         """main() passes language to process_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             main([str(video_path), "--language", "en"])
@@ -177,6 +196,78 @@ class TestCliMainFunction:
         assert call_kwargs[1]["language"] == "en"
 
 
+class TestCliSubtitleGlob:
+    """Tests for running the subtitle command over a glob of videos."""
+
+    def test_glob_dispatches_to_process_videos(self, tmp_path: Path) -> None:
+        """main() batch-processes all videos matching a glob pattern."""
+        for name in ("b.mp4", "a.mp4"):
+            (tmp_path / name).write_bytes(b"dummy")
+
+        with patch("scripts.pipeline.process_videos") as mock_batch:
+            mock_batch.return_value = [
+                str(tmp_path / "a.srt"),
+                str(tmp_path / "b.srt"),
+            ]
+
+            exit_code = main([str(tmp_path / "*.mp4")])
+
+        assert exit_code == 0
+        mock_batch.assert_called_once_with(
+            [str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")],
+            model_size="large-v2",
+            language="is",
+            subtitle_format="srt",
+        )
+
+    def test_glob_with_single_match_uses_process_video(self, tmp_path: Path) -> None:
+        """main() falls back to process_video when a glob matches one file."""
+        (tmp_path / "only.mp4").write_bytes(b"dummy")
+
+        with patch("scripts.pipeline.process_video") as mock_process:
+            mock_process.return_value = str(tmp_path / "only.srt")
+
+            exit_code = main([str(tmp_path / "*.mp4")])
+
+        assert exit_code == 0
+        assert mock_process.call_args[0][0] == str(tmp_path / "only.mp4")
+
+    def test_existing_file_with_glob_characters_is_not_expanded(
+        self, tmp_path: Path
+    ) -> None:
+        """main() processes an existing file whose name looks like a glob."""
+        video_path = tmp_path / "clip[1].mp4"
+        video_path.write_bytes(b"dummy")
+
+        with patch("scripts.pipeline.process_video") as mock_process:
+            mock_process.return_value = str(tmp_path / "clip[1].srt")
+
+            exit_code = main([str(video_path)])
+
+        assert exit_code == 0
+        assert mock_process.call_args[0][0] == str(video_path)
+
+    def test_glob_without_matches_returns_error(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """main() returns exit code 1 when a glob matches nothing."""
+        exit_code = main([str(tmp_path / "*.mp4")])
+
+        assert exit_code == 1
+        assert "No video files match" in capsys.readouterr().err
+
+    def test_glob_with_output_returns_error(self, tmp_path: Path) -> None:
+        """main() rejects --output when a glob matches several videos."""
+        for name in ("a.mp4", "b.mp4"):
+            (tmp_path / name).write_bytes(b"dummy")
+
+        with patch("scripts.pipeline.process_videos") as mock_batch:
+            exit_code = main([str(tmp_path / "*.mp4"), "-o", "out.srt"])
+
+        assert exit_code == 1
+        mock_batch.assert_not_called()
+
+
 class TestCliProgressMessages:
     """Tests for CLI progress messages."""
 
@@ -184,12 +275,10 @@ class TestCliProgressMessages:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() prints processing message before starting."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             main([str(video_path)])
@@ -201,13 +290,11 @@ class TestCliProgressMessages:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() prints success message with output path."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         output_path = str(tmp_path / "test.srt")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = output_path
 
             main([str(video_path)])
@@ -224,8 +311,6 @@ class TestCliErrorHandling:
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() returns exit code 1 when video file not found."""
-        from scripts.cli import main
-
         exit_code = main(["/nonexistent/video.mp4"])
 
         assert exit_code == 1
@@ -234,8 +319,6 @@ class TestCliErrorHandling:
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() prints user-friendly error for file not found."""
-        from scripts.cli import main
-
         main(["/nonexistent/video.mp4"])
 
         captured = capsys.readouterr()
@@ -246,13 +329,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() returns exit code 1 on audio extraction error."""
-        from scripts.cli import main
-        from scripts.exceptions import AudioExtractionError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.side_effect = AudioExtractionError("FFmpeg failed")
 
             exit_code = main([str(video_path)])
@@ -263,13 +343,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() prints user-friendly error for audio extraction failure."""
-        from scripts.cli import main
-        from scripts.exceptions import AudioExtractionError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.side_effect = AudioExtractionError("FFmpeg failed")
 
             main([str(video_path)])
@@ -281,13 +358,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() returns exit code 1 on transcription error."""
-        from scripts.cli import main
-        from scripts.exceptions import TranscriptionError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.side_effect = TranscriptionError("Whisper failed")
 
             exit_code = main([str(video_path)])
@@ -298,13 +372,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() prints user-friendly error for transcription failure."""
-        from scripts.cli import main
-        from scripts.exceptions import TranscriptionError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.side_effect = TranscriptionError("Whisper failed")
 
             main([str(video_path)])
@@ -316,12 +387,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() returns exit code 1 on ValueError (empty transcription)."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.side_effect = ValueError("Empty transcription")
 
             exit_code = main([str(video_path)])
@@ -332,12 +401,10 @@ class TestCliErrorHandling:
         self, tmp_path: Path
     ) -> None:
         """main() returns exit code 0 on successful processing."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             exit_code = main([str(video_path)])
@@ -350,8 +417,6 @@ class TestCliHelpMessage:
 
     def test_parse_args_shows_help_with_h_flag(self) -> None:
         """CLI shows help message with -h flag."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit) as exc_info:
             parse_args(["-h"])
 
@@ -359,8 +424,6 @@ class TestCliHelpMessage:
 
     def test_parse_args_shows_help_with_help_flag(self) -> None:
         """CLI shows help message with --help flag."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit) as exc_info:
             parse_args(["--help"])
 
@@ -406,30 +469,41 @@ class TestCliModuleExecution:
         assert result.returncode == 1
         assert "Error:" in result.stderr
 
+    def test_importing_cli_does_not_load_pipeline_dependencies(self) -> None:
+        """Importing scripts.cli does not import faster-whisper or anthropic."""
+        import subprocess
+
+        code = (
+            "import sys, scripts.cli; "
+            "print(any(m in sys.modules for m in ('faster_whisper', 'anthropic')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "False"
+
 
 class TestCliShortFlags:
     """Tests for CLI short flag aliases."""
 
     def test_parse_args_accepts_short_output_flag(self) -> None:
         """CLI accepts -o as short form of --output."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "-o", "subs.srt"])
 
         assert args.output == "subs.srt"
 
     def test_parse_args_accepts_short_model_flag(self) -> None:
         """CLI accepts -m as short form of --model."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "-m", "small"])
 
         assert args.model == "small"
 
     def test_parse_args_accepts_short_language_flag(self) -> None:
         """CLI accepts -l as short form of --language."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "-l", "en"])
 
         assert args.language == "en"
@@ -440,8 +514,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_subtitle_subcommand_accepts_video_path(self) -> None:
         """CLI subtitle subcommand accepts video path as positional argument."""
-        from scripts.cli import parse_args
-
         args = parse_args(["subtitle", "video.mp4"])
 
         assert args.command == "subtitle"
@@ -449,8 +521,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_subtitle_subcommand_accepts_all_flags(self) -> None:
         """CLI subtitle subcommand accepts all existing flags."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "subtitle", "video.mp4",
             "--output", "subs.srt",
@@ -468,8 +538,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_edit_subcommand_accepts_video_path(self) -> None:
         """CLI edit subcommand accepts video path as positional argument."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4"])
 
         assert args.command == "edit"
@@ -477,8 +545,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_edit_subcommand_accepts_output_flag(self) -> None:
         """CLI edit subcommand accepts --output flag for EDL path."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4", "--output", "cuts.edl.json"])
 
         assert args.command == "edit"
@@ -486,16 +552,12 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_edit_subcommand_accepts_short_output_flag(self) -> None:
         """CLI edit subcommand accepts -o as short form of --output."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4", "-o", "cuts.edl.json"])
 
         assert args.output == "cuts.edl.json"
 
     def test_parse_args_edit_subcommand_accepts_transcript_flag(self) -> None:
         """CLI edit subcommand accepts --transcript flag for existing transcript."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4", "--transcript", "video.srt"])
 
         assert args.command == "edit"
@@ -503,16 +565,12 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_edit_subcommand_accepts_short_transcript_flag(self) -> None:
         """CLI edit subcommand accepts -t as short form of --transcript."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4", "-t", "video.srt"])
 
         assert args.transcript == "video.srt"
 
     def test_parse_args_edit_subcommand_accepts_auto_flag(self) -> None:
         """CLI edit subcommand accepts --auto flag for auto-apply."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4", "--auto"])
 
         assert args.command == "edit"
@@ -520,16 +578,12 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_edit_subcommand_auto_default_is_false(self) -> None:
         """CLI edit subcommand defaults --auto to False."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4"])
 
         assert args.auto is False
 
     def test_parse_args_edit_subcommand_default_values(self) -> None:
         """CLI edit subcommand has correct default values."""
-        from scripts.cli import parse_args
-
         args = parse_args(["edit", "video.mp4"])
 
         assert args.output is None
@@ -538,8 +592,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_apply_edl_subcommand_accepts_video_and_edl(self) -> None:
         """CLI apply-edl subcommand accepts video path and EDL path."""
-        from scripts.cli import parse_args
-
         args = parse_args(["apply-edl", "video.mp4", "video.edl.json"])
 
         assert args.command == "apply-edl"
@@ -548,8 +600,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_apply_edl_subcommand_accepts_output_flag(self) -> None:
         """CLI apply-edl subcommand accepts --output flag for output video."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "apply-edl", "video.mp4", "video.edl.json",
             "--output", "video_edited.mp4",
@@ -560,8 +610,6 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_apply_edl_subcommand_accepts_short_output_flag(self) -> None:
         """CLI apply-edl subcommand accepts -o as short form of --output."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "apply-edl", "video.mp4", "video.edl.json",
             "-o", "video_edited.mp4",
@@ -571,16 +619,12 @@ class TestCliSubcommandStructure:
 
     def test_parse_args_apply_edl_subcommand_default_output_is_none(self) -> None:
         """CLI apply-edl subcommand defaults output to None."""
-        from scripts.cli import parse_args
-
         args = parse_args(["apply-edl", "video.mp4", "video.edl.json"])
 
         assert args.output is None
 
     def test_parse_args_apply_edl_missing_edl_path_raises_error(self) -> None:
         """CLI apply-edl raises error when EDL path is not provided."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit):
             parse_args(["apply-edl", "video.mp4"])
 
@@ -590,8 +634,6 @@ class TestCliBackwardCompatibility:
 
     def test_parse_args_bare_video_path_defaults_to_subtitle(self) -> None:
         """CLI treats bare video path as subtitle subcommand."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4"])
 
         assert args.command == "subtitle"
@@ -599,8 +641,6 @@ class TestCliBackwardCompatibility:
 
     def test_parse_args_bare_video_path_with_all_flags(self) -> None:
         """CLI accepts all flags with bare video path (backward compatibility)."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "video.mp4",
             "--output", "subs.srt",
@@ -618,8 +658,6 @@ class TestCliBackwardCompatibility:
 
     def test_parse_args_bare_video_path_with_short_flags(self) -> None:
         """CLI accepts short flags with bare video path."""
-        from scripts.cli import parse_args
-
         args = parse_args(["video.mp4", "-o", "subs.srt", "-m", "small", "-l", "en"])
 
         assert args.command == "subtitle"
@@ -697,24 +735,18 @@ class TestCliFormatFlag:
 
     def test_parse_args_with_format_flag(self) -> None:
         """CLI accepts --format flag for subtitle format."""
-        from scripts.cli import parse_args
-
         args = parse_args(["subtitle", "video.mp4", "--format", "vtt"])
 
         assert args.format == "vtt"
 
     def test_parse_args_with_short_format_flag(self) -> None:
         """CLI accepts -f as short form of --format."""
-        from scripts.cli import parse_args
-
         args = parse_args(["subtitle", "video.mp4", "-f", "vtt"])
 
         assert args.format == "vtt"
 
     def test_parse_args_format_default_is_srt(self) -> None:
         """CLI defaults to srt format."""
-        from scripts.cli import parse_args
-
         args = parse_args(["subtitle", "video.mp4"])
 
         assert args.format == "srt"
@@ -722,16 +754,12 @@ class TestCliFormatFlag:
     @pytest.mark.parametrize("format_value", ["srt", "vtt"])
     def test_parse_args_accepts_valid_format_choices(self, format_value: str) -> None:
         """CLI accepts all valid format choices."""
-        from scripts.cli import parse_args
-
         args = parse_args(["subtitle", "video.mp4", "--format", format_value])
 
         assert args.format == format_value
 
     def test_parse_args_rejects_invalid_format_choice(self) -> None:
         """CLI rejects invalid format choice."""
-        from scripts.cli import parse_args
-
         with pytest.raises(SystemExit):
             parse_args(["subtitle", "video.mp4", "--format", "invalid"])
 
@@ -739,12 +767,10 @@ class TestCliFormatFlag:
         self, tmp_path: Path
     ) -> None:
         """main() passes format to process_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.vtt")
 
             main([str(video_path), "--format", "vtt"])
@@ -756,12 +782,10 @@ class TestCliFormatFlag:
         self, tmp_path: Path
     ) -> None:
         """main() passes default format (srt) to process_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.process_video") as mock_process:
+        with patch("scripts.pipeline.process_video") as mock_process:
             mock_process.return_value = str(tmp_path / "test.srt")
 
             main([str(video_path)])
@@ -790,12 +814,10 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() edit subcommand calls edit_video with parsed arguments."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": str(tmp_path / "test.edl.json"),
                 "transcript_for_review": "transcript text",
@@ -819,13 +841,11 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() edit subcommand passes output path to edit_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = str(tmp_path / "custom.edl.json")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": edl_path,
                 "transcript_for_review": "transcript text",
@@ -842,13 +862,11 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() edit subcommand passes transcript path to edit_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         transcript_path = str(tmp_path / "existing.srt")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": str(tmp_path / "test.edl.json"),
                 "transcript_for_review": "transcript text",
@@ -865,12 +883,10 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() edit subcommand passes auto flag to edit_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": str(tmp_path / "test.edl.json"),
                 "transcript_for_review": "transcript text",
@@ -888,12 +904,10 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() edit subcommand passes --ai flag to edit_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": str(tmp_path / "test.edl.json"),
                 "transcript_for_review": "transcript text",
@@ -911,13 +925,12 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() edit subcommand handles LLMClientError gracefully."""
-        from scripts.cli import main
         from scripts.llm_client import LLMClientError
 
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.side_effect = LLMClientError("ANTHROPIC_API_KEY not set")
 
             exit_code = main(["edit", str(video_path), "--ai"])
@@ -931,13 +944,11 @@ class TestCliEditSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() edit subcommand prints EDL path on success."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = str(tmp_path / "test.edl.json")
 
-        with patch("scripts.cli.edit_video") as mock_edit:
+        with patch("scripts.edit_pipeline.edit_video") as mock_edit:
             mock_edit.return_value = {
                 "edl_path": edl_path,
                 "transcript_for_review": "transcript text",
@@ -954,8 +965,6 @@ class TestCliEditSubcommandExecution:
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() edit subcommand returns exit code 1 when video not found."""
-        from scripts.cli import main
-
         exit_code = main(["edit", "/nonexistent/video.mp4"])
 
         assert exit_code == 1
@@ -964,8 +973,6 @@ class TestCliEditSubcommandExecution:
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() edit subcommand prints error when video not found."""
-        from scripts.cli import main
-
         main(["edit", "/nonexistent/video.mp4"])
 
         captured = capsys.readouterr()
@@ -979,14 +986,12 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() apply-edl subcommand calls apply_edl_to_video with parsed arguments."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{"source_video": "test.mp4", "segments": [], "total_duration": 120.0}')
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.return_value = {
                 "video_path": str(tmp_path / "test_edited.mp4"),
                 "srt_path": str(tmp_path / "test_edited.srt"),
@@ -1006,15 +1011,13 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path
     ) -> None:
         """main() apply-edl subcommand passes output path to apply_edl_to_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
         output_path = str(tmp_path / "custom_output.mp4")
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.return_value = {
                 "video_path": output_path,
                 "srt_path": str(tmp_path / "custom_output.srt"),
@@ -1029,15 +1032,13 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand prints output video path on success."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
         output_path = str(tmp_path / "test_edited.mp4")
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.return_value = {
                 "video_path": output_path,
                 "srt_path": str(tmp_path / "test_edited.srt"),
@@ -1052,8 +1053,6 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand returns exit code 1 when video not found."""
-        from scripts.cli import main
-
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
 
@@ -1065,8 +1064,6 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand returns exit code 1 when EDL not found."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
 
@@ -1078,8 +1075,6 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand prints error when file not found."""
-        from scripts.cli import main
-
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
 
@@ -1092,15 +1087,12 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand returns exit code 1 on video cutting error."""
-        from scripts.cli import main
-        from scripts.exceptions import VideoCuttingError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.side_effect = VideoCuttingError("FFmpeg failed")
 
             exit_code = main(["apply-edl", str(video_path), str(edl_path)])
@@ -1111,15 +1103,12 @@ class TestCliApplyEdlSubcommandExecution:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand prints error on video cutting error."""
-        from scripts.cli import main
-        from scripts.exceptions import VideoCuttingError
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.side_effect = VideoCuttingError("FFmpeg failed")
 
             main(["apply-edl", str(video_path), str(edl_path)])
@@ -1133,8 +1122,6 @@ class TestCliApplyEdlSrtFlag:
 
     def test_parse_args_apply_edl_accepts_srt_flag(self) -> None:
         """CLI apply-edl subcommand accepts --srt flag for input SRT file."""
-        from scripts.cli import parse_args
-
         args = parse_args([
             "apply-edl", "video.mp4", "video.edl.json",
             "--srt", "video.srt",
@@ -1145,8 +1132,6 @@ class TestCliApplyEdlSrtFlag:
 
     def test_parse_args_apply_edl_srt_default_is_none(self) -> None:
         """CLI apply-edl subcommand defaults --srt to None."""
-        from scripts.cli import parse_args
-
         args = parse_args(["apply-edl", "video.mp4", "video.edl.json"])
 
         assert args.srt is None
@@ -1155,8 +1140,6 @@ class TestCliApplyEdlSrtFlag:
         self, tmp_path: Path
     ) -> None:
         """main() apply-edl subcommand passes srt_path to apply_edl_to_video."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
@@ -1164,7 +1147,7 @@ class TestCliApplyEdlSrtFlag:
         srt_path = tmp_path / "test.srt"
         srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello")
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.return_value = {
                 "video_path": str(tmp_path / "test_edited.mp4"),
                 "srt_path": str(tmp_path / "test_edited.srt"),
@@ -1179,8 +1162,6 @@ class TestCliApplyEdlSrtFlag:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand prints SRT output path when --srt is provided."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
@@ -1189,7 +1170,7 @@ class TestCliApplyEdlSrtFlag:
         srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello")
         output_srt_path = str(tmp_path / "test_edited.srt")
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.return_value = {
                 "video_path": str(tmp_path / "test_edited.mp4"),
                 "srt_path": output_srt_path,
@@ -1204,14 +1185,12 @@ class TestCliApplyEdlSrtFlag:
         self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
         """main() apply-edl subcommand returns exit code 1 when SRT file not found."""
-        from scripts.cli import main
-
         video_path = tmp_path / "test.mp4"
         video_path.write_bytes(b"dummy")
         edl_path = tmp_path / "test.edl.json"
         edl_path.write_text('{}')
 
-        with patch("scripts.cli.apply_edl_to_video") as mock_apply:
+        with patch("scripts.edit_pipeline.apply_edl_to_video") as mock_apply:
             mock_apply.side_effect = FileNotFoundError("SRT file not found")
 
             exit_code = main([
@@ -0,0 +1,57 @@
+"""Tests for the disk_cache module."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.disk_cache import STALE_TEMP_SECONDS, evict, write_entry
+
+
+class TestWriteEntry:
+    """Tests for write_entry."""
+
+    def test_writes_json_and_creates_directory(self, tmp_path: Path) -> None:
+        """The entry is written as JSON, creating missing directories."""
+        path = tmp_path / "cache" / "key.json"
+
+        write_entry(path, {"text": "Halló"})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"text": "Halló"}
+        assert os.listdir(path.parent) == ["key.json"]
+
+    def test_failed_write_removes_temp_file(self, tmp_path: Path) -> None:
+        """A value that can't be serialized leaves nothing behind."""
+        with pytest.raises(TypeError):
+            write_entry(tmp_path / "key.json", {"bad": object()})
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestEvict:
+    """Tests for evict."""
+
+    def test_removes_least_recently_used_entries(self, tmp_path: Path) -> None:
+        """Entries are deleted oldest first until the budget is met."""
+        for mtime, name in enumerate(("old", "mid", "new"), start=1):
+            entry = tmp_path / f"{name}.json"
+            entry.write_bytes(b"x" * 10)
+            os.utime(entry, (mtime, mtime))
+
+        evict(tmp_path, 20)
+
+        assert sorted(os.listdir(tmp_path)) == ["mid.json", "new.json"]
+
+    def test_removes_stale_temp_files_only(self, tmp_path: Path) -> None:
+        """Abandoned temp files are deleted; ones still being written are not."""
+        stale = tmp_path / "abandoned.tmp"
+        stale.write_bytes(b"partial")
+        old = time.time() - STALE_TEMP_SECONDS - 1
+        os.utime(stale, (old, old))
+        (tmp_path / "writing.tmp").write_bytes(b"partial")
+
+        evict(tmp_path, 1024)
+
+        assert os.listdir(tmp_path) == ["writing.tmp"]
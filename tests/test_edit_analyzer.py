@@ -108,6 +108,17 @@ class TestFormatTranscriptForEditing:
         assert lines[1] == ""
         assert "[0]" in lines[2]
 
+    def test_format_numbers_from_start_index(
+        self, simple_segments: list[TranscriptSegment]
+    ) -> None:
+        """Test that start_index offsets the segment indices of a chunk."""
+        result = format_transcript_for_editing(simple_segments[1:], start_index=1)
+
+        assert result.split("\n") == [
+            "[1] 3.0-6.0: Second segment",
+            "[2] 6.0-9.0: Third segment",
+        ]
+
     def test_format_without_context(
         self, simple_segments: list[TranscriptSegment]
     ) -> None:
@@ -626,6 +637,28 @@ class TestMergeAdjacentSegments:
         assert len(segments) == original_len
         assert segments[0].transcript_indices == original_indices
 
+    def test_merge_shares_indices_of_unmerged_segments(self) -> None:
+        """Test that segments not merged with others reuse their index list."""
+        keep = EditSegment(
+            start=0.0,
+            end=3.0,
+            action=EditAction.KEEP,
+            reason=None,
+            transcript_indices=[0],
+        )
+        remove = EditSegment(
+            start=3.0,
+            end=6.0,
+            action=EditAction.REMOVE,
+            reason="Retake",
+            transcript_indices=[1],
+        )
+
+        result = merge_adjacent_segments([keep, remove])
+
+        assert result[0].transcript_indices is keep.transcript_indices
+        assert result[1].transcript_indices is remove.transcript_indices
+
     def test_merge_handles_non_adjacent_times(self) -> None:
         """Test merging segments that have same action but gaps in time."""
         # Even with gaps, if actions match they should merge
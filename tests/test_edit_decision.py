@@ -4,6 +4,8 @@ These tests follow TDD principles and are written BEFORE the implementation.
 """
 
 import json
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,8 +16,10 @@ from scripts.edit_decision import (
     apply_edl_corrections,
     edl_from_dict,
     edl_from_json,
+    edl_to_file,
     edl_to_json,
     format_edl_for_review,
+    load_edl,
 )
 
 
@@ -282,6 +286,28 @@ class TestEditDecisionList:
         assert edl.kept_duration == 0.0
         assert edl.removed_duration == 10.0
 
+    def test_derived_properties_are_cached(
+        self, multi_segment_edl: EditDecisionList
+    ) -> None:
+        """Test derived segment lists are computed once and reused."""
+        assert multi_segment_edl.keep_segments is multi_segment_edl.keep_segments
+        assert (
+            multi_segment_edl.remove_segments is multi_segment_edl.remove_segments
+        )
+
+    def test_cached_properties_do_not_affect_equality(
+        self, multi_segment_edl: EditDecisionList
+    ) -> None:
+        """Test an EDL with populated caches still equals a fresh copy."""
+        fresh = EditDecisionList(
+            source_video=multi_segment_edl.source_video,
+            segments=list(multi_segment_edl.segments),
+            total_duration=multi_segment_edl.total_duration,
+        )
+        _ = multi_segment_edl.kept_duration
+
+        assert multi_segment_edl == fresh
+
 
 # ============================================================================
 # edl_to_json Tests
@@ -366,6 +392,115 @@ class TestEdlToJson:
         assert parsed["segments"] == []
 
 
+class TestJsonBackends:
+    """Tests that the optional orjson backend and stdlib json agree."""
+
+    def test_stdlib_fallback_round_trips(
+        self, multi_segment_edl: EditDecisionList, tmp_path: Path
+    ) -> None:
+        """Without orjson, EDLs still serialize and load identically."""
+        path = tmp_path / "edl.json"
+
+        with patch("scripts.edit_decision.orjson", None):
+            text = edl_to_json(multi_segment_edl)
+            edl_to_file(multi_segment_edl, str(path))
+            assert edl_from_json(text) == multi_segment_edl
+            assert load_edl(str(path)) == multi_segment_edl
+
+        assert json.loads(text) == json.loads(edl_to_json(multi_segment_edl))
+
+    def test_backends_write_non_ascii_as_utf8(self, tmp_path: Path) -> None:
+        """Both backends write non-ASCII reasons as UTF-8, not escapes."""
+        edl = EditDecisionList(
+            source_video="myndband.mp4",
+            segments=[
+                EditSegment(
+                    start=0.0,
+                    end=1.5,
+                    action=EditAction.REMOVE,
+                    reason="Endurtekning á setningu",
+                    transcript_indices=[0],
+                ),
+            ],
+            total_duration=1.5,
+        )
+
+        path = tmp_path / "edl.json"
+        with patch("scripts.edit_decision.orjson", None):
+            stdlib_text = edl_to_json(edl)
+            edl_to_file(edl, str(path))
+
+        assert "á" in stdlib_text
+        assert "á" in path.read_text(encoding="utf-8")
+        assert "á" in edl_to_json(edl)
+        assert json.loads(stdlib_text) == json.loads(edl_to_json(edl))
+
+
+class TestEdlToFile:
+    """Tests for the edl_to_file function."""
+
+    def test_writes_same_json_as_edl_to_json(
+        self, multi_segment_edl: EditDecisionList, tmp_path: Path
+    ) -> None:
+        """Test edl_to_file output matches edl_to_json exactly."""
+        path = tmp_path / "video.edl.json"
+
+        edl_to_file(multi_segment_edl, str(path))
+
+        assert path.read_text(encoding="utf-8") == edl_to_json(multi_segment_edl)
+
+    def test_round_trip(self, sample_edl: EditDecisionList, tmp_path: Path) -> None:
+        """Test a written EDL file loads back to an equal EDL."""
+        path = tmp_path / "video.edl.json"
+
+        edl_to_file(sample_edl, str(path))
+
+        with open(path, encoding="utf-8") as f:
+            assert edl_from_dict(json.load(f)) == sample_edl
+
+
+class TestLoadEdl:
+    """Tests for the memoized load_edl function."""
+
+    def test_loads_edl_from_file(
+        self, sample_edl: EditDecisionList, tmp_path: Path
+    ) -> None:
+        """Test load_edl returns the EDL stored in the file."""
+        path = tmp_path / "video.edl.json"
+        edl_to_file(sample_edl, str(path))
+
+        assert load_edl(str(path)) == sample_edl
+
+    def test_unchanged_file_is_parsed_once(
+        self, sample_edl: EditDecisionList, tmp_path: Path
+    ) -> None:
+        """Test loading an unchanged file twice returns the cached EDL."""
+        path = tmp_path / "video.edl.json"
+        edl_to_file(sample_edl, str(path))
+
+        assert load_edl(str(path)) is load_edl(str(path))
+
+    def test_modified_file_is_reparsed(
+        self,
+        sample_edl: EditDecisionList,
+        multi_segment_edl: EditDecisionList,
+        tmp_path: Path,
+    ) -> None:
+        """Test rewriting the file invalidates the cached EDL."""
+        path = tmp_path / "video.edl.json"
+        edl_to_file(sample_edl, str(path))
+        load_edl(str(path))
+
+        edl_to_file(multi_segment_edl, str(path))
+
+        assert load_edl(str(path)) == multi_segment_edl
+
+    def test_missing_file_raises_error(self, tmp_path: Path) -> None:
+        """Test load_edl raises FileNotFoundError for a missing file."""
+        with pytest.raises(FileNotFoundError):
+            load_edl(str(tmp_path / "missing.edl.json"))
+
+
 # ============================================================================
 # edl_from_dict Tests
 # ============================================================================
@@ -448,6 +583,25 @@ class TestEdlFromDict:
         assert from_json.total_duration == from_dict.total_duration
         assert len(from_json.segments) == len(from_dict.segments)
 
+    def test_edl_from_dict_unknown_action_raises_key_error(self) -> None:
+        """Test that an unknown action value raises KeyError."""
+        data = {
+            "source_video": "test.mp4",
+            "total_duration": 10.0,
+            "segments": [
+                {
+                    "start": 0.0,
+                    "end": 5.0,
+                    "action": "skip",
+                    "reason": None,
+                    "transcript_indices": [0],
+                }
+            ],
+        }
+
+        with pytest.raises(KeyError):
+            edl_from_dict(data)
+
 
 # ============================================================================
 # edl_from_json Tests
@@ -737,16 +891,22 @@ class TestApplyEdlCorrections:
         # Original should be unchanged
         assert multi_segment_edl.segments[0].action == EditAction.KEEP
 
-    def test_returns_new_segment_objects(
+    def test_returns_new_objects_only_for_corrected_segments(
         self, multi_segment_edl: EditDecisionList
     ) -> None:
-        """Test that corrections return new segment objects."""
-        corrections: dict[int, EditAction] = {}
+        """Test that only corrected segments are new objects; others are shared."""
+        corrections = {1: EditAction.KEEP}
 
         result = apply_edl_corrections(multi_segment_edl, corrections)
 
-        for orig, corrected in zip(multi_segment_edl.segments, result.segments):
-            assert corrected is not orig
+        assert result.segments is not multi_segment_edl.segments
+        for i, (orig, corrected) in enumerate(
+            zip(multi_segment_edl.segments, result.segments)
+        ):
+            if i in corrections:
+                assert corrected is not orig
+            else:
+                assert corrected is orig
 
     def test_preserves_other_segment_fields(
         self, multi_segment_edl: EditDecisionList
@@ -213,6 +213,23 @@ class TestCreateInitialEdl:
         assert edl.segments == []
         assert edl.total_duration == 10.0
 
+    def test_create_initial_edl_accepts_generator(
+        self, tmp_path: Path, sample_srt_content: str
+    ) -> None:
+        """_create_initial_edl consumes the streaming parser without a list."""
+        from scripts.edit_pipeline import _create_initial_edl, _iter_srt_segments
+
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(sample_srt_content)
+
+        edl = _create_initial_edl(
+            segments=_iter_srt_segments(str(srt_path)),
+            video_path="/path/to/video.mp4",
+            duration=15.0,
+        )
+
+        assert [seg.transcript_indices for seg in edl.segments] == [[0], [1], [2]]
+
 
 class TestEditVideo:
     """Tests for edit_video function."""
@@ -390,6 +407,135 @@ Third"""
         assert result["segment_count"] == 3
 
 
+class TestEditVideoTranscriptAndDuration:
+    """Tests for how edit_video obtains the transcript and video duration."""
+
+    def test_rerun_reuses_transcript_and_duration(self, tmp_path: Path) -> None:
+        """Editing an unchanged video twice runs process_video and ffprobe once."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        srt_path = tmp_path / "video.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+
+        with patch(
+            "scripts.edit_pipeline.process_video", return_value=str(srt_path)
+        ) as mock_process:
+            with patch(
+                "scripts.edit_pipeline.get_video_duration", return_value=10.0
+            ) as mock_duration:
+                edit_video(str(video_path))
+                result = edit_video(str(video_path))
+
+        mock_process.assert_called_once()
+        mock_duration.assert_called_once()
+        assert result["video_duration"] == 10.0
+
+    def test_modified_video_is_reprocessed(self, tmp_path: Path) -> None:
+        """Changing the video invalidates the cached transcript and duration."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        srt_path = tmp_path / "video.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+
+        with patch(
+            "scripts.edit_pipeline.process_video", return_value=str(srt_path)
+        ) as mock_process:
+            with patch(
+                "scripts.edit_pipeline.get_video_duration", side_effect=[10.0, 12.0]
+            ):
+                edit_video(str(video_path))
+                video_path.write_bytes(b"longer video")
+                result = edit_video(str(video_path))
+
+        assert mock_process.call_count == 2
+        assert result["video_duration"] == 12.0
+
+    def test_transcription_error_propagates(self, tmp_path: Path) -> None:
+        """Errors from process_video surface even with the probe in flight."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+
+        with patch(
+            "scripts.edit_pipeline.process_video", side_effect=RuntimeError("boom")
+        ):
+            with patch("scripts.edit_pipeline.get_video_duration", return_value=10.0):
+                with pytest.raises(RuntimeError, match="boom"):
+                    edit_video(str(video_path))
+
+    def test_duration_probe_overlaps_transcript_parse(self, tmp_path: Path) -> None:
+        """With a transcript given, the SRT is parsed while ffprobe runs."""
+        import threading
+
+        from scripts.edit_pipeline import _iter_srt_segments, edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        srt_path = tmp_path / "transcript.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+        parsed = threading.Event()
+
+        def probe(path: str) -> float:
+            # Only finishes once parsing has happened on the main thread
+            assert parsed.wait(timeout=5)
+            return 10.0
+
+        def parse(path: str):
+            yield from _iter_srt_segments(path)
+            parsed.set()
+
+        with patch("scripts.edit_pipeline.get_video_duration", side_effect=probe):
+            with patch("scripts.edit_pipeline._iter_srt_segments", side_effect=parse):
+                result = edit_video(str(video_path), transcript_path=str(srt_path))
+
+        assert result["video_duration"] == 10.0
+        assert result["segment_count"] == 1
+
+    def test_auto_apply_uses_in_memory_edl(self, tmp_path: Path) -> None:
+        """edit_video(auto_apply=True) applies the EDL without re-reading it."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        srt_path = tmp_path / "transcript.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+
+        with patch("scripts.edit_pipeline.get_video_duration", return_value=10.0):
+            with patch("scripts.edit_pipeline.load_edl") as mock_load:
+                with patch("scripts.edit_pipeline.apply_edl") as mock_apply:
+                    edit_video(
+                        str(video_path), transcript_path=str(srt_path), auto_apply=True
+                    )
+
+        mock_load.assert_not_called()
+        edl = mock_apply.call_args[0][1]
+        assert isinstance(edl, EditDecisionList)
+        assert len(edl.segments) == 1
+
+    def test_auto_apply_returns_review_text(self, tmp_path: Path) -> None:
+        """edit_video(auto_apply=True) without AI still returns the review text."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"video")
+        srt_path = tmp_path / "transcript.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+
+        with patch("scripts.edit_pipeline.get_video_duration", return_value=10.0):
+            with patch("scripts.edit_pipeline.apply_edl"):
+                result = edit_video(
+                    str(video_path), transcript_path=str(srt_path), auto_apply=True
+                )
+
+        assert result["transcript_for_review"] == "[0] 0.0-5.0: Hello"
+        assert result["segment_count"] == 1
+
+
 class TestApplyEdlToVideo:
     """Tests for apply_edl_to_video function."""
 
@@ -588,6 +734,143 @@ Second segment
         assert segments[0].text == "First segment"
         assert segments[1].text == "Second segment"
 
+    def test_iter_srt_segments_skips_malformed_timestamp_line(
+        self, tmp_path: Path
+    ) -> None:
+        """_iter_srt_segments skips blocks whose timestamp line is malformed."""
+        from scripts.edit_pipeline import _iter_srt_segments
+
+        srt_content = """1
+00:00:00,000 -> 00:00:05,000
+Dropped
+
+2
+00:00:05,000-->00:00:10,000
+Kept
+"""
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(srt_content)
+
+        segments = list(_iter_srt_segments(str(srt_path)))
+
+        assert len(segments) == 1
+        assert segments[0].start == 5.0
+        assert segments[0].end == 10.0
+        assert segments[0].text == "Kept"
+
+    def test_iter_srt_segments_handles_bom_and_crlf(self, tmp_path: Path) -> None:
+        """_iter_srt_segments ignores a UTF-8 BOM and accepts CRLF line endings."""
+        from scripts.edit_pipeline import _iter_srt_segments
+
+        srt_content = "1\r\n00:00:00,000 --> 00:00:05,000\r\nHæ\r\n\r\n"
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_bytes(b"\xef\xbb\xbf" + srt_content.encode("utf-8"))
+
+        segments = list(_iter_srt_segments(str(srt_path)))
+
+        assert len(segments) == 1
+        assert segments[0].end == 5.0
+        assert segments[0].text == "Hæ"
+
+    def test_iter_srt_segments_recovers_after_malformed_block(
+        self, tmp_path: Path
+    ) -> None:
+        """_iter_srt_segments keeps parsing well-formed blocks after a bad one."""
+        from scripts.edit_pipeline import _iter_srt_segments
+
+        srt_content = """1
+00:00:00,000 --> 00:00:05,000
+First
+
+stray line
+2
+00:00:05,000 --> 00:00:10,000
+Second
+
+3
+00:00:10,000 --> 00:00:15,000
+Third
+"""
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(srt_content)
+
+        segments = list(_iter_srt_segments(str(srt_path)))
+
+        assert [seg.text for seg in segments] == ["First", "Second", "Third"]
+
+
+class TestBuildEdlAndReview:
+    """Tests for _build_edl_and_review function."""
+
+    def test_matches_separate_helpers(
+        self, tmp_path: Path, sample_srt_content: str
+    ) -> None:
+        """_build_edl_and_review matches the three-pass equivalent."""
+        from scripts.edit_analyzer import format_transcript_for_editing
+        from scripts.edit_pipeline import (
+            _build_edl_and_review,
+            _create_initial_edl,
+            _load_transcript,
+        )
+
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(sample_srt_content)
+
+        segments, edl, review = _build_edl_and_review(
+            str(srt_path), "/path/to/video.mp4", 15.0
+        )
+
+        expected_segments = _load_transcript(str(srt_path))
+        assert segments == expected_segments
+        assert edl == _create_initial_edl(expected_segments, "/path/to/video.mp4", 15.0)
+        assert review == format_transcript_for_editing(expected_segments)
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """_build_edl_and_review handles an empty SRT file."""
+        from scripts.edit_pipeline import _build_edl_and_review
+
+        srt_path = tmp_path / "empty.srt"
+        srt_path.write_text("")
+
+        segments, edl, review = _build_edl_and_review(
+            str(srt_path), "/path/to/video.mp4", 10.0
+        )
+
+        assert segments == []
+        assert edl.segments == []
+        assert review == ""
+
+    def test_accepts_duration_future(
+        self, tmp_path: Path, sample_srt_content: str
+    ) -> None:
+        """A Future for the duration is resolved into the EDL after parsing."""
+        from concurrent.futures import Future
+
+        from scripts.edit_pipeline import _build_edl_and_review
+
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(sample_srt_content)
+        duration: Future[float] = Future()
+        duration.set_result(15.0)
+
+        _, edl, _ = _build_edl_and_review(str(srt_path), "/path/to/video.mp4", duration)
+
+        assert edl.total_duration == 15.0
+
+    def test_without_edl(self, tmp_path: Path, sample_srt_content: str) -> None:
+        """with_edl=False still parses segments and formats the review text."""
+        from scripts.edit_pipeline import _build_edl_and_review
+
+        srt_path = tmp_path / "test.srt"
+        srt_path.write_text(sample_srt_content)
+
+        segments, edl, review = _build_edl_and_review(
+            str(srt_path), "/path/to/video.mp4", 15.0, with_edl=False
+        )
+
+        assert edl is None
+        assert len(segments) == len(review.split("\n")) > 0
+
 
 class TestParseSrtTimestamp:
     """Tests for _parse_srt_timestamp helper function."""
@@ -621,6 +904,32 @@ class TestParseSrtTimestamp:
         with pytest.raises(ValueError):
             _parse_srt_timestamp("invalid")
 
+    def test_bulk_canonical_decode_matches_scalar_parse(self) -> None:
+        """_parse_canonical_timestamp_lines agrees with _parse_srt_timestamp."""
+        from scripts.edit_pipeline import (
+            _parse_canonical_timestamp_lines,
+            _parse_srt_timestamp,
+        )
+
+        lines = [
+            "00:00:00,000 --> 00:00:05,500",
+            "01:30:45,123 --> 99:59:59,999",
+        ]
+
+        assert _parse_canonical_timestamp_lines(lines) == [
+            (_parse_srt_timestamp(line[:12]), _parse_srt_timestamp(line[17:]))
+            for line in lines
+        ]
+        assert _parse_canonical_timestamp_lines([]) == []
+
+    def test_parse_rejects_wrong_separators_and_non_digits(self) -> None:
+        """_parse_srt_timestamp rejects misplaced separators and non-digit fields."""
+        from scripts.edit_pipeline import _parse_srt_timestamp
+
+        for bad in ("00-00-05,000", "00:00:05.000", "0a:00:05,000", "00:00:05,5"):
+            with pytest.raises(ValueError, match="Invalid SRT timestamp format"):
+                _parse_srt_timestamp(bad)
+
 
 class TestParseAiResponse:
     """Tests for _parse_ai_response function."""
@@ -706,6 +1015,19 @@ class TestParseAiResponse:
         assert "Warning" in captured.err
         assert "99" in captured.err
 
+    def test_parse_ai_response_skips_reversed_range(
+        self, sample_transcript_segments: list[TranscriptSegment], capsys: pytest.CaptureFixture
+    ) -> None:
+        """_parse_ai_response skips and warns about ranges that end before they start."""
+        from scripts.edit_pipeline import _parse_ai_response
+
+        result = _parse_ai_response(
+            "[REMOVE] 2-1: Backwards\n[KEEP] 0-2: All", sample_transcript_segments
+        )
+
+        assert [seg.transcript_indices for seg in result] == [[0, 1, 2]]
+        assert "reversed range 2-1" in capsys.readouterr().err
+
     def test_parse_ai_response_ignores_non_matching_lines(
         self, sample_transcript_segments: list[TranscriptSegment]
     ) -> None:
@@ -745,6 +1067,25 @@ Random text that should be ignored
         for seg in result:
             assert seg.action == EditAction.KEEP
 
+    def test_parse_ai_response_matches_whole_lines_only(
+        self, sample_transcript_segments: list[TranscriptSegment]
+    ) -> None:
+        """Decision lines may be indented, but a match never spans lines."""
+        from scripts.edit_pipeline import _parse_ai_response
+
+        ai_response = (
+            "  [KEEP] 0: Indented  \r\n"
+            "\n"
+            "See [REMOVE] 1: mid-line mentions are ignored\n"
+            "[REMOVE]\n1: split across lines\n"
+            "[REMOVE] 2:   \n"
+            "\t[REMOVE] 2: Trailing retake\t"
+        )
+        result = _parse_ai_response(ai_response, sample_transcript_segments)
+
+        assert [seg.transcript_indices for seg in result] == [[0], [2]]
+        assert result[1].reason == "Trailing retake"
+
 
 class TestAnalyzeWithAi:
     """Tests for _analyze_with_ai function."""
@@ -806,6 +1147,39 @@ class TestAnalyzeWithAi:
                     use_ai=True,
                 )
 
+    def test_analyze_with_ai_chunks_long_transcripts(
+        self, sample_transcript_segments: list[TranscriptSegment]
+    ) -> None:
+        """Long transcripts go out as overlapping chunks with global indices."""
+        from scripts.edit_pipeline import _analyze_with_ai
+
+        responses = ["[KEEP] 0-2: Intro", "[KEEP] 1: Context\n[REMOVE] 1-2: Retake"]
+        with patch("scripts.edit_pipeline._AI_CHUNK_SEGMENTS", 2), patch(
+            "scripts.edit_pipeline._AI_CHUNK_OVERLAP", 1
+        ), patch(
+            "scripts.edit_pipeline.load_agent_prompt", return_value="Test prompt"
+        ), patch("scripts.edit_pipeline.analyze_transcript") as mock_analyze, patch(
+            "scripts.edit_pipeline.analyze_transcript_chunks", return_value=responses
+        ) as mock_chunks:
+            segments, raw_response = _analyze_with_ai(
+                transcript="unused",
+                segments=sample_transcript_segments,
+                use_ai=True,
+            )
+
+        mock_analyze.assert_not_called()
+        chunks, prompt = mock_chunks.call_args.args
+        assert prompt == "Test prompt"
+        # Each chunk carries one segment of context from its neighbour
+        assert [chunk.splitlines()[0][:3] for chunk in chunks] == ["[0]", "[1]"]
+        assert [len(chunk.splitlines()) for chunk in chunks] == [3, 2]
+        # Decisions are kept only for the segments each chunk owns
+        assert [s.transcript_indices for s in segments] == [[0, 1], [2]]
+        assert [s.action for s in segments] == [EditAction.KEEP, EditAction.REMOVE]
+        assert (segments[0].start, segments[0].end) == (0.0, 10.0)
+        assert (segments[1].start, segments[1].end) == (10.0, 15.0)
+        assert raw_response == "\n".join(responses)
+
 
 class TestCreateEdlFromAiSegments:
     """Tests for _create_edl_from_ai_segments function."""
@@ -978,6 +1352,33 @@ Um let me try again"""
         assert edl_data["segments"][0]["action"] == "keep"
         assert edl_data["segments"][1]["action"] == "remove"
 
+    def test_edit_video_with_ai_auto_apply_returns_review_text(
+        self, tmp_path: Path
+    ) -> None:
+        """The formatted transcript is returned even when cuts are auto-applied."""
+        from scripts.edit_pipeline import edit_video
+
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        srt_path = tmp_path / "transcript.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nHello\n")
+
+        with patch("scripts.edit_pipeline.get_video_duration", return_value=10.0):
+            with patch("scripts.edit_pipeline.load_agent_prompt", return_value="Test"):
+                with patch(
+                    "scripts.edit_pipeline.analyze_transcript", return_value="[KEEP] 0: Hi"
+                ) as mock_analyze:
+                    with patch("scripts.edit_pipeline.apply_edl"):
+                        result = edit_video(
+                            str(video_path),
+                            transcript_path=str(srt_path),
+                            auto_apply=True,
+                            use_ai=True,
+                        )
+
+        assert result["transcript_for_review"] == "[0] 0.0-5.0: Hello"
+        assert mock_analyze.call_args.args[0] == result["transcript_for_review"]
+
     def test_edit_video_falls_back_on_parse_failure(
         self, tmp_path: Path, capsys: pytest.CaptureFixture
     ) -> None:
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,12 +10,21 @@ from scripts.llm_client import (
     DEFAULT_MODEL,
     LLMClientError,
     analyze_transcript,
+    analyze_transcript_chunks,
     get_api_key,
     get_model,
     load_agent_prompt,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_client() -> None:
+    """Drop the shared Claude client so each test sees its own mock."""
+    from scripts.llm_client import _get_client
+
+    _get_client.cache_clear()
+
+
 class TestGetApiKey:
     """Tests for get_api_key function."""
 
@@ -98,6 +107,19 @@ class TestLoadAgentPrompt:
 
         assert "Agent prompt file not found" in str(exc_info.value)
 
+    def test_load_agent_prompt_reads_file_once(self) -> None:
+        """Repeated loads of the same agent are served from memory."""
+        load_agent_prompt.cache_clear()
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as mock_read:
+            first = load_agent_prompt("video-editor")
+            second = load_agent_prompt("video-editor")
+
+        assert first == second
+        mock_read.assert_called_once()
+
     def test_load_agent_prompt_with_complex_frontmatter(self, tmp_path: Path) -> None:
         """load_agent_prompt correctly strips multi-line frontmatter."""
         # Create a test agent file with frontmatter
@@ -147,11 +169,28 @@ class TestAnalyzeTranscript:
         mock_client.messages.create.assert_called_once()
         call_kwargs = mock_client.messages.create.call_args.kwargs
         assert call_kwargs["model"] == "claude-sonnet-4-20250514"
-        assert call_kwargs["system"] == "You are a video editor"
+        assert call_kwargs["system"][0]["text"] == "You are a video editor"
         assert "[0] 0-5: Hello" in call_kwargs["messages"][0]["content"]
 
         assert result == "[KEEP] 0-5: Content"
 
+    def test_analyze_transcript_marks_prompt_cacheable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """analyze_transcript sends the agent prompt as a cached system block."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value.content = [MagicMock(text="ok")]
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            analyze_transcript(transcript="[0] 0-5: Hello", agent_prompt="Prompt")
+
+        system = mock_client.messages.create.call_args.kwargs["system"]
+        assert system == [
+            {"type": "text", "text": "Prompt", "cache_control": {"type": "ephemeral"}}
+        ]
+
     def test_analyze_transcript_uses_default_model(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -276,6 +315,314 @@ class TestAnalyzeTranscript:
         assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
 
 
+class TestSharedClient:
+    """Tests for reuse of the Claude client across calls."""
+
+    def test_client_is_created_once_per_api_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated calls reuse one client until the API key changes."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "key-1")
+        monkeypatch.setenv("AIVE_LLM_CACHE", "0")
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value.content = [MagicMock(text="ok")]
+
+        with patch(
+            "scripts.llm_client.anthropic.Anthropic", return_value=mock_client
+        ) as mock_cls:
+            analyze_transcript("a", "Prompt", model="m")
+            analyze_transcript("b", "Prompt", model="m")
+            assert mock_cls.call_count == 1
+
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "key-2")
+            analyze_transcript("a", "Prompt", model="m")
+
+        assert mock_cls.call_count == 2
+        mock_cls.assert_called_with(api_key="key-2")
+        assert mock_client.messages.create.call_count == 3
+
+
+class TestResponseCache:
+    """Tests for the on-disk cache of analyze_transcript responses."""
+
+    def _mock_client(self, text: str) -> MagicMock:
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value.content = [MagicMock(text=text)]
+        return mock_client
+
+    def test_repeated_call_is_served_from_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second identical request does not call the API."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        mock_client = self._mock_client("[KEEP] 0-5: Content")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            first = analyze_transcript("[0] 0-5: Hello", "Prompt", model="m")
+            second = analyze_transcript("[0] 0-5: Hello", "Prompt", model="m")
+
+        assert first == second == "[KEEP] 0-5: Content"
+        mock_client.messages.create.assert_called_once()
+
+    def test_different_inputs_miss_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changing the transcript, prompt or model calls the API again."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            analyze_transcript("a", "Prompt", model="m")
+            analyze_transcript("b", "Prompt", model="m")
+            analyze_transcript("a", "Other", model="m")
+            analyze_transcript("a", "Prompt", model="n")
+
+        assert mock_client.messages.create.call_count == 4
+
+    def test_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AIVE_LLM_CACHE=0 always calls the API."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        monkeypatch.setenv("AIVE_LLM_CACHE", "0")
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            analyze_transcript("a", "Prompt", model="m")
+            analyze_transcript("a", "Prompt", model="m")
+
+        assert mock_client.messages.create.call_count == 2
+
+    def test_corrupt_entry_is_ignored(
+        self, monkeypatch: pytest.MonkeyPatch, isolated_cache_home: Path
+    ) -> None:
+        """An unreadable cache file falls back to the API."""
+        from scripts.llm_client import _response_cache_key
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        cache_dir = isolated_cache_home / "ai-video-editor" / "llm"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / f"{_response_cache_key('a', 'Prompt', 'm')}.json").write_text("{")
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            result = analyze_transcript("a", "Prompt", model="m")
+
+        assert result == "ok"
+        mock_client.messages.create.assert_called_once()
+
+
+    def test_non_string_entry_is_ignored(
+        self, monkeypatch: pytest.MonkeyPatch, isolated_cache_home: Path
+    ) -> None:
+        """A cache file whose response is not a string falls back to the API."""
+        from scripts.llm_client import _response_cache_key
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        cache_dir = isolated_cache_home / "ai-video-editor" / "llm"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / f"{_response_cache_key('a', 'Prompt', 'm')}.json").write_text(
+            '{"response": null}'
+        )
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            result = analyze_transcript("a", "Prompt", model="m")
+
+        assert result == "ok"
+        mock_client.messages.create.assert_called_once()
+
+    def test_cache_evicts_least_recently_used(
+        self, monkeypatch: pytest.MonkeyPatch, isolated_cache_home: Path
+    ) -> None:
+        """Once over budget, the least recently used responses are deleted."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        cache_dir = isolated_cache_home / "ai-video-editor" / "llm"
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            analyze_transcript("a", "Prompt", model="m")
+            first_entry = next(cache_dir.iterdir())
+            entry_size = first_entry.stat().st_size
+            os.utime(first_entry, (1, 1))
+            monkeypatch.setattr("scripts.llm_client.CACHE_MAX_BYTES", entry_size)
+            analyze_transcript("b", "Prompt", model="m")
+            analyze_transcript("b", "Prompt", model="m")
+            analyze_transcript("a", "Prompt", model="m")
+
+        # "a" was evicted when "b" was stored, so it is fetched again
+        assert mock_client.messages.create.call_count == 3
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_failed_cache_write_leaves_no_temp_file(
+        self, monkeypatch: pytest.MonkeyPatch, isolated_cache_home: Path
+    ) -> None:
+        """A cache write that fails is ignored and leaves no temporary file."""
+
+        def fail_replace(src: str, dst: object) -> None:
+            raise OSError("No space left on device")
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        monkeypatch.setattr("scripts.disk_cache.os.replace", fail_replace)
+        mock_client = self._mock_client("ok")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=mock_client):
+            assert analyze_transcript("a", "Prompt", model="m") == "ok"
+
+        cache_dir = isolated_cache_home / "ai-video-editor" / "llm"
+        assert list(cache_dir.iterdir()) == []
+
+class TestAnalyzeTranscriptChunks:
+    """Tests for analyze_transcript_chunks function."""
+
+    def _mock_async_client(self, side_effect) -> MagicMock:
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=side_effect)
+        mock_client.close = AsyncMock()
+        return mock_client
+
+    @staticmethod
+    def _echo(**kwargs) -> MagicMock:
+        content = kwargs["messages"][0]["content"]
+        return MagicMock(content=[MagicMock(text=f"reply to {content[-1]}")])
+
+    def test_returns_responses_in_chunk_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each chunk gets its own request and responses keep chunk order."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        mock_client = self._mock_async_client(self._echo)
+
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=mock_client
+        ):
+            result = analyze_transcript_chunks(["a", "b", "c"], "Prompt", model="m")
+
+        assert result == ["reply to a", "reply to b", "reply to c"]
+        assert mock_client.messages.create.await_count == 3
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["model"] == "m"
+        assert call_kwargs["system"][0]["text"] == "Prompt"
+        mock_client.close.assert_awaited_once()
+
+    def test_limits_concurrent_requests(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No more than MAX_CONCURRENT_REQUESTS requests run at once."""
+        import asyncio
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        monkeypatch.setattr("scripts.llm_client.MAX_CONCURRENT_REQUESTS", 2)
+        in_flight = []
+        peak = []
+
+        async def slow_echo(**kwargs) -> MagicMock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.pop()
+            return self._echo(**kwargs)
+
+        mock_client = self._mock_async_client(slow_echo)
+
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=mock_client
+        ):
+            result = analyze_transcript_chunks(list("abcde"), "Prompt", model="m")
+
+        assert result == [f"reply to {c}" for c in "abcde"]
+        assert max(peak) == 2
+
+    def test_cached_chunks_are_not_resent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Chunks already answered by analyze_transcript come from the cache."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        sync_client = MagicMock()
+        sync_client.messages.create.return_value.content = [MagicMock(text="cached")]
+        mock_client = self._mock_async_client(self._echo)
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=sync_client):
+            analyze_transcript("a", "Prompt", model="m")
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=mock_client
+        ):
+            result = analyze_transcript_chunks(["a", "b"], "Prompt", model="m")
+
+        assert result == ["cached", "reply to b"]
+        mock_client.messages.create.assert_awaited_once()
+
+    def test_api_error_raises_llm_client_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An API failure on any chunk raises LLMClientError."""
+        import anthropic
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        mock_client = self._mock_async_client(
+            anthropic.APIError(message="boom", request=MagicMock(), body=None)
+        )
+
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=mock_client
+        ):
+            with pytest.raises(LLMClientError) as exc_info:
+                analyze_transcript_chunks(["a", "b"], "Prompt", model="m")
+
+        assert "Claude API error" in str(exc_info.value)
+        mock_client.close.assert_awaited_once()
+
+
+    def test_failed_chunk_keeps_other_responses_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Successful chunks are cached, so a retry only re-sends failures."""
+        import anthropic
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+
+        def fail_on_b(**kwargs) -> MagicMock:
+            if kwargs["messages"][0]["content"].endswith("b"):
+                raise anthropic.APIError(
+                    message="boom", request=MagicMock(), body=None
+                )
+            return self._echo(**kwargs)
+
+        mock_client = self._mock_async_client(fail_on_b)
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=mock_client
+        ):
+            with pytest.raises(LLMClientError, match="Claude API error"):
+                analyze_transcript_chunks(["a", "b", "c"], "Prompt", model="m")
+
+        retry_client = self._mock_async_client(self._echo)
+        with patch(
+            "scripts.llm_client.anthropic.AsyncAnthropic", return_value=retry_client
+        ):
+            result = analyze_transcript_chunks(["a", "b", "c"], "Prompt", model="m")
+
+        assert result == ["reply to a", "reply to b", "reply to c"]
+        retry_client.messages.create.assert_awaited_once()
+
+    def test_running_event_loop_uses_sync_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Inside a running event loop, chunks go through the sync client."""
+        import asyncio
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key")
+        sync_client = MagicMock()
+        sync_client.messages.create.side_effect = self._echo
+
+        async def call_from_loop() -> list[str]:
+            return analyze_transcript_chunks(["a", "b"], "Prompt", model="m")
+
+        with patch("scripts.llm_client.anthropic.Anthropic", return_value=sync_client):
+            with patch("scripts.llm_client.anthropic.AsyncAnthropic") as mock_async:
+                result = asyncio.run(call_from_loop())
+
+        assert result == ["reply to a", "reply to b"]
+        assert sync_client.messages.create.call_count == 2
+        mock_async.assert_not_called()
+
 class TestLLMClientError:
     """Tests for LLMClientError exception class."""
 
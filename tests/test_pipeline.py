@@ -181,6 +181,60 @@ class TestProcessVideoBasic:
         call_kwargs = mock_transcribe.call_args[1]
         assert call_kwargs.get("language") == "en"
 
+    def test_process_video_passes_decoding_options(
+        self, tmp_path: Path
+    ) -> None:
+        """process_video passes beam_size and vad_filter to transcribe."""
+        from scripts.pipeline import process_video
+
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"dummy video content")
+
+        mock_segments = [TranscriptSegment(start=0.0, end=1.0, text="Test")]
+
+        with patch("scripts.pipeline.extract_audio") as mock_extract:
+            with patch("scripts.pipeline.transcribe") as mock_transcribe:
+                with patch("scripts.pipeline.write_srt"):
+                    mock_extract.return_value = str(tmp_path / "temp.wav")
+                    mock_transcribe.return_value = mock_segments
+
+                    process_video(str(video_path), beam_size=1, vad_filter=True)
+
+        call_kwargs = mock_transcribe.call_args[1]
+        assert call_kwargs.get("beam_size") == 1
+        assert call_kwargs.get("vad_filter") is True
+
+    def test_process_video_reuses_cached_transcript(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """process_video skips transcription when the audio was seen before."""
+        from scripts.pipeline import process_video
+
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"dummy video content")
+        audio_path = tmp_path / "temp.wav"
+
+        def fake_extract(path: str) -> str:
+            audio_path.write_bytes(b"RIFF same audio")
+            return str(audio_path)
+
+        mock_segments = [TranscriptSegment(start=0.0, end=1.0, text="Test")]
+
+        with patch("scripts.pipeline.extract_audio", side_effect=fake_extract):
+            with patch("scripts.pipeline.transcribe") as mock_transcribe:
+                with patch("scripts.pipeline.write_srt") as mock_write:
+                    mock_transcribe.return_value = mock_segments
+
+                    process_video(str(video_path))
+                    process_video(str(video_path), subtitle_format="srt")
+                    process_video(str(video_path), beam_size=1)
+                    monkeypatch.setenv("WHISPER_COMPUTE_TYPE", "float32")
+                    process_video(str(video_path))
+
+        # The beam_size and compute type changes are different transcripts
+        assert mock_transcribe.call_count == 3
+        assert mock_write.call_args_list[1][0][0] == mock_segments
+
     def test_process_video_uses_default_model_size(
         self, tmp_path: Path
     ) -> None:
@@ -705,3 +759,256 @@ class TestProcessVideoSubtitleFormat:
         assert result == str(custom_output)
         mock_write.assert_called_once()
         assert mock_write.call_args[0][1] == str(custom_output)
+
+
+class TestProcessVideos:
+    """Tests for the batch process_videos function."""
+
+    def test_extracts_all_audio_in_one_batch(self, tmp_path: Path) -> None:
+        """process_videos extracts audio once for all videos and writes each SRT."""
+        from scripts.pipeline import process_videos
+
+        video_paths = []
+        audio_paths = []
+        for name in ("one", "two"):
+            video = tmp_path / f"{name}.mp4"
+            video.write_bytes(b"dummy video content")
+            video_paths.append(str(video))
+            audio = tmp_path / f"{name}.wav"
+            audio.write_bytes(b"audio")
+            audio_paths.append(str(audio))
+
+        mock_segments = [TranscriptSegment(start=0.0, end=2.5, text="Test")]
+
+        with patch("scripts.pipeline.extract_audio_batch") as mock_batch:
+            with patch("scripts.pipeline.transcribe_many_iter") as mock_transcribe:
+                with patch("scripts.pipeline.write_srt") as mock_write:
+                    mock_batch.return_value = audio_paths
+                    mock_transcribe.return_value = iter([mock_segments, mock_segments])
+
+                    result = process_videos(video_paths)
+
+        mock_batch.assert_called_once_with(video_paths)
+        # All audio is transcribed in one batched call
+        mock_transcribe.assert_called_once()
+        assert mock_transcribe.call_args[0][0] == audio_paths
+        assert mock_write.call_count == 2
+        assert result == [str(tmp_path / "one.srt"), str(tmp_path / "two.srt")]
+        # Temporary audio files are cleaned up
+        assert not any(os.path.exists(p) for p in audio_paths)
+
+    def test_reuses_cached_transcripts(self, tmp_path: Path) -> None:
+        """Only videos missing from the transcript cache are transcribed."""
+        from scripts.pipeline import process_videos
+
+        def make_audio() -> list[str]:
+            paths = []
+            for name in ("one", "two"):
+                audio = tmp_path / f"{name}.wav"
+                audio.write_bytes(f"{name} audio".encode())
+                paths.append(str(audio))
+            return paths
+
+        video_paths = [str(tmp_path / "one.mp4"), str(tmp_path / "two.mp4")]
+        first = [TranscriptSegment(start=0.0, end=1.0, text="First")]
+        second = [TranscriptSegment(start=0.0, end=1.0, text="Second")]
+
+        with patch("scripts.pipeline.extract_audio_batch", return_value=make_audio()):
+            with patch(
+                "scripts.pipeline.transcribe_many_iter", return_value=iter([first])
+            ):
+                with patch("scripts.pipeline.write_srt"):
+                    process_videos(video_paths[:1], beam_size=1)
+
+        with patch("scripts.pipeline.extract_audio_batch", return_value=make_audio()):
+            with patch("scripts.pipeline.transcribe_many_iter") as mock_transcribe:
+                with patch("scripts.pipeline.write_srt") as mock_write:
+                    mock_transcribe.return_value = iter([second])
+                    process_videos(video_paths, beam_size=1)
+
+        # The first video's transcript came from the cache
+        assert mock_transcribe.call_args[0][0] == [str(tmp_path / "two.wav")]
+        assert mock_transcribe.call_args[1]["beam_size"] == 1
+        assert [c[0][0] for c in mock_write.call_args_list] == [first, second]
+
+    def test_invalid_format_raises_before_extraction(self, tmp_path: Path) -> None:
+        """process_videos validates the subtitle format before extracting audio."""
+        from scripts.pipeline import process_videos
+
+        with patch("scripts.pipeline.extract_audio_batch") as mock_batch:
+            with pytest.raises(ValueError):
+                process_videos([str(tmp_path / "a.mp4")], subtitle_format="ass")
+
+        mock_batch.assert_not_called()
+
+    def test_empty_transcription_raises(self, tmp_path: Path) -> None:
+        """process_videos rejects a video whose transcription is empty."""
+        from scripts.pipeline import process_videos
+
+        audio = tmp_path / "one.wav"
+        audio.write_bytes(b"audio")
+
+        with patch("scripts.pipeline.extract_audio_batch", return_value=[str(audio)]):
+            with patch("scripts.pipeline.transcribe_many_iter", return_value=iter([[]])):
+                with pytest.raises(ValueError, match="empty segments"):
+                    process_videos([str(tmp_path / "one.mp4")])
+
+        assert not audio.exists()
+
+    def test_failed_write_stops_transcription(self, tmp_path: Path) -> None:
+        """A write error surfaces without transcribing the remaining videos."""
+        from scripts.pipeline import process_videos
+
+        audio_paths = []
+        for name in ("one", "two", "three"):
+            audio = tmp_path / f"{name}.wav"
+            audio.write_bytes(b"audio")
+            audio_paths.append(str(audio))
+        video_paths = [str(tmp_path / f"{n}.mp4") for n in ("one", "two", "three")]
+        transcribed = []
+
+        def fake_transcribe(paths, **kwargs):
+            for path in paths:
+                transcribed.append(path)
+                yield [] if path == audio_paths[0] else [
+                    TranscriptSegment(start=0.0, end=1.0, text="Test")
+                ]
+
+        with patch("scripts.pipeline.extract_audio_batch", return_value=audio_paths):
+            with patch(
+                "scripts.pipeline.transcribe_many_iter", side_effect=fake_transcribe
+            ):
+                with patch("scripts.pipeline.write_srt"):
+                    with pytest.raises(ValueError, match="one.mp4"):
+                        process_videos(video_paths)
+
+        assert transcribed == audio_paths[:2]
+        assert not any(os.path.exists(p) for p in audio_paths)
+
+
+class TestProcessVideosParallel:
+    """Tests for the multi-process process_videos_parallel function."""
+
+    class InlineExecutor:
+        """Stand-in for ProcessPoolExecutor that runs everything in-process."""
+
+        instances: list = []
+
+        def __init__(self, max_workers, mp_context, initializer, initargs) -> None:
+            self.max_workers = max_workers
+            self.initargs = initargs
+            for _ in range(max_workers):
+                initializer(*initargs)
+            self.instances.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            pass
+
+        def map(self, fn, iterable):
+            return map(fn, iterable)
+
+    def test_one_worker_per_gpu(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each worker is pinned to its own GPU and results keep input order."""
+        from scripts.pipeline import process_videos_parallel
+
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+        pinned = []
+        self.InlineExecutor.instances.clear()
+
+        def fake_process_video(path: str, **kwargs) -> str:
+            return f"{path}.{kwargs['subtitle_format']}"
+
+        def record_gpu(gpu_ids, cpu_threads) -> None:
+            pinned.append(gpu_ids.get())
+
+        with patch("scripts.pipeline.cuda_device_count", return_value=2):
+            with patch("scripts.pipeline.ProcessPoolExecutor", self.InlineExecutor):
+                with patch("scripts.pipeline._init_video_worker", record_gpu):
+                    with patch("scripts.pipeline.process_video", fake_process_video):
+                        result = process_videos_parallel(
+                            ["a.mp4", "b.mp4", "c.mp4"], subtitle_format="vtt"
+                        )
+
+        assert result == ["a.mp4.vtt", "b.mp4.vtt", "c.mp4.vtt"]
+        assert self.InlineExecutor.instances[0].max_workers == 2
+        assert sorted(pinned) == [0, 1]
+
+    def test_forwards_decoding_options(self) -> None:
+        """beam_size and vad_filter reach process_video in the workers."""
+        from scripts.pipeline import process_videos_parallel
+
+        calls = []
+
+        def fake_process_video(path: str, **kwargs) -> str:
+            calls.append(kwargs)
+            return path
+
+        with patch("scripts.pipeline.cuda_device_count", return_value=0):
+            with patch("scripts.pipeline.ProcessPoolExecutor", self.InlineExecutor):
+                with patch("scripts.pipeline._init_video_worker"):
+                    with patch("scripts.pipeline.process_video", fake_process_video):
+                        process_videos_parallel(
+                            ["a.mp4", "b.mp4"], beam_size=1, vad_filter=True
+                        )
+
+        assert [(c["beam_size"], c["vad_filter"]) for c in calls] == [(1, True)] * 2
+
+    def test_invalid_format_raises_before_starting_workers(self) -> None:
+        """process_videos_parallel validates the subtitle format up front."""
+        from scripts.pipeline import process_videos_parallel
+
+        with patch("scripts.pipeline.ProcessPoolExecutor") as mock_executor:
+            with pytest.raises(ValueError):
+                process_videos_parallel(["a.mp4"], subtitle_format="ass")
+
+        mock_executor.assert_not_called()
+
+    def test_worker_init_pins_gpu_and_splits_cpus(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """_init_video_worker sets the worker's GPU and CTranslate2 threads."""
+        import queue
+
+        from scripts.pipeline import _init_video_worker
+
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+        monkeypatch.delenv("WHISPER_CPU_THREADS", raising=False)
+        gpu_ids: queue.Queue = queue.Queue()
+        gpu_ids.put(1)
+
+        _init_video_worker(gpu_ids, 4)
+
+        assert os.environ["CUDA_VISIBLE_DEVICES"] == "1"
+        assert os.environ["WHISPER_CPU_THREADS"] == "4"
+
+
+class TestProcessVideoInMemoryAudio:
+    """Tests for process_video with in_memory_audio=True."""
+
+    def test_transcribes_samples_without_temp_wav(self, tmp_path: Path) -> None:
+        """process_video passes in-memory samples to transcribe, skipping the WAV."""
+        from scripts.pipeline import process_video
+
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"dummy video content")
+        samples = MagicMock(name="samples")
+        mock_segments = [TranscriptSegment(start=0.0, end=2.5, text="Test")]
+
+        with patch("scripts.pipeline.extract_audio") as mock_extract:
+            with patch("scripts.pipeline.extract_audio_to_array") as mock_to_array:
+                with patch("scripts.pipeline.transcribe") as mock_transcribe:
+                    with patch("scripts.pipeline.write_srt"):
+                        mock_to_array.return_value = samples
+                        mock_transcribe.return_value = mock_segments
+
+                        result = process_video(
+                            str(video_path), in_memory_audio=True
+                        )
+
+        mock_extract.assert_not_called()
+        mock_to_array.assert_called_once_with(str(video_path))
+        assert mock_transcribe.call_args[0][0] is samples
+        assert result == str(tmp_path / "test_video.srt")
@@ -5,6 +5,7 @@ These tests follow TDD principles and are written BEFORE the implementation.
 
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -60,6 +61,11 @@ class TestFormatSrtTimestamp:
         result = format_srt_timestamp(3600.0)
         assert result == "01:00:00,000"
 
+    def test_format_srt_timestamp_rounding_carries_into_seconds(self) -> None:
+        """Test that milliseconds rounding up to 1000 carry into the next unit."""
+        assert format_srt_timestamp(0.9999) == "00:00:01,000"
+        assert format_srt_timestamp(3599.9996) == "01:00:00,000"
+
 
 class TestWriteSrt:
     """Tests for the write_srt function."""
@@ -169,6 +175,29 @@ class TestWriteSrt:
             assert "Chinese: \u4e2d\u6587" in content
             assert "\u2764" in content
 
+    def test_write_srt_replaces_file_atomically(self) -> None:
+        """Test that write_srt leaves no temp files and keeps the old file on failure."""
+        segments = [TranscriptSegment(start=0.0, end=1.0, text="New")]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "subtitles.srt")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write("old content")
+
+            with patch("scripts.subtitle_writer.os.replace", side_effect=OSError("disk")):
+                with pytest.raises(OSError):
+                    write_srt(segments, output_path)
+
+            with open(output_path, "r", encoding="utf-8") as f:
+                assert f.read() == "old content"
+            assert os.listdir(tmpdir) == ["subtitles.srt"]
+
+            write_srt(segments, output_path)
+
+            with open(output_path, "r", encoding="utf-8") as f:
+                assert "New" in f.read()
+            assert os.listdir(tmpdir) == ["subtitles.srt"]
+
 
 class TestFormatVttTimestamp:
     """Tests for the format_vtt_timestamp function."""
@@ -196,6 +225,10 @@ class TestFormatVttTimestamp:
         result = format_vtt_timestamp(1.5555)
         assert result == "00:00:01.556"
 
+    def test_format_vtt_timestamp_rounding_carries_into_seconds(self) -> None:
+        """Test that milliseconds rounding up to 1000 carry into the next unit."""
+        assert format_vtt_timestamp(59.9999) == "00:01:00.000"
+
     def test_format_vtt_timestamp_large_hours(self) -> None:
         """Test formatting with more than 10 hours."""
         # 12 hours + 34 minutes + 56 seconds + 789 milliseconds
@@ -0,0 +1,139 @@
+"""Tests for the transcript_cache module."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts.transcript_cache import (
+    cache_enabled,
+    cache_key,
+    load_transcript,
+    store_transcript,
+)
+from scripts.transcription import TranscriptSegment
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_same_audio_and_options_give_same_key(self, tmp_path: Path) -> None:
+        """Identical audio content hashes to the same key regardless of path."""
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        first.write_bytes(b"RIFF audio")
+        second.write_bytes(b"RIFF audio")
+
+        options = ("base", "en", 5, False, "cpu", "int8")
+
+        assert cache_key(str(first), *options) == cache_key(str(second), *options)
+
+    def test_key_depends_on_content_and_options(self, tmp_path: Path) -> None:
+        """Different audio or decoding options give different keys."""
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"RIFF audio")
+        other = tmp_path / "b.wav"
+        other.write_bytes(b"RIFF other")
+        base = cache_key(str(audio), "base", "en", 5, False, "cpu", "int8")
+
+        assert cache_key(str(other), "base", "en", 5, False, "cpu", "int8") != base
+        assert cache_key(str(audio), "small", "en", 5, False, "cpu", "int8") != base
+        assert cache_key(str(audio), "base", None, 5, False, "cpu", "int8") != base
+        assert cache_key(str(audio), "base", "en", 1, False, "cpu", "int8") != base
+        assert cache_key(str(audio), "base", "en", 5, True, "cpu", "int8") != base
+        assert cache_key(str(audio), "base", "en", 5, False, "cuda", "int8") != base
+        assert cache_key(str(audio), "base", "en", 5, False, "cpu", "float32") != base
+        assert (
+            cache_key(str(audio), "base", "en", 5, False, "cpu", "int8", batched=True)
+            != base
+        )
+
+    def test_hashes_in_memory_samples(self) -> None:
+        """Sample arrays are keyed by their contents."""
+        samples = np.linspace(-1, 1, 1000, dtype=np.float32)
+
+        options = ("base", None, 5, False, "cpu", "int8")
+
+        assert cache_key(samples, *options) == cache_key(samples.copy(), *options)
+        assert cache_key(samples, *options) != cache_key(samples[::-1], *options)
+
+    def test_missing_file_raises_os_error(self, tmp_path: Path) -> None:
+        """A missing audio file surfaces as OSError."""
+        with pytest.raises(OSError):
+            cache_key(
+                str(tmp_path / "missing.wav"), "base", None, 5, False, "cpu", "int8"
+            )
+
+
+class TestTranscriptStore:
+    """Tests for load_transcript and store_transcript."""
+
+    def test_round_trip(self, sample_segments: list[TranscriptSegment]) -> None:
+        """A stored transcript loads back equal to the original."""
+        store_transcript("key", sample_segments)
+
+        assert load_transcript("key") == sample_segments
+
+    def test_miss_returns_none(self) -> None:
+        """An unknown key is a cache miss."""
+        assert load_transcript("missing") is None
+
+    def test_corrupt_entry_is_a_miss(self, isolated_cache_home: Path) -> None:
+        """An unreadable entry is treated as a cache miss."""
+        cache_dir = isolated_cache_home / "ai-video-editor" / "transcripts"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "key.json").write_text("{not json", encoding="utf-8")
+
+        assert load_transcript("key") is None
+
+    def test_evicts_least_recently_used(
+        self,
+        isolated_cache_home: Path,
+        sample_segments: list[TranscriptSegment],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Once over budget, the least recently used entries are deleted."""
+        cache_dir = isolated_cache_home / "ai-video-editor" / "transcripts"
+        store_transcript("old", sample_segments)
+        store_transcript("used", sample_segments)
+        entry_size = (cache_dir / "old.json").stat().st_size
+        os.utime(cache_dir / "old.json", (1, 1))
+        os.utime(cache_dir / "used.json", (2, 2))
+        load_transcript("used")
+
+        monkeypatch.setattr(
+            "scripts.transcript_cache.CACHE_MAX_BYTES", 2 * entry_size
+        )
+        store_transcript("new", sample_segments)
+
+        assert sorted(p.name for p in cache_dir.iterdir()) == [
+            "new.json",
+            "used.json",
+        ]
+
+    def test_failed_store_leaves_no_temp_file(
+        self,
+        isolated_cache_home: Path,
+        sample_segments: list[TranscriptSegment],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A store that fails is ignored and leaves no temporary file."""
+
+        def fail_replace(src: str, dst: object) -> None:
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr("scripts.disk_cache.os.replace", fail_replace)
+
+        store_transcript("key", sample_segments)
+
+        cache_dir = isolated_cache_home / "ai-video-editor" / "transcripts"
+        assert list(cache_dir.iterdir()) == []
+
+    def test_disabled_by_env_var(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AIVE_TRANSCRIPT_CACHE=0 disables the cache."""
+        assert cache_enabled()
+
+        monkeypatch.setenv("AIVE_TRANSCRIPT_CACHE", "0")
+
+        assert not cache_enabled()
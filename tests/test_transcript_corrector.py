@@ -248,17 +248,19 @@ class TestCorrectTranscript:
         # Original segments should be unchanged
         assert sample_segments[0].text == "Hello, world!"
 
-    def test_returns_new_segment_objects(
+    def test_copies_only_corrected_segments(
         self, sample_segments: list[TranscriptSegment]
     ) -> None:
-        """Test that correct_transcript returns new TranscriptSegment objects."""
-        corrections: dict[int, str] = {}
+        """Test that only corrected segments are new TranscriptSegment objects."""
+        corrections = {1: "Modified"}
 
         result = correct_transcript(sample_segments, corrections)
 
-        # Even with no corrections, segments should be new objects
-        for i, segment in enumerate(result):
-            assert segment is not sample_segments[i]
+        # Corrected segments are new objects; the rest are reused as-is
+        assert result[1] is not sample_segments[1]
+        assert sample_segments[1].text == "This is a test."
+        assert result[0] is sample_segments[0]
+        assert result[2] is sample_segments[2]
 
     def test_invalid_index_raises_key_error(
         self, sample_segments: list[TranscriptSegment]
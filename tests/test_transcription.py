@@ -3,18 +3,31 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from scripts.audio_extractor import extract_audio
 from scripts.exceptions import TranscriptionError
-from scripts.transcription import TranscriptSegment, transcribe
+from scripts.transcription import (
+    TranscriptSegment,
+    clear_model_cache,
+    transcribe,
+    transcribe_many,
+)
 
 
 # Path to the test video file
 TEST_VIDEO_PATH = "/home/gudmundur/ai-youtube/input/test_video.mov"
 
 
+@pytest.fixture(autouse=True)
+def fresh_model_cache() -> None:
+    """Drop cached Whisper models so each test sees its own mock."""
+    clear_model_cache()
+
+
 class TestTranscriptSegmentDataclass:
     """Tests for the TranscriptSegment dataclass."""
 
@@ -40,6 +53,12 @@ class TestTranscriptSegmentDataclass:
 
         assert segment1 != segment2
 
+    def test_transcript_segment_has_no_instance_dict(self) -> None:
+        """TranscriptSegment uses __slots__ instead of a per-instance __dict__."""
+        segment = TranscriptSegment(start=0.0, end=1.0, text="Test")
+
+        assert not hasattr(segment, "__dict__")
+
 
 class TestTranscribeBasic:
     """Basic unit tests for the transcribe function."""
@@ -64,6 +83,195 @@ class TestTranscribeBasic:
         with pytest.raises(TranscriptionError):
             transcribe(str(invalid_audio))
 
+    def test_transcribe_accepts_sample_array(self) -> None:
+        """transcribe passes an in-memory sample array straight to Whisper."""
+        samples = np.zeros(16000, dtype=np.float32)
+        whisper_segment = MagicMock(start=0.0, end=1.0, text=" Hello ")
+
+        with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+            mock_model = mock_model_cls.return_value
+            mock_model.transcribe.return_value = (iter([whisper_segment]), None)
+
+            result = transcribe(samples)
+
+        assert mock_model.transcribe.call_args[0][0] is samples
+        assert result == [TranscriptSegment(start=0.0, end=1.0, text="Hello")]
+
+    def test_transcribe_forwards_decoding_options(self) -> None:
+        """transcribe defaults to beam search and forwards greedy/VAD settings."""
+        samples = np.zeros(16000, dtype=np.float32)
+
+        with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+            mock_transcribe = mock_model_cls.return_value.transcribe
+            mock_transcribe.side_effect = lambda *args, **kwargs: (iter([]), None)
+
+            transcribe(samples)
+            default_kwargs = mock_transcribe.call_args.kwargs
+            transcribe(samples, beam_size=1, vad_filter=True)
+            tuned_kwargs = mock_transcribe.call_args.kwargs
+
+        assert (default_kwargs["beam_size"], default_kwargs["vad_filter"]) == (5, False)
+        assert (tuned_kwargs["beam_size"], tuned_kwargs["vad_filter"]) == (1, True)
+
+    def test_transcribe_reuses_loaded_model(self) -> None:
+        """Repeated calls with the same model size load the model once."""
+        samples = np.zeros(16000, dtype=np.float32)
+
+        with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+            mock_transcribe = mock_model_cls.return_value.transcribe
+            mock_transcribe.side_effect = lambda *args, **kwargs: (iter([]), None)
+
+            transcribe(samples)
+            transcribe(samples)
+            assert mock_model_cls.call_count == 1
+
+            transcribe(samples, model_size="tiny")
+            clear_model_cache()
+            transcribe(samples)
+
+        assert mock_model_cls.call_count == 3
+
+
+
+class TestSelectDevice:
+    """Tests for Whisper device and compute type selection."""
+
+    def test_uses_cpu_int8_without_gpu(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without CUDA devices, Whisper runs int8 on the CPU."""
+        from scripts.transcription import _select_device
+
+        monkeypatch.delenv("WHISPER_DEVICE", raising=False)
+        monkeypatch.delenv("WHISPER_COMPUTE_TYPE", raising=False)
+
+        with patch(
+            "scripts.transcription.ctranslate2.get_cuda_device_count", return_value=0
+        ):
+            assert _select_device() == ("cpu", "int8")
+
+    def test_uses_cuda_float16_with_gpu(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a CUDA device, Whisper runs float16 on the GPU."""
+        from scripts.transcription import _select_device
+
+        monkeypatch.delenv("WHISPER_DEVICE", raising=False)
+        monkeypatch.delenv("WHISPER_COMPUTE_TYPE", raising=False)
+
+        with patch(
+            "scripts.transcription.ctranslate2.get_cuda_device_count", return_value=1
+        ):
+            assert _select_device() == ("cuda", "float16")
+
+    def test_env_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """WHISPER_DEVICE and WHISPER_COMPUTE_TYPE override detection."""
+        from scripts.transcription import _select_device
+
+        monkeypatch.setenv("WHISPER_DEVICE", "cpu")
+        monkeypatch.setenv("WHISPER_COMPUTE_TYPE", "float32")
+
+        with patch(
+            "scripts.transcription.ctranslate2.get_cuda_device_count", return_value=1
+        ):
+            assert _select_device() == ("cpu", "float32")
+
+    def test_model_is_loaded_on_selected_device(self) -> None:
+        """transcribe loads the model with the selected device settings."""
+        samples = np.zeros(16000, dtype=np.float32)
+
+        with patch(
+            "scripts.transcription._select_device", return_value=("cuda", "float16")
+        ):
+            with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+                mock_model_cls.return_value.transcribe.return_value = (iter([]), None)
+                transcribe(samples)
+
+        mock_model_cls.assert_called_once()
+        assert mock_model_cls.call_args.args == ("base",)
+        assert mock_model_cls.call_args.kwargs["device"] == "cuda"
+        assert mock_model_cls.call_args.kwargs["compute_type"] == "float16"
+
+    def test_cpu_threads_uses_available_cpus(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """CTranslate2 gets one thread per available CPU unless overridden."""
+        from scripts.transcription import _cpu_threads
+
+        monkeypatch.delenv("WHISPER_CPU_THREADS", raising=False)
+        monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+        if hasattr(os, "sched_getaffinity"):
+            assert _cpu_threads() == len(os.sched_getaffinity(0))
+        else:
+            assert _cpu_threads() == os.cpu_count()
+
+        monkeypatch.setenv("OMP_NUM_THREADS", "2")
+        assert _cpu_threads() == 0
+
+        monkeypatch.setenv("WHISPER_CPU_THREADS", "3")
+        assert _cpu_threads() == 3
+
+
+class TestTranscribeMany:
+    """Unit tests for the batched transcribe_many function."""
+
+    def test_transcribes_each_input_in_order(self) -> None:
+        """transcribe_many returns one segment list per input via one pipeline."""
+        first = np.zeros(16000, dtype=np.float32)
+        second = np.ones(16000, dtype=np.float32)
+        outputs = {
+            id(first): [MagicMock(start=0.0, end=1.0, text=" One ")],
+            id(second): [
+                MagicMock(start=0.0, end=0.5, text=" Two"),
+                MagicMock(start=0.5, end=1.0, text="Three "),
+            ],
+        }
+
+        with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+            with patch(
+                "scripts.transcription.BatchedInferencePipeline"
+            ) as mock_pipeline_cls:
+                mock_pipeline = mock_pipeline_cls.return_value
+                mock_pipeline.transcribe.side_effect = lambda audio, **kwargs: (
+                    iter(outputs[id(audio)]),
+                    None,
+                )
+
+                result = transcribe_many([first, second], batch_size=4)
+
+        mock_model_cls.assert_called_once()
+        mock_pipeline_cls.assert_called_once_with(model=mock_model_cls.return_value)
+        assert mock_pipeline.transcribe.call_args.kwargs["batch_size"] == 4
+        assert result == [
+            [TranscriptSegment(start=0.0, end=1.0, text="One")],
+            [
+                TranscriptSegment(start=0.0, end=0.5, text="Two"),
+                TranscriptSegment(start=0.5, end=1.0, text="Three"),
+            ],
+        ]
+
+    def test_missing_file_raises_before_loading_model(self, tmp_path: Path) -> None:
+        """transcribe_many checks every path before doing any work."""
+        existing = tmp_path / "a.wav"
+        existing.write_bytes(b"audio")
+
+        with patch("scripts.transcription.WhisperModel") as mock_model_cls:
+            with pytest.raises(FileNotFoundError, match="missing.wav"):
+                transcribe_many([str(existing), str(tmp_path / "missing.wav")])
+
+        mock_model_cls.assert_not_called()
+
+    def test_failure_raises_transcription_error(self) -> None:
+        """transcribe_many wraps pipeline errors in TranscriptionError."""
+        samples = np.zeros(16000, dtype=np.float32)
+
+        with patch("scripts.transcription.WhisperModel"):
+            with patch(
+                "scripts.transcription.BatchedInferencePipeline"
+            ) as mock_pipeline_cls:
+                mock_pipeline_cls.return_value.transcribe.side_effect = RuntimeError(
+                    "decode failed"
+                )
+
+                with pytest.raises(TranscriptionError, match="decode failed"):
+                    transcribe_many([samples])
+
 
 @pytest.mark.slow
 class TestTranscribeIntegration:
@@ -3,6 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
+from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,10 +13,14 @@ from scripts.exceptions import EDLValidationError, VideoCuttingError
 from scripts.video_cutter import (
     _build_concat_list,
     _build_ffmpeg_filter,
+    _check_ffmpeg_available,
     _cut_segment_to_file,
+    _cut_segments_to_files,
+    _run_ffmpeg,
     _should_use_concat_demuxer,
     _validate_edl_for_cutting,
     cut_video,
+    cut_videos,
     get_video_duration,
     CONCAT_DEMUXER_THRESHOLD,
 )
@@ -196,6 +201,24 @@ class TestCutSegmentToFile:
         assert "/input/video.mp4" in cmd
         assert cmd[-1] == "/output/seg.mp4"
 
+    @patch("scripts.video_cutter.subprocess.run")
+    def test_cut_segment_duration_is_rounded(self, mock_run: MagicMock) -> None:
+        """The -t duration carries no float subtraction noise."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        segment = EditSegment(
+            start=10.1,
+            end=15.3,
+            action=EditAction.KEEP,
+            reason="Test",
+            transcript_indices=[0],
+        )
+
+        _cut_segment_to_file("/input/video.mp4", segment, "/output/seg.mp4")
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-t") + 1] == "5.2"
+
     @patch("scripts.video_cutter.subprocess.run")
     def test_cut_segment_failure_raises(self, mock_run: MagicMock) -> None:
         """Segment cutting failure should raise VideoCuttingError."""
@@ -215,6 +238,41 @@ class TestCutSegmentToFile:
         with pytest.raises(VideoCuttingError, match="[Ff]ailed|segment"):
             _cut_segment_to_file("/input/video.mp4", segment, "/output/seg.mp4")
 
+    @patch("scripts.video_cutter.subprocess.run")
+    def test_cut_segments_in_one_process(self, mock_run: MagicMock) -> None:
+        """Several segments are cut by one FFmpeg process, one output each."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        segments = [
+            EditSegment(
+                start=float(start),
+                end=float(start + 2),
+                action=EditAction.KEEP,
+                reason="Test",
+                transcript_indices=[0],
+            )
+            for start in (0, 10, 20)
+        ]
+        outputs = ["/output/seg_0.mp4", "/output/seg_1.mp4", "/output/seg_2.mp4"]
+
+        _cut_segments_to_files("/input/video.mp4", segments, outputs)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+
+        # Each segment is its own input-seeked copy of the video
+        seeks = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-ss"]
+        assert seeks == ["0.0", "10.0", "20.0"]
+        assert cmd.count("/input/video.mp4") == 3
+        assert max(i for i, arg in enumerate(cmd) if arg == "-i") < cmd.index("-map")
+
+        # Each output maps its own input and copies the segment duration
+        for i, output in enumerate(outputs):
+            out_idx = cmd.index(output)
+            assert cmd[out_idx - 6 : out_idx] == [
+                "-map", f"{i}:a:0?", "-t", "2.0", "-c", "copy",
+            ]
+
 
 class TestBuildFfmpegFilter:
     """Tests for _build_ffmpeg_filter function."""
@@ -440,6 +498,59 @@ class TestGetVideoDuration:
                 get_video_duration("/path/to/video.mp4")
 
 
+class TestRunFfmpeg:
+    """Tests for _run_ffmpeg."""
+
+    def test_failure_carries_log_tail(self) -> None:
+        """A failed command raises with only the tail of its stderr."""
+        import subprocess
+        import sys
+
+        script = (
+            "import sys; sys.stderr.write('x' * 200000 + 'real error'); sys.exit(1)"
+        )
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            _run_ffmpeg([sys.executable, "-c", script])
+
+        stderr = exc_info.value.stderr
+        assert stderr.endswith(b"real error")
+        assert len(stderr) == 64 * 1024
+
+    def test_success_returns_none(self) -> None:
+        """A successful command returns without reading its log."""
+        import sys
+
+        assert _run_ffmpeg([sys.executable, "-c", "print('ok')"]) is None
+
+
+class TestCheckFfmpegAvailable:
+    """Tests for the memoized ffmpeg availability check."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Generator[None, None, None]:
+        """Reset the memoized check around each test."""
+        _check_ffmpeg_available.cache_clear()
+        yield
+        _check_ffmpeg_available.cache_clear()
+
+    def test_missing_ffmpeg_raises_error(self) -> None:
+        """_check_ffmpeg_available raises VideoCuttingError when not on PATH."""
+        with patch("scripts.video_cutter.shutil.which", return_value=None):
+            with pytest.raises(VideoCuttingError, match="not installed"):
+                _check_ffmpeg_available()
+
+    def test_check_is_memoized(self) -> None:
+        """_check_ffmpeg_available only scans PATH once when ffmpeg is found."""
+        with patch(
+            "scripts.video_cutter.shutil.which", return_value="/usr/bin/ffmpeg"
+        ) as mock_which:
+            _check_ffmpeg_available()
+            _check_ffmpeg_available()
+
+        assert mock_which.call_count == 1
+
+
 class TestCutVideo:
     """Tests for cut_video function."""
 
@@ -450,10 +561,42 @@ class TestCutVideo:
 
     def test_cut_video_invalid_edl_raises(self, no_keep_edl: EditDecisionList) -> None:
         """cut_video raises EDLValidationError for invalid EDL."""
-        with patch("os.path.exists", return_value=True):
+        with patch("os.path.isfile", return_value=True):
             with pytest.raises(EDLValidationError):
                 cut_video("/path/to/video.mp4", no_keep_edl)
 
+    def test_cut_video_directory_raises(
+        self, simple_edl: EditDecisionList, tmp_path: Path
+    ) -> None:
+        """cut_video rejects a directory as the input video."""
+        with pytest.raises(FileNotFoundError):
+            cut_video(str(tmp_path), simple_edl)
+
+    @patch("scripts.video_cutter.subprocess.run")
+    @patch("scripts.video_cutter._check_ffmpeg_available")
+    def test_cut_video_orders_segments_by_start(
+        self,
+        mock_check_ffmpeg: MagicMock,
+        mock_subprocess_run: MagicMock,
+        keep_segment_0_5: EditSegment,
+        keep_segment_10_15: EditSegment,
+        tmp_path: Path,
+    ) -> None:
+        """KEEP segments listed out of order are cut in time order."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+        edl = EditDecisionList(
+            source_video=str(video_path),
+            segments=[keep_segment_10_15, keep_segment_0_5],
+            total_duration=15.0,
+        )
+
+        cut_video(str(video_path), edl, str(tmp_path / "output.mp4"))
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert filter_str.startswith("[0:v]trim=start=0.0:end=5.0")
+
     @patch("scripts.video_cutter.subprocess.run")
     @patch("scripts.video_cutter._check_ffmpeg_available")
     def test_cut_video_creates_output_file(
@@ -565,11 +708,13 @@ class TestCutVideo:
         cut_video(str(video_path), many_segments_edl, str(output_path))
 
         # For concat demuxer, we expect multiple subprocess calls:
-        # - One per segment for cutting
+        # - Cutting commands, batching segments, with one output per segment
         # - One for final concatenation
-        total_calls = mock_subprocess_run.call_count
-        expected_calls = len(many_segments_edl.keep_segments) + 1  # segments + concat
-        assert total_calls == expected_calls
+        cut_cmds = [call[0][0] for call in mock_subprocess_run.call_args_list[:-1]]
+        assert 1 <= len(cut_cmds) <= len(many_segments_edl.keep_segments)
+        assert sum(cmd.count("-ss") for cmd in cut_cmds) == len(
+            many_segments_edl.keep_segments
+        )
 
         # The last call should be the concat demuxer command
         last_call = mock_subprocess_run.call_args_list[-1]
@@ -603,6 +748,93 @@ class TestCutVideo:
         with pytest.raises(VideoCuttingError, match="[Ff]ailed|error"):
             cut_video(str(video_path), simple_edl, str(tmp_path / "output.mp4"))
 
+    @patch("scripts.video_cutter.subprocess.run")
+    @patch("scripts.video_cutter._check_ffmpeg_available")
+    def test_cut_video_concat_demuxer_keeps_segment_order(
+        self,
+        mock_check_ffmpeg: MagicMock,
+        mock_subprocess_run: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Segments cut in parallel are concatenated in EDL order."""
+        import time
+
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+        count = CONCAT_DEMUXER_THRESHOLD + 3
+        edl = EditDecisionList(
+            source_video=str(video_path),
+            segments=[
+                EditSegment(
+                    start=float(i * 2),
+                    end=float(i * 2 + 1),
+                    action=EditAction.KEEP,
+                    reason=f"Segment {i}",
+                    transcript_indices=[i],
+                )
+                for i in range(count)
+            ],
+            total_duration=100.0,
+        )
+
+        def slow_early_segments(cmd: list[str], **kwargs: object) -> MagicMock:
+            # Later segments finish first
+            if "-ss" in cmd:
+                start = float(cmd[cmd.index("-ss") + 1])
+                time.sleep(0.002 * (count * 2 - start))
+            return MagicMock(returncode=0)
+
+        mock_subprocess_run.side_effect = slow_early_segments
+
+        with patch(
+            "scripts.video_cutter._build_concat_list", wraps=_build_concat_list
+        ) as mock_concat_list:
+            cut_video(str(video_path), edl, str(tmp_path / "output.mp4"))
+
+        segment_files = mock_concat_list.call_args[0][0]
+        assert [os.path.basename(p) for p in segment_files] == [
+            f"segment_{i}.mp4" for i in range(count)
+        ]
+        cut_outputs = [
+            cmd[i + 2]
+            for cmd in (call[0][0] for call in mock_subprocess_run.call_args_list)
+            if "-ss" in cmd
+            for i, arg in enumerate(cmd)
+            if arg == "-c"
+        ]
+        assert sorted(cut_outputs) == sorted(segment_files)
+
+
+class TestCutVideos:
+    """Tests for cut_videos function."""
+
+    def test_cuts_each_job_in_order(self, simple_edl: EditDecisionList) -> None:
+        """cut_videos runs cut_video per job and keeps the job order."""
+        jobs = [(f"/videos/{i}.mp4", simple_edl, f"/out/{i}.mp4") for i in range(5)]
+
+        with patch(
+            "scripts.video_cutter.cut_video", side_effect=lambda v, e, o: o
+        ) as mock_cut:
+            result = cut_videos(jobs, max_workers=3)
+
+        assert result == [f"/out/{i}.mp4" for i in range(5)]
+        assert sorted(call[0] for call in mock_cut.call_args_list) == sorted(jobs)
+
+    def test_failure_propagates(self, simple_edl: EditDecisionList) -> None:
+        """An error cutting one video is raised from cut_videos."""
+        jobs = [("/videos/a.mp4", simple_edl, None), ("/videos/b.mp4", simple_edl, None)]
+
+        with patch(
+            "scripts.video_cutter.cut_video",
+            side_effect=VideoCuttingError("ffmpeg failed"),
+        ):
+            with pytest.raises(VideoCuttingError, match="ffmpeg failed"):
+                cut_videos(jobs)
+
+    def test_no_jobs(self) -> None:
+        """cut_videos with no jobs returns an empty list."""
+        assert cut_videos([]) == []
+
 
 # Path to test video for integration tests
 TEST_VIDEO_PATH = "/home/gudmundur/ai-youtube/input/test_video.mov"